@@ -31,5 +31,6 @@ from .constants import (
     ACTION_FOLD,
     ACTION_RAISE,
 )
-from .engines import BettingRound, showdown, reset_cycle_states
-from .structures import Action, Card, Hand, Player, Table
\ No newline at end of file
+from .engines import BettingRound, HandCycle, enumerate_equity, estimate_equity, showdown, reset_cycle_states
+from .logger import configure_logging, set_silent
+from .structures import Action, Card, CardSet, Hand, Player, Table, best_hand
\ No newline at end of file
@@ -5,4 +5,6 @@ Namespace for constants used in other sections.
 
 from ._action_constants import *
 from ._card_constants import *
-from ._logging_constants import *
\ No newline at end of file
+from ._cycle_constants import *
+from ._logging_constants import *
+from ._server_constants import *
\ No newline at end of file
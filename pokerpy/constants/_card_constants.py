@@ -38,6 +38,11 @@ unicode_code_point_by_card_suit = {
 full_sorted_values_and_suits: tuple[tuple[str, str], ...] = tuple((value, suit) for value in sorted_card_values for suit in sorted_card_suits)
 
 
+# Board
+
+FULL_BOARD_SIZE = 5
+
+
 # Hands
 
 sorted_hand_categories: tuple[str] = (
@@ -0,0 +1,22 @@
+"""
+Defines the constants regarding to the hand cycle.
+"""
+
+
+# Streets
+sorted_street_names: tuple[str] = (
+    (PREFLOP := 'preflop'),
+    (FLOP := 'flop'),
+    (TURN := 'turn'),
+    (RIVER := 'river'),
+)
+
+common_cards_count_by_street = {
+    PREFLOP: 0,
+    FLOP: 3,
+    TURN: 1,
+    RIVER: 1,
+}
+
+# Cards
+HOLE_CARDS_COUNT = 2
@@ -0,0 +1,27 @@
+"""
+Defines the constants regarding to the game server.
+"""
+
+
+# Connections
+DEFAULT_SERVER_HOST = '127.0.0.1'
+DEFAULT_SERVER_PORT = 8765
+MAX_MESSAGE_SIZE = 4096 # bytes per line, longer lines close the connection
+OUTGOING_QUEUE_SIZE = 256 # messages waiting to be written, a fuller queue closes the connection
+
+# Messages from clients
+client_message_types = [
+    MESSAGE_JOIN := 'join',
+    MESSAGE_ACTION := 'action',
+]
+
+# Messages from the server
+server_message_types = [
+    MESSAGE_SEATED := 'seated',
+    MESSAGE_HAND := 'hand',
+    MESSAGE_STREET := 'street',
+    MESSAGE_TURN := 'turn',
+    MESSAGE_PLAYED := 'played',
+    MESSAGE_RESULT := 'result',
+    MESSAGE_ERROR := 'error',
+]
@@ -5,10 +5,21 @@ Namespace for engine classes.
 
 from ._betting_round._betting_round import BettingRound
 from ._betting_round._run_listener import run_listener
-from ._betting_round._prompt_player import prompt_player
+from ._betting_round._prompt_player import closing_signals, prompt_player, run_turn
 from ._betting_round._await_player import await_player
 from ._betting_round._get_valid_actions import get_valid_actions
 from ._betting_round._set_action_effects import set_action_effects
+from ._betting_round._valid_actions import ValidActions
+from ._betting_round._wait_action import wait_action
+
+from ._equity._build_preflop_equity_table import build_preflop_equity_table
+from ._equity._enumerate_equity import enumerate_equity
+from ._equity._equity_result import EquityResult
+from ._equity._estimate_equity import estimate_equity
+from ._equity._preflop_equity_table import PreflopEquityTable
+from ._equity._starting_hand_classes import get_starting_hand_class, starting_hand_classes
+
+from ._hand_cycle._hand_cycle import HandCycle
 
 from ._reset_cycle_states import reset_cycle_states
 from ._showdown import showdown
\ No newline at end of file
@@ -58,7 +58,7 @@ def await_player(
         if action is None:
             continue
 
-        amount_range_by_action = get_valid_actions(
+        valid_actions = get_valid_actions(
             player_stack = player.stack,
             player_current_amount = player.current_amount,
             player_has_played = player.has_played,
@@ -69,11 +69,10 @@ def await_player(
             full_raise_increase = full_raise_increase,
             open_fold_allowed = open_fold_allowed,
         )
-        amount_range = amount_range_by_action.get(action.name)
-        if amount_range is not None and action.amount in amount_range:
+        if valid_actions.is_valid(action.name, action.amount):
             break
 
-        logger.debug(f'--- invalid action: {action.name}s {action.amount}')
+        logger.debug('--- invalid action: %ss %s', action.name, action.amount)
         if not ignore_invalid_actions:
             raise RuntimeError(msg_forbidden_action)
 
@@ -18,7 +18,7 @@ Defines the class that represents a betting round context manager.
 """
 
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 
 from pokerpy.logger import get_logger
@@ -28,14 +28,18 @@ from pokerpy.messages import (
     msg_betting_round_was_not_completed,
     msg_not_player_instance,
     msg_overloaded_betting_round_message,
+    msg_player_is_not_current_player,
     msg_player_not_in_table,
 )
-from pokerpy.structures import Player, Table
+from pokerpy.structures import Action, Player, Table
 
 
 from ._get_valid_actions import get_valid_actions
+from ._methods_to_apply_actions import method_apply_action, method_start
 from ._methods_to_deal_cards import method_deal_cards_to_players, method_deal_common_cards
 from ._run_listener import run_listener
+from ._valid_actions import ValidActions
+from ._wait_action import await_requested_action, validate_timeout, wait_action
 
 
 logger = get_logger()
@@ -84,6 +88,8 @@ class BettingRound:
         self._lap_counts = 0
         self._is_completed = False
         self._current_player: Player|None = None
+        self._valid_actions: (ValidActions|None) = None
+        self._is_started = False
 
         if smallest_bet_amount is not None:
             table.set_full_bet(smallest_bet_amount)
@@ -150,9 +156,9 @@ class BettingRound:
 
         "Runs the last step in the betting round."
 
-        # End running iteration after last yield
+        # End running iteration after last yield (rounds driven by apply_action have no listener)
         try:
-            if not self.is_completed:
+            if not self.is_completed and not self._is_started:
                 next(self.listen())
         except StopIteration:
             self._is_completed = True
@@ -169,6 +175,57 @@ class BettingRound:
             raise RuntimeError(msg_betting_round_was_not_completed)
 
 
+    # Methods to apply actions without the listener
+
+
+    def start(self):
+        "Prepares the table and retrieves the first player to act (or None if nobody can act)."
+        return method_start(self)
+
+
+    def apply_action(self, action: Action):
+        "Applies the action of the current player and retrieves the next player to act (or None if completed)."
+        return method_apply_action(self, action)
+
+
+    # Methods to await actions in an event loop
+
+
+    async def wait_action(self, player: Player, *, timeout: (float|None) = None):
+
+        """
+        Waits until the current player requests an action and retrieves it, without applying it. If
+        the time runs out, the player checks when possible and folds otherwise.
+        """
+
+        if player != self.current_player:
+            name = player.name if isinstance(player, Player) else player
+            raise ValueError(msg_player_is_not_current_player.format(name))
+        return await wait_action(player, self.get_action_ranges(), timeout=timeout)
+
+
+    async def alisten(self, *, timeout: (float|None) = None) -> AsyncGenerator[Player]:
+
+        """
+        Starts the betting round and retrieves an asynchronous generator that yields the players to
+        act, awaiting and applying the action each of them requests, so a single event loop can host
+        many betting rounds whose players act remotely. The timeout is given again to every turn,
+        and it counts from the moment its player is yielded.
+        """
+
+        import asyncio
+
+        validate_timeout(timeout)
+        loop = asyncio.get_running_loop()
+
+        player = self.start()
+        while player is not None:
+            turn_started_at = loop.time()
+            yield player
+            turn_timeout = None if timeout is None else timeout - (loop.time() - turn_started_at)
+            player = self.apply_action(await await_requested_action(player, self.get_action_ranges(), turn_timeout))
+
+
     # Methods to deal cards
 
     
@@ -189,13 +246,16 @@ class BettingRound:
         "Sets a player as the current player."
         if not isinstance(player, Player):
             raise TypeError(msg_not_player_instance.format(type(player).__name__))
-        if player not in self.table.players:
+        if not self.table.has_player(player):
             raise ValueError(msg_player_not_in_table.format(player.name))
         self._current_player = player
 
 
     def get_action_ranges(self):
-        "Retrieves the current player and its available actions"
+        """
+        Retrieves the available actions of the current player, mapped to their ranges of amounts. The
+        result is shared with the validation of the action the player requests.
+        """
         return get_valid_actions(
             player_stack = self.current_player.stack,
             player_current_amount = self.current_player.current_amount,
@@ -204,10 +264,7 @@ class BettingRound:
             complete_current_level = self.table.complete_current_level,
             full_bet = self.table.full_bet,
             full_raise_increase = self.table.full_raise_increase,
-            is_last_active_player = (
-                self.current_player in self.table.active_players
-                and len(self.table.active_players) == 1
-            ),
+            is_last_active_player = self.table.is_last_active_player(self.current_player),
             open_fold_allowed = self.open_fold_allowed,
         )
 
@@ -225,10 +282,7 @@ class BettingRound:
         if not isinstance(table, Table):
             raise TypeError(msg_not_table_instance.format(type(table).__name__))
 
-        table.set_full_raise_increase(table.full_bet)
-        table.set_current_level(0)
-        table.set_complete_current_level(0)
-        table.set_stopping_player(table.get_previous_player(table.starting_player))
+        table.reset_levels()
 
         for player in table.players:
             player.unmark_has_played()
@@ -18,6 +18,9 @@ Defines the function that retrieves the valid actions according to the betting r
 """
 
 
+from functools import lru_cache
+
+
 from pokerpy.constants import (
     ACTION_BET,
     ACTION_CALL,
@@ -27,6 +30,9 @@ from pokerpy.constants import (
 )
 
 
+from ._valid_actions import ValidActions
+
+
 def get_valid_actions(
     *,
     player_stack: int,
@@ -41,7 +47,40 @@ def get_valid_actions(
 ):
 
     """
-    Retrieves the valid actions according to the betting round current status.
+    Retrieves the valid actions according to the betting round current status. The result only
+    depends on the inputs, so it is cached and the same instance is retrieved for the same decision
+    point.
+    """
+
+    return compute_valid_actions(
+        player_stack,
+        player_current_amount,
+        current_level,
+        complete_current_level,
+        full_bet,
+        full_raise_increase,
+        bool(player_has_played),
+        bool(is_last_active_player),
+        bool(open_fold_allowed),
+    )
+
+
+@lru_cache(maxsize=4096)
+def compute_valid_actions(
+    player_stack: int,
+    player_current_amount: int,
+    current_level: int,
+    complete_current_level: int,
+    full_bet: int,
+    full_raise_increase: int,
+    player_has_played: bool,
+    is_last_active_player: bool,
+    open_fold_allowed: bool
+):
+
+    """
+    Computes the valid actions according to the betting round current status, as the smallest and
+    the largest amounts of every action.
     """
 
     assert player_stack >= 0
@@ -58,60 +97,38 @@ def get_valid_actions(
     amount_to_full_level = complete_current_level - player_current_amount
     amount_to_full_raise = amount_to_full_level + full_raise_increase
 
-    def get_fold_range():
-        return range(0, 1)
-
-    def get_check_range():
-        return range(0, 1)
-    
-    def get_call_range():
-        if player_stack > amount_to_call:
-            return range(amount_to_call, amount_to_call + 1)
-        return range(player_stack, player_stack + 1)
-
-    def get_bet_range():
-        if player_stack > full_bet:
-            return range(full_bet, player_stack + 1)
-        elif player_stack > amount_to_call:
-            return range(player_stack, player_stack + 1)
-
-    def get_raise_range():
-        if player_stack > amount_to_full_raise:
-            return range(amount_to_full_raise, player_stack + 1)
-        elif player_stack > amount_to_call:
-            return range(player_stack, player_stack + 1)
-
-    amount_range_by_action: dict[str, range|None] = {}
+    bounds_by_action: dict[str, tuple[int, int]] = {}
 
     # passive actions
     if amount_to_call > 0:
-        amount_range_by_action[ACTION_CALL] = get_call_range()
-        amount_range_by_action[ACTION_FOLD] = get_fold_range()
+        call_amount = min(amount_to_call, player_stack)
+        bounds_by_action[ACTION_CALL] = (call_amount, call_amount)
+        bounds_by_action[ACTION_FOLD] = (0, 0)
     else:
-        amount_range_by_action[ACTION_CHECK] = get_check_range()
+        bounds_by_action[ACTION_CHECK] = (0, 0)
         if open_fold_allowed:
-            amount_range_by_action[ACTION_FOLD] = get_fold_range()
+            bounds_by_action[ACTION_FOLD] = (0, 0)
 
     # there may not be anyone to respond a bet/raise
     if is_last_active_player:
-        return amount_range_by_action
+        return ValidActions(bounds_by_action)
 
     # the player stack may be enough only to call
     if player_stack <= amount_to_call:
-        return amount_range_by_action
+        return ValidActions(bounds_by_action)
 
     # a player who has not played yet and has enough chips, always can take an aggressive action
     if not player_has_played:
         if amount_to_full_level == 0:
-            amount_range_by_action[ACTION_BET] = get_bet_range()
+            bounds_by_action[ACTION_BET] = (min(full_bet, player_stack), player_stack)
         else:
-            amount_range_by_action[ACTION_RAISE] = get_raise_range()
-        return amount_range_by_action
+            bounds_by_action[ACTION_RAISE] = (min(amount_to_full_raise, player_stack), player_stack)
+        return ValidActions(bounds_by_action)
 
     # a player who has already played and is not facing a full bet/raise, cannot take an aggressive action
     if amount_to_full_level == 0:
-        return amount_range_by_action
+        return ValidActions(bounds_by_action)
 
     # in any other case, it counts as a raise
-    amount_range_by_action[ACTION_RAISE] = get_raise_range()
-    return amount_range_by_action
\ No newline at end of file
+    bounds_by_action[ACTION_RAISE] = (min(amount_to_full_raise, player_stack), player_stack)
+    return ValidActions(bounds_by_action)
@@ -0,0 +1,90 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the methods that drive the betting round one action at a time, without generators.
+"""
+
+
+from typing import TYPE_CHECKING
+
+
+from pokerpy.logger import get_logger
+from pokerpy.messages import (
+    msg_betting_round_is_completed,
+    msg_betting_round_was_not_started,
+    msg_not_action_instance,
+)
+from pokerpy.structures import Action
+
+
+from ._run_street import apply_street_action, seek_player_to_act
+if TYPE_CHECKING:
+    from ._betting_round import BettingRound
+
+
+logger = get_logger()
+
+
+def method_start(self: "BettingRound"):
+
+    """
+    Prepares the table for the betting round and retrieves the first player to act (or None if
+    nobody can act).
+    """
+
+    self.reset_betting_round_states(self.table)
+    self._is_started = True
+
+    # Do not even iterate if there is only one non-folded player who still has a stack to bet
+    if self.table.active_players_count > 1:
+        if (player := seek_player_to_act(self, self.table.starting_player)) is not None:
+            return player
+    return complete_betting_round(self)
+
+
+def method_apply_action(self: "BettingRound", action: Action):
+
+    """
+    Applies the action of the current player and retrieves the next player to act (or None if the
+    betting round is completed). Invalid actions are either ignored, keeping the same player to act,
+    or rejected with an error.
+    """
+
+    if not isinstance(action, Action):
+        raise TypeError(msg_not_action_instance.format(type(action).__name__))
+    if not self._is_started:
+        raise RuntimeError(msg_betting_round_was_not_started)
+    if self.is_completed:
+        raise RuntimeError(msg_betting_round_is_completed)
+
+    if (player := apply_street_action(self, action)) is not None:
+        return player
+    return complete_betting_round(self)
+
+
+def complete_betting_round(self: "BettingRound"):
+
+    """
+    Moves the chips to the center of the table and resets the states for the next betting round.
+    """
+
+    logger.info('Number of laps: %s', self.lap_counts)
+
+    self.table.collect_bets()
+
+    self._valid_actions = None
+    self._is_completed = True
+    self.reset_betting_round_states(self.table)
@@ -18,7 +18,7 @@ Defines the methods that deal cards.
 """
 
 
-import secrets
+from logging import INFO
 from typing import TYPE_CHECKING
 
 
@@ -44,10 +44,9 @@ def method_deal_cards_to_players(self: "BettingRound", cards_count: int):
 
     for _ in range(cards_count):
         for player in self.table.players_in_hand:
-            card = secrets.choice(self.table.deck)
-            self.table.remove_card_from_deck(card)
+            card = self.table.deal_card()
             player.assign_card(card)
-            logger.info(f'Dealer deals card {card} to {player.name}.')
+            logger.info('Dealer deals card %s to %s.', card, player.name)
 
 
 def method_deal_common_cards(self: "BettingRound", cards_count: int):
@@ -60,8 +59,7 @@ def method_deal_common_cards(self: "BettingRound", cards_count: int):
         raise TypeError(msg_not_int.format(type(cards_count).__name__))
 
     for _ in range(cards_count):
-        card = secrets.choice(self.table.deck)
-        self.table.remove_card_from_deck(card)
-        self.table.assign_common_card(card)
+        self.table.assign_common_card(self.table.deal_card())
     
-    logger.info(f'Dealer deals common cards: {"".join(str(card) for card in self.table.common_cards[-cards_count:])}.')
\ No newline at end of file
+    if logger.isEnabledFor(INFO):
+        logger.info('Dealer deals common cards: %s.', ''.join(str(card) for card in self.table.common_cards[-cards_count:]))
\ No newline at end of file
@@ -14,7 +14,7 @@
 
 
 """
-Defines the function that evaluates if the current player is able to request an action and listens to it.
+Defines the functions that evaluate if the current player is able to request an action and listen to it.
 """
 
 
@@ -34,33 +34,57 @@ from ._await_player import await_player
 from ._set_action_effects import set_action_effects
 
 
-def prompt_player(
-        *,
-        table: Table,
-        current_player: Player,
-        open_fold_allowed: bool,
-        ignore_invalid_actions: bool
-    ):
+closing_signals = frozenset({
+    signal_all_in_stopping_player,
+    signal_folded_stopping_player,
+    signal_last_player_in_hand,
+    signal_passive_stopping_player,
+})
+
+
+def get_skipping_signal(table: Table, current_player: Player):
 
     """
-    Evaluates if the current player is able to request an action and listens to it.
+    Retrieves the signal that explains why the current player cannot request an action (or None if
+    the player can request one).
     """
 
     # Close the betting round if every player is folded or all-in
-    if len(table.players_in_hand) == 1:
-        raise CloseBettingRoundSignal(signal_last_player_in_hand)
+    if table.players_in_hand_count == 1:
+        return signal_last_player_in_hand
 
     # If the player is folded, jump to the next one (or close the betting round if is also the stopping player)
     if current_player.is_folded:
         if current_player != table.stopping_player:
-            raise JumpToNextPlayerSignal(signal_folded_player)
-        raise CloseBettingRoundSignal(signal_folded_stopping_player)
+            return signal_folded_player
+        return signal_folded_stopping_player
 
     # If the player is folded or all-in, jump to the next one (or close the betting round if is also the stopping player)
     if current_player.stack == 0:
         if current_player != table.stopping_player:
-            raise JumpToNextPlayerSignal(signal_all_in_player)
-        raise CloseBettingRoundSignal(signal_all_in_stopping_player)
+            return signal_all_in_player
+        return signal_all_in_stopping_player
+
+    return None
+
+
+def run_turn(
+        *,
+        table: Table,
+        current_player: Player,
+        open_fold_allowed: bool,
+        ignore_invalid_actions: bool
+    ):
+
+    """
+    Evaluates if the current player is able to request an action and listens to it. Instead of
+    raising signal exceptions, it returns the signal (or None if the next player must be prompted
+    after the action), which is cheaper for the loop that rotates the turns.
+    """
+
+    signal = get_skipping_signal(table, current_player)
+    if signal is not None:
+        return signal
 
     # Listen to player until it chooses a valid action
     action = yield from await_player(
@@ -69,7 +93,7 @@ def prompt_player(
         complete_current_level = table.complete_current_level,
         full_bet = table.full_bet,
         full_raise_increase = table.full_raise_increase,
-        is_last_active_player = (current_player in table.active_players and len(table.active_players) == 1),
+        is_last_active_player = table.is_last_active_player(current_player),
         open_fold_allowed = open_fold_allowed,
         ignore_invalid_actions = ignore_invalid_actions,
     )
@@ -77,4 +101,31 @@ def prompt_player(
 
     # Stop if the current player still is the stopping player
     if current_player == table.stopping_player:
-        raise CloseBettingRoundSignal(signal_passive_stopping_player)
\ No newline at end of file
+        return signal_passive_stopping_player
+
+    return None
+
+
+def prompt_player(
+        *,
+        table: Table,
+        current_player: Player,
+        open_fold_allowed: bool,
+        ignore_invalid_actions: bool
+    ):
+
+    """
+    Evaluates if the current player is able to request an action and listens to it.
+    """
+
+    signal = yield from run_turn(
+        table = table,
+        current_player = current_player,
+        open_fold_allowed = open_fold_allowed,
+        ignore_invalid_actions = ignore_invalid_actions,
+    )
+
+    if signal in closing_signals:
+        raise CloseBettingRoundSignal(signal)
+    if signal is not None:
+        raise JumpToNextPlayerSignal(signal)
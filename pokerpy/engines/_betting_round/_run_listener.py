@@ -18,15 +18,13 @@ Defines the function that starts the betting round generator that rotates the pl
 """
 
 
-from itertools import cycle
 from typing import TYPE_CHECKING
 
 
-from pokerpy.exceptions import CloseBettingRoundSignal, JumpToNextPlayerSignal
 from pokerpy.logger import get_logger
 
 
-from ._prompt_player import prompt_player
+from ._prompt_player import closing_signals, run_turn
 if TYPE_CHECKING:
     from ._betting_round import BettingRound
 
@@ -41,27 +39,25 @@ def run_listener(betting_round: "BettingRound"):
     """
 
     # Do not even iterate if there is only one non-folded player who still has a stack to bet
-    if len([player for player in betting_round.table.players_in_hand if player.stack > 0]) > 1:
+    if betting_round.table.active_players_count > 1:
 
-        # All players are itered, prompt_player decides if plays or not
-        for player in cycle(betting_round.table.iter_players()):
+        # All players are itered following the seats, run_turn decides if plays or not
+        player = betting_round.table.starting_player
+        while True:
             betting_round.set_current_player(player)
             if player == betting_round.table.starting_player:
                 betting_round.increase_counter()
-            try:
-                yield from prompt_player(
-                    table = betting_round.table,
-                    current_player = player,
-                    open_fold_allowed = betting_round.open_fold_allowed,
-                    ignore_invalid_actions = betting_round.ignore_invalid_actions
-                )
-            except JumpToNextPlayerSignal:
-                continue
-            except CloseBettingRoundSignal:
+            signal = yield from run_turn(
+                table = betting_round.table,
+                current_player = player,
+                open_fold_allowed = betting_round.open_fold_allowed,
+                ignore_invalid_actions = betting_round.ignore_invalid_actions
+            )
+            if signal in closing_signals:
                 break
+            player = betting_round.table.get_next_player(player)
     
-    logger.info(f'Number of laps: {betting_round.lap_counts}')
+    logger.info('Number of laps: %s', betting_round.lap_counts)
     
     # Move chips to the center of the table
-    for player in betting_round.table.players:
-        betting_round.table.add_to_central_pot(player.current_amount)
\ No newline at end of file
+    betting_round.table.collect_bets()
\ No newline at end of file
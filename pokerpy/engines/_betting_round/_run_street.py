@@ -0,0 +1,105 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+Defines the functions that run the turns of a street one action at a time, shared by the betting
+round and the hand cycle so that both follow the same rules.
+"""
+
+
+from typing import TYPE_CHECKING
+
+
+from pokerpy.logger import get_logger
+from pokerpy.messages import msg_forbidden_action
+from pokerpy.structures import Action, Player
+
+
+from ._get_valid_actions import compute_valid_actions
+from ._prompt_player import closing_signals, get_skipping_signal
+from ._set_action_effects import set_action_effects
+if TYPE_CHECKING:
+    from .._hand_cycle._hand_cycle import HandCycle
+    from ._betting_round import BettingRound
+
+
+logger = get_logger()
+
+
+def seek_player_to_act(engine: "BettingRound|HandCycle", player: Player):
+
+    """
+    Rotates the turns from a player until one is able to act and retrieves them, keeping the valid
+    actions of their decision point (or retrieves None if the street is closed).
+    """
+
+    table = engine._table
+    starting_player = table.starting_player
+
+    while True:
+
+        engine._current_player = player
+        if player is starting_player:
+            engine._lap_counts += 1
+
+        # Jump to the next player or close the street if the player cannot act
+        signal = get_skipping_signal(table, player)
+        if signal in closing_signals:
+            return None
+        if signal is not None:
+            player = table.get_next_player(player)
+            continue
+
+        # The player is able to act, and the valid actions of this decision point are kept for both
+        # the controller query and the validation of the requested action
+        engine._valid_actions = compute_valid_actions(
+            player.stack,
+            player.current_amount,
+            table.current_level,
+            table.complete_current_level,
+            table.full_bet,
+            table.full_raise_increase,
+            player.has_played,
+            table.is_last_active_player(player),
+            bool(engine.open_fold_allowed),
+        )
+        return player
+
+
+def apply_street_action(engine: "BettingRound|HandCycle", action: Action):
+
+    """
+    Applies the action of the current player and retrieves the next player to act (or None if the
+    street is closed). Invalid actions are either ignored, keeping the same player to act, or
+    rejected with an error.
+    """
+
+    table = engine._table
+    player = engine._current_player
+
+    if not engine._valid_actions.is_valid(action.name, action.amount):
+        logger.debug('--- invalid action: %ss %s', action.name, action.amount)
+        if not engine._ignore_invalid_actions:
+            raise RuntimeError(msg_forbidden_action)
+        return player
+
+    player.reset_action()
+    set_action_effects(table=table, player=player, action=action)
+
+    # Stop if the current player still is the stopping player
+    if player is table.stopping_player:
+        return None
+    return seek_player_to_act(engine, table.get_next_player(player))
@@ -18,6 +18,9 @@ Defines the function that updates statuses according to the chosen action.
 """
 
 
+from logging import INFO
+
+
 from pokerpy.constants import ACTION_BET, ACTION_FOLD, ACTION_RAISE
 from pokerpy.logger import get_logger
 from pokerpy.structures import Action, Player, Table
@@ -32,38 +35,28 @@ def set_action_effects(*, table: Table, player: Player, action: Action):
     Updates statuses according to the chosen action.
     """
 
+    action_name = action.name
+    action_amount = action.amount
     player_current_amount = player.current_amount
-    current_level = table.current_level
-    complete_current_level = table.complete_current_level
-    full_raise_increase = table.full_raise_increase
-
     player.mark_has_played()
 
-    if action.name == ACTION_FOLD:
+    if action_name == ACTION_FOLD:
         player.mark_is_folded()
 
-    if action.amount > 0:
-        player.remove_from_stack(action.amount)
-        player.add_to_current_amount(action.amount)
-        player.add_to_pot_participation(action.amount)
-
-    if action.name in (ACTION_BET, ACTION_RAISE):
-        new_current_amount = player_current_amount + action.amount
-        raise_increase = new_current_amount - current_level
-        new_level = complete_current_level + raise_increase
-        table.set_current_level(new_level)
-        if new_level >= complete_current_level + full_raise_increase:
-            table.set_complete_current_level(new_level)
-            if (new_full_raise_increase := new_level - complete_current_level) > 0:
-                table.set_full_raise_increase(new_full_raise_increase)
+    if action_amount > 0:
+        table.move_chips(player, action_amount)
+
+    if action_name in (ACTION_BET, ACTION_RAISE):
+        previous_player_in_hand = table.raise_level(player, player_current_amount + action_amount)
         try:
-            assert (previous_player_in_hand := table.get_previous_active_player(player)) is not None
+            assert previous_player_in_hand is not None
         except AssertionError:
             breakpoint()
-        table.set_stopping_player(previous_player_in_hand) 
 
-    logger.info(
-        f"{''.join(str(card) for card in player.cards)} {player.name} {action.name.upper()}S {action.amount} "
-        f"({player.name}'s current amount: {player.current_amount} | stack: {player.stack})"
-    )
-    logger.info(f'TABLE CURRENT LEVEL: {table.current_level}\n')
\ No newline at end of file
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "%s %s %sS %s (%s's current amount: %s | stack: %s)",
+            ''.join(str(card) for card in player.cards), player.name, action.name.upper(), action.amount,
+            player.name, player.current_amount, player.stack,
+        )
+        logger.info('TABLE CURRENT LEVEL: %s\n', table.current_level)
@@ -0,0 +1,77 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents the valid actions of a player at a decision point.
+"""
+
+
+from collections.abc import Mapping
+
+
+class ValidActions(Mapping):
+
+
+    """
+    Represents the valid actions of a player at a decision point, mapping each action name to the
+    range of amounts the player may put with it. It is immutable, so a single instance is shared by
+    every query on the same decision point.
+    """
+
+
+    __slots__ = ('_bounds_by_action',)
+
+
+    def __init__(self, bounds_by_action: dict[str, tuple[int, int]]):
+
+        # Fixed variables
+        self._bounds_by_action = bounds_by_action
+
+
+    def is_valid(self, action_name: str, amount: int):
+        "Checks whether the action can be taken with the given amount, without building any range."
+        bounds = self._bounds_by_action.get(action_name)
+        return bounds is not None and bounds[0] <= amount <= bounds[1]
+
+
+    def get_bounds(self, action_name: str):
+        "Retrieves the smallest and the largest amounts of an action (or None if it is not valid)."
+        return self._bounds_by_action.get(action_name)
+
+
+    def __getitem__(self, action_name: str):
+        smallest_amount, largest_amount = self._bounds_by_action[action_name]
+        return range(smallest_amount, largest_amount + 1)
+
+
+    def __iter__(self):
+        return iter(self._bounds_by_action)
+
+
+    def __len__(self):
+        return len(self._bounds_by_action)
+
+
+    def __contains__(self, action_name: object):
+        return action_name in self._bounds_by_action
+
+
+    def __hash__(self):
+        return hash(tuple(self._bounds_by_action.items()))
+
+
+    def __repr__(self):
+        bounds = ', '.join(f'{name}={smallest}..{largest}' for name, (smallest, largest) in self._bounds_by_action.items())
+        return f'ValidActions({bounds})'
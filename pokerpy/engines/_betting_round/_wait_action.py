@@ -0,0 +1,85 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the coroutines that wait for a player to request an action, backed by a future.
+"""
+
+
+from pokerpy.constants import ACTION_CHECK, ACTION_FOLD
+from pokerpy.logger import get_logger
+from pokerpy.messages import (
+    msg_not_number,
+    msg_not_player_instance,
+    msg_not_positive_value,
+)
+from pokerpy.structures import Action, Player
+
+
+from ._valid_actions import ValidActions
+
+
+logger = get_logger()
+
+
+def validate_timeout(timeout: (float|None)):
+    if timeout is not None:
+        if not isinstance(timeout, (int, float)):
+            raise TypeError(msg_not_number.format(type(timeout).__name__))
+        if timeout <= 0:
+            raise ValueError(msg_not_positive_value.format(timeout))
+
+
+async def wait_action(player: Player, valid_actions: ValidActions, *, timeout: (float|None) = None):
+
+    """
+    Waits until the player requests an action and retrieves it, leaving the player without requested
+    action. Nothing polls the player: its next request resolves a future. If the time runs out, the
+    player checks when possible and folds otherwise.
+    """
+
+    if not isinstance(player, Player):
+        raise TypeError(msg_not_player_instance.format(type(player).__name__))
+    validate_timeout(timeout)
+
+    return await await_requested_action(player, valid_actions, timeout)
+
+
+async def await_requested_action(player: Player, valid_actions: ValidActions, timeout: (float|None)):
+
+    """
+    Waits for the action of a player as wait_action does, without validating the input. If there is
+    no time left, only the action that the player may have already requested is retrieved.
+    """
+
+    # The player may have requested its action before being awaited
+
+    # Asyncio is only imported once a player is awaited, so that importing PokerPy does not load it
+
+    import asyncio
+
+    if (action := player.requested_action) is None:
+        waiter = asyncio.get_running_loop().create_future()
+        player.set_action_waiter(waiter)
+        try:
+            action = await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            action = Action(ACTION_CHECK) if ACTION_CHECK in valid_actions else Action(ACTION_FOLD)
+            logger.info('%s runs out of time and %ss.', player.name, action.name)
+        finally:
+            player.set_action_waiter(None)
+
+    player.reset_action()
+    return action
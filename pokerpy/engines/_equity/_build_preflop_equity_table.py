@@ -0,0 +1,177 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that builds the preflop equity table file.
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+import random
+from statistics import NormalDist
+
+
+from pokerpy.constants import FULL_BOARD_SIZE
+from pokerpy.messages import (
+    msg_invalid_opponents_count,
+    msg_not_int,
+    msg_not_positive_value,
+)
+from pokerpy.structures import evaluate_best_card_ids
+
+
+from ._preflop_equity_table import (
+    PREFLOP_EQUITY_FILE_MAGIC,
+    PREFLOP_EQUITY_SCALE,
+    PreflopEquityTable,
+    preflop_equity_header,
+    preflop_equity_value,
+)
+from ._starting_hand_classes import starting_hand_classes, starting_hand_combos_by_index
+
+
+MAX_PREFLOP_OPPONENTS = 9
+
+
+def get_all_in_shares(hole_card_ids: list[tuple[int, int]], board_ids: tuple[int, ...]):
+    "Retrieves the share of the pot that the first player gets when all hands are shown down."
+    strengths = [evaluate_best_card_ids(ids + board_ids) for ids in hole_card_ids]
+    best_strength = max(strengths)
+    if strengths[0] != best_strength:
+        return 0.0
+    return 1 / strengths.count(best_strength)
+
+
+def run_preflop_equity_trials(index: int, max_opponents: int, trials: int, seed: str):
+
+    """
+    Samples the preflop equities of a starting hand class against every class after it in the
+    grid, and against one to max_opponents random hands. It runs in worker processes.
+    """
+
+    rng = random.Random(seed)
+    classes_count = len(starting_hand_classes)
+    combos = starting_hand_combos_by_index[index]
+
+    heads_up_equities: list[float] = []
+    for opponent_index in range(index + 1, classes_count):
+        opponent_combos = starting_hand_combos_by_index[opponent_index]
+        share_sum = 0.0
+        for _ in range(trials):
+            while True:
+                hole_card_ids = [rng.choice(combos), rng.choice(opponent_combos)]
+                if len({*hole_card_ids[0], *hole_card_ids[1]}) == 4:
+                    break
+            used_ids = {*hole_card_ids[0], *hole_card_ids[1]}
+            deck_ids = [card_id for card_id in range(52) if card_id not in used_ids]
+            share_sum += get_all_in_shares(hole_card_ids, tuple(rng.sample(deck_ids, FULL_BOARD_SIZE)))
+        heads_up_equities.append(share_sum / trials)
+
+    random_hands_equities: list[float] = []
+    for opponents_count in range(1, max_opponents + 1):
+        share_sum = 0.0
+        for _ in range(trials):
+            combo = rng.choice(combos)
+            deck_ids = [card_id for card_id in range(52) if card_id not in combo]
+            dealt_ids = rng.sample(deck_ids, 2 * opponents_count + FULL_BOARD_SIZE)
+            hole_card_ids = [combo, *(tuple(dealt_ids[i:i + 2]) for i in range(0, 2 * opponents_count, 2))]
+            share_sum += get_all_in_shares(hole_card_ids, tuple(dealt_ids[2 * opponents_count:]))
+        random_hands_equities.append(share_sum / trials)
+
+    return heads_up_equities, random_hands_equities
+
+
+def build_preflop_equity_table(
+    path: (str|os.PathLike),
+    *,
+    trials: int = 10_000,
+    max_opponents: int = MAX_PREFLOP_OPPONENTS,
+    workers: (int|None) = None,
+    seed: (int|None) = None,
+):
+
+    """
+    Builds the preflop equity table of the 169 canonical starting hand classes once, sampling a
+    number of all-in runouts per entry, and writes it to a compact binary file that
+    PreflopEquityTable can memory-map. The default trials keep every equity within about 1% at a
+    95% confidence level, and the file records the trials along with that margin of error.
+
+    Each starting hand class is sampled with its own seed derived from the master seed, so the file
+    only depends on the seed and not on the number of workers.
+    """
+
+    # Validate input
+
+    for value in (trials, max_opponents):
+        if not isinstance(value, int):
+            raise TypeError(msg_not_int.format(type(value).__name__))
+    if trials <= 0:
+        raise ValueError(msg_not_positive_value.format(trials))
+    if not 1 <= max_opponents <= MAX_PREFLOP_OPPONENTS:
+        raise ValueError(msg_invalid_opponents_count.format(MAX_PREFLOP_OPPONENTS))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int):
+        raise TypeError(msg_not_int.format(type(workers).__name__))
+    if workers <= 0:
+        raise ValueError(msg_not_positive_value.format(workers))
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if not isinstance(seed, int):
+        raise TypeError(msg_not_int.format(type(seed).__name__))
+
+    # Sample every starting hand class
+
+    classes_count = len(starting_hand_classes)
+    arguments = (
+        range(classes_count),
+        [max_opponents] * classes_count,
+        [trials] * classes_count,
+        [f'{seed}:{index}' for index in range(classes_count)],
+    )
+
+    if workers == 1:
+        results = list(map(run_preflop_equity_trials, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_preflop_equity_trials, *arguments))
+
+    # Heads-up equities of a class against itself are even, and the ones of the opponent complete them
+
+    heads_up_equities = [0.5] * (classes_count * classes_count)
+    random_hands_equities: list[float] = []
+
+    for index, (class_heads_up_equities, class_random_hands_equities) in enumerate(results):
+        for opponent_index, equity in enumerate(class_heads_up_equities, start=index + 1):
+            heads_up_equities[index * classes_count + opponent_index] = equity
+            heads_up_equities[opponent_index * classes_count + index] = 1 - equity
+        random_hands_equities.extend(class_random_hands_equities)
+
+    # Pot shares are between 0 and 1, so their variance is at most 1/4 and bounds every margin of error
+
+    margin_of_error = NormalDist().inv_cdf(0.975) * math.sqrt(0.25 / trials)
+
+    # Write the file
+
+    values = [round(equity * PREFLOP_EQUITY_SCALE) for equity in heads_up_equities + random_hands_equities]
+    with open(path, 'wb') as file:
+        file.write(preflop_equity_header.pack(PREFLOP_EQUITY_FILE_MAGIC, classes_count, max_opponents, trials, margin_of_error))
+        file.write(b''.join(preflop_equity_value.pack(value) for value in values))
+
+    return PreflopEquityTable(path)
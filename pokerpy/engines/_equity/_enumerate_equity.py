@@ -0,0 +1,90 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that calculates the exact equity of the players in hand by enumerating runouts.
+"""
+
+
+from collections.abc import Iterable
+from itertools import combinations
+import math
+
+
+from pokerpy.constants import FULL_BOARD_SIZE
+from pokerpy.messages import (
+    msg_not_enough_cards_in_deck,
+    msg_not_int,
+    msg_not_positive_value,
+    msg_too_many_runouts,
+)
+from pokerpy.structures import Card, Table, evaluate_best_card_ids
+
+
+from ._equity_result import EquityResult
+from ._get_known_card_ids import get_known_card_ids
+
+
+def enumerate_equity(table: Table, *, dead_cards: Iterable[Card] = (), max_runouts: int = 100_000):
+
+    """
+    Calculates the exact equity of the players in hand by enumerating every runout of the remaining
+    deck. It is meant for flop, turn and river spots, where there are a thousand runouts at most: if
+    there are more than max_runouts (as preflop, with more than a million), a ValueError is raised.
+    """
+
+    if not isinstance(max_runouts, int):
+        raise TypeError(msg_not_int.format(type(max_runouts).__name__))
+    if max_runouts <= 0:
+        raise ValueError(msg_not_positive_value.format(max_runouts))
+
+    players, hole_card_ids, common_card_ids, deck_card_ids = get_known_card_ids(table, dead_cards)
+    missing_cards_count = FULL_BOARD_SIZE - len(common_card_ids)
+
+    # Check the runouts can be enumerated before dealing any of them
+
+    if missing_cards_count > len(deck_card_ids):
+        raise ValueError(msg_not_enough_cards_in_deck)
+    if (runouts_count := math.comb(len(deck_card_ids), missing_cards_count)) > max_runouts:
+        raise ValueError(msg_too_many_runouts.format(runouts_count, max_runouts))
+
+    players_count = len(players)
+    runouts = 0
+    wins = [0] * players_count
+    ties = [0] * players_count
+    share_sums = [0.0] * players_count
+
+    # The known cards of every player are joined once, and each runout only appends its own cards
+    # to them (the evaluator ranks complete sets of cards, so nothing else is shared among runouts)
+
+    known_ids_by_player = [ids + common_card_ids for ids in hole_card_ids]
+
+    for runout_ids in combinations(deck_card_ids, missing_cards_count):
+        strengths = [evaluate_best_card_ids(ids + runout_ids) for ids in known_ids_by_player]
+        best_strength = max(strengths)
+        winner_indices = [index for index, strength in enumerate(strengths) if strength == best_strength]
+        share = 1 / len(winner_indices)
+        for index in winner_indices:
+            if len(winner_indices) == 1:
+                wins[index] += 1
+            else:
+                ties[index] += 1
+            share_sums[index] += share
+        runouts += 1
+
+    return {
+        player: EquityResult(player, runouts, wins[index], ties[index], share_sums[index] / runouts)
+        for index, player in enumerate(players)
+    }
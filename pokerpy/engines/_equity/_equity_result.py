@@ -0,0 +1,99 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents the equity of a player in the pot.
+"""
+
+
+from pokerpy.structures import Player
+
+
+class EquityResult:
+
+
+    """
+    Represents the equity of a player in the pot, measured over a number of runouts (either
+    sampled or enumerated).
+    """
+
+
+    def __init__(self, player: Player, runouts: int, wins: int, ties: int, equity: float, margin_of_error: float = 0.0):
+
+        # Fixed variables
+        self._player = player
+        self._runouts = runouts
+        self._wins = wins
+        self._ties = ties
+        self._equity = equity
+        self._margin_of_error = margin_of_error
+
+
+    @property
+    def player(self):
+        "Player whose equity was measured."
+        return self._player
+
+    @property
+    def runouts(self):
+        "Number of runouts the equity was measured over."
+        return self._runouts
+
+    @property
+    def wins(self):
+        "Number of runouts in which the player wins the whole pot."
+        return self._wins
+
+    @property
+    def ties(self):
+        "Number of runouts in which the player splits the pot with other players."
+        return self._ties
+
+    @property
+    def losses(self):
+        "Number of runouts in which the player gets nothing."
+        return self._runouts - self._wins - self._ties
+
+    @property
+    def win_probability(self):
+        "Fraction of runouts in which the player wins the whole pot."
+        return self._wins / self._runouts
+
+    @property
+    def tie_probability(self):
+        "Fraction of runouts in which the player splits the pot with other players."
+        return self._ties / self._runouts
+
+    @property
+    def lose_probability(self):
+        "Fraction of runouts in which the player gets nothing."
+        return self.losses / self._runouts
+
+    @property
+    def equity(self):
+        "Average fraction of the pot the player gets (ties count as a share of the pot)."
+        return self._equity
+
+    @property
+    def margin_of_error(self):
+        "Half width of the confidence interval of the equity (zero if it is exact)."
+        return self._margin_of_error
+
+
+    def __repr__(self):
+        return (
+            f'EquityResult(player={self.player.name}, runouts={self.runouts}, wins={self.wins}, '
+            f'ties={self.ties}, equity={self.equity:.4f}, margin_of_error={self.margin_of_error:.4f})'
+        )
@@ -0,0 +1,204 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that estimates the equity of the players in hand by sampling runouts.
+"""
+
+
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+import math
+import os
+import random
+from statistics import NormalDist
+
+
+from pokerpy.constants import FULL_BOARD_SIZE
+from pokerpy.messages import (
+    msg_not_int,
+    msg_not_number,
+    msg_not_positive_value,
+    msg_not_probability,
+)
+from pokerpy.structures import Card, Table, evaluate_best_card_ids
+
+
+from ._equity_result import EquityResult
+from ._get_known_card_ids import get_known_card_ids
+
+
+def run_equity_trials(
+    hole_card_ids: tuple[tuple[int, ...], ...],
+    common_card_ids: tuple[int, ...],
+    deck_card_ids: tuple[int, ...],
+    trials: int,
+    seed: str,
+):
+
+    """
+    Samples runouts and counts, for every player, the wins, the ties, the sum of the pot shares and
+    the sum of the squared pot shares. It runs in worker processes, so it only deals with integers.
+    """
+
+    rng = random.Random(seed)
+    missing_cards_count = FULL_BOARD_SIZE - len(common_card_ids)
+    players_count = len(hole_card_ids)
+
+    wins = [0] * players_count
+    ties = [0] * players_count
+    share_sums = [0.0] * players_count
+    squared_share_sums = [0.0] * players_count
+
+    for _ in range(trials):
+
+        board_ids = common_card_ids + tuple(rng.sample(deck_card_ids, missing_cards_count))
+        strengths = [evaluate_best_card_ids(ids + board_ids) for ids in hole_card_ids]
+
+        best_strength = max(strengths)
+        winner_indices = [index for index, strength in enumerate(strengths) if strength == best_strength]
+        share = 1 / len(winner_indices)
+
+        for index in winner_indices:
+            if len(winner_indices) == 1:
+                wins[index] += 1
+            else:
+                ties[index] += 1
+            share_sums[index] += share
+            squared_share_sums[index] += share * share
+
+    return wins, ties, share_sums, squared_share_sums
+
+
+def estimate_equity(
+    table: Table,
+    *,
+    dead_cards: Iterable[Card] = (),
+    trials: int = 100_000,
+    batch_size: int = 2_000,
+    workers: (int|None) = None,
+    seed: (int|None) = None,
+    margin_of_error: (float|None) = None,
+    confidence_level: float = 0.95,
+):
+
+    """
+    Estimates the equity of the players in hand by sampling runouts of the remaining deck.
+
+    Trials are split into batches, each one sampled with its own seed derived from the master seed,
+    and sharded across a process pool (or run in this process when workers is 1). Batches are
+    merged in order, so the result only depends on the seed and the batch size. If a margin of
+    error is given, sampling stops once the confidence interval of every player's equity is at
+    least that narrow.
+    """
+
+    # Validate input
+
+    for value in (trials, batch_size):
+        if not isinstance(value, int):
+            raise TypeError(msg_not_int.format(type(value).__name__))
+        if value <= 0:
+            raise ValueError(msg_not_positive_value.format(value))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int):
+        raise TypeError(msg_not_int.format(type(workers).__name__))
+    if workers <= 0:
+        raise ValueError(msg_not_positive_value.format(workers))
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if not isinstance(seed, int):
+        raise TypeError(msg_not_int.format(type(seed).__name__))
+
+    if margin_of_error is not None:
+        if not isinstance(margin_of_error, (int, float)):
+            raise TypeError(msg_not_number.format(type(margin_of_error).__name__))
+        if margin_of_error <= 0:
+            raise ValueError(msg_not_positive_value.format(margin_of_error))
+
+    if not isinstance(confidence_level, (int, float)):
+        raise TypeError(msg_not_number.format(type(confidence_level).__name__))
+    if not 0 < confidence_level < 1:
+        raise ValueError(msg_not_probability.format(confidence_level))
+
+    players, hole_card_ids, common_card_ids, deck_card_ids = get_known_card_ids(table, dead_cards)
+    z_score = NormalDist().inv_cdf((1 + confidence_level) / 2)
+
+    # Aggregated counts
+
+    players_count = len(players)
+    runouts = 0
+    wins = [0] * players_count
+    ties = [0] * players_count
+    share_sums = [0.0] * players_count
+    squared_share_sums = [0.0] * players_count
+
+    def get_margins_of_error():
+        margins: list[float] = []
+        for share_sum, squared_share_sum in zip(share_sums, squared_share_sums):
+            mean = share_sum / runouts
+            variance = max(squared_share_sum / runouts - mean * mean, 0.0)
+            margins.append(z_score * math.sqrt(variance / runouts))
+        return margins
+
+    def merge(batch_counts: tuple[list[int], list[int], list[float], list[float]], batch_trials: int):
+        nonlocal runouts
+        runouts += batch_trials
+        for totals, batch_totals in zip((wins, ties, share_sums, squared_share_sums), batch_counts):
+            for index, value in enumerate(batch_totals):
+                totals[index] += value
+
+    def is_precise_enough():
+        return margin_of_error is not None and max(get_margins_of_error()) <= margin_of_error
+
+    # Every batch has its own seed, so results do not depend on the number of workers
+
+    batch_trials = [min(batch_size, trials - start) for start in range(0, trials, batch_size)]
+    batch_arguments = [
+        (hole_card_ids, common_card_ids, deck_card_ids, count, f'{seed}:{batch_index}')
+        for batch_index, count in enumerate(batch_trials)
+    ]
+
+    if workers == 1 or len(batch_arguments) == 1:
+        for arguments in batch_arguments:
+            merge(run_equity_trials(*arguments), arguments[3])
+            if is_precise_enough():
+                break
+
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending_arguments = deque(batch_arguments)
+            futures: deque[tuple[Future, int]] = deque()
+            while pending_arguments or futures:
+                while pending_arguments and len(futures) < 2 * workers:
+                    arguments = pending_arguments.popleft()
+                    futures.append((executor.submit(run_equity_trials, *arguments), arguments[3]))
+                future, count = futures.popleft()
+                merge(future.result(), count)
+                if is_precise_enough():
+                    for future, _ in futures:
+                        future.cancel()
+                    break
+
+    # Build results
+
+    margins = get_margins_of_error()
+    return {
+        player: EquityResult(player, runouts, wins[index], ties[index], share_sums[index] / runouts, margins[index])
+        for index, player in enumerate(players)
+    }
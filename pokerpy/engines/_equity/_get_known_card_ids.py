@@ -0,0 +1,75 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that collects the card ids that an equity calculation starts from.
+"""
+
+
+from collections.abc import Iterable
+
+
+from pokerpy.constants import FULL_BOARD_SIZE
+from pokerpy.messages import (
+    msg_no_players_in_hand,
+    msg_not_table_instance,
+    msg_player_without_cards,
+    msg_repeated_cards,
+    msg_too_many_common_cards,
+)
+from pokerpy.structures import Card, CardSet, Table
+
+
+def get_known_card_ids(table: Table, dead_cards: Iterable[Card]):
+
+    """
+    Collects the card ids that an equity calculation starts from: the hole cards of every player in
+    hand, the common cards, and the cards of the deck that may still be dealt (excluding dead cards).
+    """
+
+    if not isinstance(table, Table):
+        raise TypeError(msg_not_table_instance.format(type(table).__name__))
+
+    players = table.players_in_hand
+    if not players:
+        raise ValueError(msg_no_players_in_hand)
+
+    dead_card_set = CardSet(dead_cards)
+    common_card_set = table.common_card_set
+
+    if len(common_card_set) > FULL_BOARD_SIZE:
+        raise ValueError(msg_too_many_common_cards.format(FULL_BOARD_SIZE))
+
+    # Known cards cannot be repeated among players, common cards and dead cards
+
+    known_card_set = dead_card_set | common_card_set
+    known_cards_count = len(dead_card_set) + len(common_card_set)
+
+    for player in players:
+        if not player.cards:
+            raise ValueError(msg_player_without_cards.format(player.name))
+        known_card_set |= player.card_set
+        known_cards_count += len(player.cards)
+
+    if len(known_card_set) != known_cards_count:
+        raise ValueError(msg_repeated_cards)
+
+    # Cards that were assigned without being removed from the deck cannot be dealt either
+
+    hole_card_ids = tuple(tuple(player.card_set.iter_card_ids()) for player in players)
+    common_card_ids = tuple(common_card_set.iter_card_ids())
+    deck_card_ids = tuple((table.deck_set - known_card_set).iter_card_ids())
+
+    return players, hole_card_ids, common_card_ids, deck_card_ids
@@ -0,0 +1,181 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that looks up preflop equities in a memory-mapped preflop equity table file.
+"""
+
+
+import mmap
+import os
+import struct
+
+
+from pokerpy.messages import (
+    msg_invalid_opponents_count,
+    msg_invalid_preflop_equity_file,
+    msg_not_int,
+)
+
+
+from ._starting_hand_classes import get_starting_hand_class_index_by_name, starting_hand_classes
+
+
+# File layout (little endian): a header followed by equities stored as unsigned 16-bit fractions
+
+PREFLOP_EQUITY_FILE_MAGIC = b'PKPYPEQ2'
+preflop_equity_header = struct.Struct('<8sHHId') ## magic, number of classes, max number of opponents, trials, margin of error
+preflop_equity_value = struct.Struct('<H')
+PREFLOP_EQUITY_SCALE = 0xFFFF
+
+
+class PreflopEquityTable:
+
+
+    """
+    Looks up preflop all-in equities of the 169 canonical starting hand classes in a file written by
+    build_preflop_equity_table: heads-up equities of every class against every other class, and
+    equities of every class against one or more random hands.
+
+    The file is memory-mapped on the first lookup. Worker processes receiving a pickled table map
+    the same file again, so the operating system shares one copy of its pages among them.
+    """
+
+
+    def __init__(self, path: (str|os.PathLike)):
+
+        # Fixed variables
+        self._path = os.fspath(path)
+
+        # Dynamic variables
+        self._mmap: (mmap.mmap|None) = None
+        self._max_opponents = 0
+        self._trials = 0
+        self._margin_of_error = 0.0
+
+
+    @property
+    def path(self):
+        "Path of the preflop equity table file."
+        return self._path
+
+    @property
+    def max_opponents(self):
+        "Largest number of random opponents whose equities are stored in the file."
+        self._load()
+        return self._max_opponents
+
+    @property
+    def trials(self):
+        "Number of all-in runouts sampled per stored equity."
+        self._load()
+        return self._trials
+
+    @property
+    def margin_of_error(self):
+        "Largest margin of error of the stored equities, at a 95% confidence level."
+        self._load()
+        return self._margin_of_error
+
+
+    def _load(self):
+
+        """
+        Memory-maps the file and validates its header (only the first time).
+        """
+
+        if self._mmap is not None:
+            return
+
+        with open(self._path, 'rb') as file:
+            try:
+                mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError: ## empty files cannot be mapped
+                raise ValueError(msg_invalid_preflop_equity_file) from None
+
+        classes_count = len(starting_hand_classes)
+        try:
+            magic, file_classes_count, max_opponents, trials, margin_of_error = preflop_equity_header.unpack_from(mapped_file)
+        except struct.error:
+            magic, file_classes_count, max_opponents, trials, margin_of_error = None, 0, 0, 0, 0.0
+
+        expected_size = preflop_equity_header.size + preflop_equity_value.size * classes_count * (classes_count + max_opponents)
+        if magic != PREFLOP_EQUITY_FILE_MAGIC or file_classes_count != classes_count or len(mapped_file) != expected_size:
+            mapped_file.close()
+            raise ValueError(msg_invalid_preflop_equity_file)
+
+        self._mmap = mapped_file
+        self._max_opponents = max_opponents
+        self._trials = trials
+        self._margin_of_error = margin_of_error
+
+
+    def _read_equity(self, position: int):
+        "Reads the equity stored at a position (counted in stored values after the header)."
+        offset = preflop_equity_header.size + preflop_equity_value.size * position
+        return preflop_equity_value.unpack_from(self._mmap, offset)[0] / PREFLOP_EQUITY_SCALE
+
+
+    def heads_up_equity(self, hand_class: str, opponent_hand_class: str):
+
+        """
+        Retrieves the preflop all-in equity of a starting hand class against another one.
+        """
+
+        index = get_starting_hand_class_index_by_name(hand_class)
+        opponent_index = get_starting_hand_class_index_by_name(opponent_hand_class)
+        self._load()
+        return self._read_equity(index * len(starting_hand_classes) + opponent_index)
+
+
+    def equity_against_random_hands(self, hand_class: str, opponents_count: int = 1):
+
+        """
+        Retrieves the preflop all-in equity of a starting hand class against a number of random hands.
+        """
+
+        index = get_starting_hand_class_index_by_name(hand_class)
+        self._load()
+
+        if not isinstance(opponents_count, int):
+            raise TypeError(msg_not_int.format(type(opponents_count).__name__))
+        if not 1 <= opponents_count <= self._max_opponents:
+            raise ValueError(msg_invalid_opponents_count.format(self._max_opponents))
+
+        classes_count = len(starting_hand_classes)
+        return self._read_equity(classes_count * classes_count + index * self._max_opponents + opponents_count - 1)
+
+
+    def close(self):
+        "Unmaps the file (it is mapped again on the next lookup)."
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+    def __getstate__(self):
+        return {'_path': self._path}
+
+
+    def __setstate__(self, state: dict):
+        self._path = state['_path']
+        self._mmap = None
+        self._max_opponents = 0
+        self._trials = 0
+        self._margin_of_error = 0.0
+
+
+    def __repr__(self):
+        return f'PreflopEquityTable(path={self._path!r})'
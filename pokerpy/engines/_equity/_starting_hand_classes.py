@@ -0,0 +1,102 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the 169 canonical starting hand classes and the function that classifies hole cards.
+"""
+
+
+from collections.abc import Iterable
+
+
+from pokerpy.constants import sorted_card_values
+from pokerpy.messages import msg_invalid_starting_hand_class, msg_not_two_hole_cards
+from pokerpy.structures import Card, CardSet
+
+
+def get_starting_hand_class_index(high_value_index: int, low_value_index: int, is_suited: bool):
+
+    """
+    Retrieves the index of a starting hand class in the 13x13 grid: pairs lie on the diagonal,
+    suited hands above it (row of the highest value) and offsuit hands below it.
+    """
+
+    if is_suited:
+        return high_value_index * 13 + low_value_index
+    return low_value_index * 13 + high_value_index
+
+
+def get_starting_hand_class_name(index: int):
+    "Retrieves the name of a starting hand class from its index in the 13x13 grid (e.g. 'AA', 'AKs', 'AKo')."
+    row, column = divmod(index, 13)
+    if row == column:
+        return sorted_card_values[row] * 2
+    if row > column:
+        return sorted_card_values[row] + sorted_card_values[column] + 's'
+    return sorted_card_values[column] + sorted_card_values[row] + 'o'
+
+
+starting_hand_classes = tuple(get_starting_hand_class_name(index) for index in range(169))
+starting_hand_class_index_by_name = {name: index for index, name in enumerate(starting_hand_classes)}
+
+
+def get_starting_hand_combos(index: int):
+
+    """
+    Retrieves the card id pairs of every combination of a starting hand class (6 for pairs, 4 for
+    suited hands and 12 for offsuit hands).
+    """
+
+    row, column = divmod(index, 13)
+    high_value_index, low_value_index = max(row, column), min(row, column)
+    combos: list[tuple[int, int]] = []
+
+    for high_suit_index in range(4):
+        for low_suit_index in range(4):
+            if row == column:
+                is_valid_combo = high_suit_index < low_suit_index
+            else:
+                is_valid_combo = (high_suit_index == low_suit_index) == (row > column)
+            if not is_valid_combo:
+                continue
+            combos.append((high_value_index * 4 + high_suit_index, low_value_index * 4 + low_suit_index))
+
+    return tuple(combos)
+
+
+starting_hand_combos_by_index = tuple(get_starting_hand_combos(index) for index in range(169))
+
+
+def get_starting_hand_class_index_by_name(hand_class: str):
+    "Retrieves the index of a starting hand class from its name."
+    index = starting_hand_class_index_by_name.get(hand_class)
+    if index is None:
+        raise ValueError(msg_invalid_starting_hand_class.format(hand_class))
+    return index
+
+
+def get_starting_hand_class(hole_cards: Iterable[Card]):
+
+    """
+    Classifies two hole cards into one of the 169 canonical starting hand classes (e.g. 'AKs').
+    """
+
+    card_set = CardSet(hole_cards)
+    if len(card_set) != 2:
+        raise ValueError(msg_not_two_hole_cards)
+
+    low_id, high_id = card_set.iter_card_ids()
+    index = get_starting_hand_class_index(high_id >> 2, low_id >> 2, (high_id & 3) == (low_id & 3))
+    return starting_hand_classes[index]
@@ -0,0 +1,229 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents a hand cycle, from the antes to the distribution of the pot.
+"""
+
+
+from collections.abc import Generator
+
+
+from pokerpy.constants import sorted_street_names
+from pokerpy.messages import (
+    msg_hand_cycle_was_not_completed,
+    msg_not_int,
+    msg_not_player_instance,
+    msg_not_positive_or_zero_value,
+    msg_not_positive_value,
+    msg_not_table_instance,
+    msg_player_not_in_table,
+)
+from pokerpy.structures import Action, Player, Table
+
+
+from .._betting_round._valid_actions import ValidActions
+from ._methods_to_run_streets import method_apply_action, method_start
+
+
+class HandCycle:
+
+
+    """
+    Represents a hand cycle context manager, which runs the antes, the blinds, the four streets and
+    the showdown of a hand on a table. It keeps its state across streets and hands, so the same
+    instance can run one hand after another.
+    """
+
+
+    __slots__ = (
+        '_table',
+        '_ante',
+        '_small_blind',
+        '_big_blind',
+        '_small_blind_player',
+        '_big_blind_player',
+        '_postflop_starting_player',
+        'open_fold_allowed',
+        '_ignore_invalid_actions',
+        '_hands_count',
+        '_street_index',
+        '_lap_counts',
+        '_current_player',
+        '_valid_actions',
+        '_is_started',
+        '_is_completed',
+    )
+
+
+    def __init__(
+        self,
+        table: Table,
+        *,
+        big_blind: int,
+        small_blind: int = 0,
+        ante: int = 0,
+        small_blind_player: (Player|None) = None,
+        open_fold_allowed = False,
+        ignore_invalid_actions = True
+    ):
+
+        # Type validations
+
+        if not isinstance(table, Table):
+            raise TypeError(msg_not_table_instance.format(type(table).__name__))
+
+        for amount in (big_blind, small_blind, ante):
+            if not isinstance(amount, int):
+                raise TypeError(msg_not_int.format(type(amount).__name__))
+
+        if small_blind_player is not None and not isinstance(small_blind_player, Player):
+            raise TypeError(msg_not_player_instance.format(type(small_blind_player).__name__))
+
+        # Value validations
+
+        if big_blind <= 0:
+            raise ValueError(msg_not_positive_value.format(big_blind))
+
+        for amount in (small_blind, ante):
+            if amount < 0:
+                raise ValueError(msg_not_positive_or_zero_value.format(amount))
+
+        if small_blind_player is None:
+            small_blind_player = table.players[0]
+        if not table.has_player(small_blind_player):
+            raise ValueError(msg_player_not_in_table.format(small_blind_player.name))
+
+        # Fixed variables
+
+        self._table = table
+        self._ante = ante
+        self._small_blind = small_blind
+        self._big_blind = big_blind
+
+        # Heads-up, the big blind acts first after the flop
+        self._small_blind_player = small_blind_player
+        self._big_blind_player = table.get_next_player(small_blind_player)
+        self._postflop_starting_player = self._big_blind_player if len(table.players) == 2 else small_blind_player
+
+        self.open_fold_allowed = open_fold_allowed # editable, hopefully boolean but not enforced
+        self._ignore_invalid_actions = bool(ignore_invalid_actions)
+
+        # State variables
+
+        self._hands_count = 0
+        self._street_index = 0
+        self._lap_counts = 0
+        self._current_player: (Player|None) = None
+        self._valid_actions: (ValidActions|None) = None
+        self._is_started = False
+        self._is_completed = False
+
+
+    @property
+    def table(self):
+        return self._table
+
+    @property
+    def ante(self):
+        return self._ante
+
+    @property
+    def small_blind(self):
+        return self._small_blind
+
+    @property
+    def big_blind(self):
+        return self._big_blind
+
+    @property
+    def small_blind_player(self):
+        return self._small_blind_player
+
+    @property
+    def big_blind_player(self):
+        return self._big_blind_player
+
+    @property
+    def hands_count(self):
+        "Number of hands started by the hand cycle."
+        return self._hands_count
+
+    @property
+    def street_name(self):
+        "Name of the current street (or None if no hand has been started)."
+        return sorted_street_names[self._street_index] if self._is_started else None
+
+    @property
+    def lap_counts(self):
+        "Number of laps in the current street."
+        return self._lap_counts
+
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @property
+    def is_completed(self):
+        return self._is_completed
+
+    @property
+    def ignore_invalid_actions(self):
+        return self._ignore_invalid_actions
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exception_type: (type|None), exception: (BaseException|None), _):
+        if exception is None and not self.is_completed:
+            raise RuntimeError(msg_hand_cycle_was_not_completed)
+
+
+    # Methods to run the hand
+
+
+    def start(self):
+        "Starts a new hand and retrieves the first player to act (or None if the hand is completed)."
+        return method_start(self)
+
+
+    def apply_action(self, action: Action):
+        "Applies the action of the current player and retrieves the next player to act (or None if completed)."
+        return method_apply_action(self, action)
+
+
+    def listen(self) -> Generator[Player]:
+
+        """
+        Starts a new hand and retrieves a generator that yields the players to act, applying the
+        action each of them requests.
+        """
+
+        player = self.start()
+        while player is not None:
+            yield player
+            if (action := player.requested_action) is not None:
+                player = self.apply_action(action)
+
+
+    def get_action_ranges(self):
+        """
+        Retrieves the available actions of the current player, mapped to their ranges of amounts (or
+        None if nobody is to act). They are computed once per decision point, and shared with the
+        validation of the action the player requests.
+        """
+        return self._valid_actions
@@ -0,0 +1,227 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the methods that run the streets of a hand cycle, one action at a time.
+"""
+
+
+from logging import INFO
+from typing import TYPE_CHECKING
+
+
+from pokerpy.constants import HOLE_CARDS_COUNT, common_cards_count_by_street, sorted_street_names
+from pokerpy.logger import get_logger
+from pokerpy.messages import (
+    msg_hand_cycle_is_completed,
+    msg_hand_cycle_is_running,
+    msg_hand_cycle_was_not_started,
+    msg_not_action_instance,
+)
+from pokerpy.structures import Action, Table, best_hand
+
+
+from .._betting_round._run_street import apply_street_action, seek_player_to_act
+from .._showdown import showdown
+if TYPE_CHECKING:
+    from ._hand_cycle import HandCycle
+
+
+logger = get_logger()
+
+
+def method_start(self: "HandCycle"):
+
+    """
+    Resets the table, places the antes and the blinds, deals the hole cards and retrieves the first
+    player to act (or None if the hand is completed without any action).
+    """
+
+    if self._is_started and not self._is_completed:
+        raise RuntimeError(msg_hand_cycle_is_running)
+
+    table = self._table
+    self._is_started = True
+    self._is_completed = False
+    self._hands_count += 1
+
+    reset_hand_states(table)
+    table.set_full_bet(self._big_blind)
+
+    # Antes go straight to the central pot
+
+    if self._ante > 0:
+        for player in table.players_in_hand:
+            ante = min(self._ante, player.stack)
+            player.remove_from_stack(ante)
+            player.add_to_pot_participation(ante)
+            table.add_to_central_pot(ante)
+
+    # Hole cards are dealt one at a time around the table
+
+    for _ in range(HOLE_CARDS_COUNT):
+        for player in table.players_in_hand:
+            player.assign_card(table.deal_card())
+    if logger.isEnabledFor(INFO):
+        for player in table.players_in_hand:
+            logger.info('Dealer deals cards %s to %s.', ''.join(str(card) for card in player.cards), player.name)
+
+    return start_street(self, 0)
+
+
+def method_apply_action(self: "HandCycle", action: Action):
+
+    """
+    Applies the action of the current player and retrieves the next player to act, moving through
+    the streets and the showdown as they are completed (or None if the hand is completed). Invalid
+    actions are either ignored, keeping the same player to act, or rejected with an error.
+    """
+
+    if not isinstance(action, Action):
+        raise TypeError(msg_not_action_instance.format(type(action).__name__))
+    if not self._is_started:
+        raise RuntimeError(msg_hand_cycle_was_not_started)
+    if self._is_completed:
+        raise RuntimeError(msg_hand_cycle_is_completed)
+
+    if (player := apply_street_action(self, action)) is not None:
+        return player
+    return complete_street(self)
+
+
+def reset_hand_states(table: Table):
+
+    """
+    Resets the table and its players for a new hand in a single pass. Players without chips sit the
+    hand out as folded players.
+    """
+
+    table.reset_deck()
+    table.reset_common_cards()
+    table.reset_central_pot()
+
+    for player in table.players:
+        player.reset_cards()
+        player.reset_hand()
+        player.reset_action()
+        player.reset_current_amount()
+        player.reset_pot_participation()
+        player.unmark_has_played()
+        if player.stack > 0:
+            if player.is_folded:
+                player.unmark_is_folded()
+        elif not player.is_folded:
+            player.mark_is_folded()
+
+
+def start_street(self: "HandCycle", street_index: int):
+
+    """
+    Deals the common cards of a street, prepares the table for its betting and retrieves the first
+    player to act (or moves on if nobody can act).
+    """
+
+    table = self._table
+    street_name = sorted_street_names[street_index]
+    self._street_index = street_index
+    self._lap_counts = 0
+
+    if (cards_count := common_cards_count_by_street[street_name]) > 0:
+        for _ in range(cards_count):
+            table.assign_common_card(table.deal_card())
+        if logger.isEnabledFor(INFO):
+            logger.info('Dealer deals common cards: %s.', ''.join(str(card) for card in table.common_cards[-cards_count:]))
+
+    # The levels start from zero, and the preflop ones are raised by the blinds
+
+    if street_index == 0:
+        starting_player = table.get_next_player(self._big_blind_player)
+    else:
+        starting_player = self._postflop_starting_player
+
+    table.set_starting_player(starting_player)
+    table.reset_levels()
+
+    if street_index == 0:
+        place_blinds(self)
+
+    # Do not even iterate if there is only one non-folded player who still has a stack to bet
+    if table.active_players_count > 1:
+        if (player := seek_player_to_act(self, starting_player)) is not None:
+            return player
+    return complete_street(self)
+
+
+def place_blinds(self: "HandCycle"):
+
+    """
+    Places the blinds in front of their players and raises the table levels to the largest blind. A
+    short big blind still sets the full big blind as the level to call and to raise from.
+    """
+
+    table = self._table
+    current_level = 0
+
+    for player, blind in ((self._small_blind_player, self._small_blind), (self._big_blind_player, self._big_blind)):
+        amount = min(blind, player.stack)
+        if amount == 0 or player.is_folded:
+            continue
+        table.move_chips(player, amount)
+        current_level = max(current_level, player.current_amount)
+        logger.info('%s places blind %s.', player.name, amount)
+
+    current_level = max(current_level, self._big_blind)
+    table.set_current_level(current_level)
+    table.set_complete_current_level(current_level)
+
+
+def complete_street(self: "HandCycle"):
+
+    """
+    Moves the chips to the center of the table and starts the next street (or the showdown if the
+    river is completed or only one player is left in hand).
+    """
+
+    table = self._table
+    logger.info('Number of laps: %s', self._lap_counts)
+
+    table.collect_bets()
+    for player in table.players:
+        player.reset_current_amount()
+        player.unmark_has_played()
+        player.reset_action()
+
+    if table.players_in_hand_count > 1 and self._street_index < len(sorted_street_names) - 1:
+        return start_street(self, self._street_index + 1)
+    return complete_hand(self)
+
+
+def complete_hand(self: "HandCycle"):
+
+    """
+    Assigns the best hands of the players that reach the showdown and distributes the pot.
+    """
+
+    table = self._table
+    self._current_player = None
+    self._valid_actions = None
+
+    if table.players_in_hand_count > 1:
+        common_cards = table.common_cards
+        for player in table.players_in_hand:
+            player.assign_hand(best_hand(player.cards, common_cards))
+
+    showdown(table)
+    self._is_completed = True
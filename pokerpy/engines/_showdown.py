@@ -18,8 +18,8 @@ Defines the functions to distribute the pot at the end of a cycle.
 """
 
 
-from collections import defaultdict
 from collections.abc import Sequence
+from logging import INFO
 
 
 from pokerpy.messages import msg_not_table_instance
@@ -30,14 +30,15 @@ from pokerpy.structures import Player, Table
 logger = get_logger()
 
 
-def break_tie(winners: Sequence[Player], pot: int, pot_index: int):
+def break_tie(table: Table, winners: Sequence[Player], pot: int, pot_index: int):
 
     """
     Distributes the central pot between the tied winners.
     """
 
-    pot_name = 'main pot' if pot_index == 0 else f'side pot {pot_index}'
-    logger.info(f'it is a tie for {pot_name}! winners: {", ".join([w.name for w in winners])}.')
+    if logger.isEnabledFor(INFO):
+        pot_name = 'main pot' if pot_index == 0 else f'side pot {pot_index}'
+        logger.info('it is a tie for %s! winners: %s.', pot_name, ', '.join([w.name for w in winners]))
     profit_per_winner = pot // len(winners)
     remainder = pot % len(winners)
     profit_by_winner = {winner: profit_per_winner for winner in winners}
@@ -50,11 +51,8 @@ def break_tie(winners: Sequence[Player], pot: int, pot_index: int):
 
     for winner in winners:
         profit = profit_by_winner[winner]
-        if pot_index == 0:
-            logger.info(f'{winner.name} wins {profit}.')
-        else:
-            logger.info(f'{winner.name} wins {profit}.')
-        winner.add_to_stack(profit)
+        logger.info('%s wins %s.', winner.name, profit)
+        table.award_chips(winner, profit)
 
 
 def showdown(table: Table):
@@ -66,38 +64,53 @@ def showdown(table: Table):
     if not isinstance(table, Table):
         raise TypeError(msg_not_table_instance.format(type(table).__name__))
 
-    logger.info(f'Remaining players: {", ".join(player.name for player in table.players_in_hand)}')
+    players_in_hand = table.players_in_hand
+    if logger.isEnabledFor(INFO):
+        logger.info('Remaining players: %s', ', '.join(player.name for player in players_in_hand))
+
+    # Hand strengths are computed once (a lonely player does not need to show a hand)
+
+    if len(players_in_hand) == 1:
+        strengths = [0]
+    else:
+        strengths = [player.hand.strength for player in players_in_hand]
+
+    # Side pots are resolved from the highest participation level down to the main pot: every level
+    # adds the players that put at least that amount, so the winners only need to be updated with them
+
+    split_pot = table.split_pot
+    participation_levels = sorted({player.pot_participation for player in players_in_hand})
+    seat_indices = sorted(range(len(players_in_hand)), key=lambda index: players_in_hand[index].pot_participation, reverse=True)
 
-    players_by_participation: dict[int, list[Player]] = {player.pot_participation: [] for player in table.players_in_hand}
-    for participation, participating_players in players_by_participation.items():
-        for player in table.players_in_hand:
-            if player.pot_participation >= participation:
-                participating_players.append(player)
+    winner_indices_by_pot: list[list[int]] = [[] for _ in split_pot]
+    winner_indices: list[int] = []
+    best_strength = -1
+    position = 0
 
-    for i, side_pot in enumerate(table.split_pot):
+    for pot_index in range(len(split_pot) - 1, -1, -1):
+        level = participation_levels[pot_index]
+        while position < len(seat_indices) and players_in_hand[seat_indices[position]].pot_participation >= level:
+            seat_index = seat_indices[position]
+            if strengths[seat_index] > best_strength:
+                best_strength = strengths[seat_index]
+                winner_indices = [seat_index]
+            elif strengths[seat_index] == best_strength:
+                winner_indices.append(seat_index)
+            position += 1
+        winner_indices_by_pot[pot_index] = sorted(winner_indices) ## ties keep the seating order for odd chips
 
-        winners: list[Player] = []
+    # Distribute the pots
 
-        min_pot_participation = min(players_by_participation.keys())
-        participating_players = players_by_participation.pop(min_pot_participation)
+    for i, (side_pot, winner_indices) in enumerate(zip(split_pot, winner_indices_by_pot)):
 
-        for player in participating_players:
-            player_is_unbeaten = True
-            for oponent in participating_players:
-                if oponent.name == player.name:
-                    continue
-                if oponent.hand > player.hand:
-                    player_is_unbeaten = False
-                    break
-            if player_is_unbeaten:
-                winners.append(player)
+        winners = [players_in_hand[index] for index in winner_indices]
 
         if len(winners) == 1:
             winner = winners[0]
             if i == 0:
-                logger.info(f'{winner.name} wins main pot: {side_pot}!')
+                logger.info('%s wins main pot: %s!', winner.name, side_pot)
             else:
-                logger.info(f'{winner.name} wins side pot {i}: {side_pot}!')
-            winner.add_to_stack(side_pot)
+                logger.info('%s wins side pot %s: %s!', winner.name, i, side_pot)
+            table.award_chips(winner, side_pot)
         else:
-            break_tie(winners, side_pot, i)
\ No newline at end of file
+            break_tie(table, winners, side_pot, i)
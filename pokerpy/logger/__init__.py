@@ -1,6 +1,6 @@
 """
-Namespace for the function that calls the PokerPy logger.
+Namespace for the functions that call, configure and silence the PokerPy logger.
 """
 
 
-from ._logger import get_logger
\ No newline at end of file
+from ._logger import configure_logging, get_logger, is_silent, set_silent
\ No newline at end of file
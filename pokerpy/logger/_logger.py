@@ -1,5 +1,5 @@
 """
-Defines the function that calls the PokerPy logger.
+Defines the functions that call, configure and silence the PokerPy logger.
 """
 
 
@@ -7,6 +7,11 @@ import logging
 
 
 from pokerpy.constants import LOGGER_FORMAT, LOGGER_NAME
+from pokerpy.messages import msg_not_int
+
+
+# The library only adds a handler that discards messages, so that applications decide where they go
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
 
 
 def get_logger():
@@ -15,15 +20,42 @@ def get_logger():
     Calls the PokerPy logger.
     """
 
-    logger = logging.getLogger(LOGGER_NAME)
+    return logging.getLogger(LOGGER_NAME)
+
+
+def configure_logging(level: int = logging.DEBUG):
+
+    """
+    Writes the messages of the PokerPy logger from the given level on to the standard error stream
+    (as the demos do). Calling it again only changes the level.
+    """
+
+    if not isinstance(level, int):
+        raise TypeError(msg_not_int.format(type(level).__name__))
+
+    logger = get_logger()
 
-    if not logger.hasHandlers():
+    if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
 
         formatter = logging.Formatter(LOGGER_FORMAT)
         handler = logging.StreamHandler()
         handler.setFormatter(formatter)
 
-        logger.setLevel(logging.DEBUG)
         logger.addHandler(handler)
-    
-    return logger
\ No newline at end of file
+
+    logger.setLevel(level)
+
+
+def set_silent(silent: bool = True):
+
+    """
+    Turns the PokerPy logger off (or back on). A silent logger is disabled, so the engines skip
+    building their messages and logging calls become no-ops.
+    """
+
+    get_logger().disabled = bool(silent)
+
+
+def is_silent():
+    "Whether the PokerPy logger is turned off or not."
+    return get_logger().disabled
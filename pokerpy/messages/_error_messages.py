@@ -4,39 +4,81 @@ Defines messages used to raise errors.
 
 
 # Type errors
+msg_no_players_in_hand = "at least one player is expected in hand"
 msg_no_players_in_table = "at least one player is expected in the table"
 msg_not_action_instance = "an instance of Action is expected, not {}"
+msg_not_all_callable_objects = "all entries are expected to be callable objects"
 msg_not_all_card_instances = "all entries are expected to be Card instances"
 msg_not_all_player_instances = "all entries are expected to be Player instances"
 msg_not_card_instance = "an instance of Card is expected, not {}"
+msg_not_card_set_instance = "an instance of CardSet is expected, not {}"
+msg_not_dict = "a dictionary is expected, not {}"
+msg_not_future_instance = "a future (with done and set_result methods) is expected, not {}"
 msg_not_hand_instance = "an instance of Hand is expected, not {}"
 msg_not_int = "an integer is expected, not {}"
 msg_not_iterable_object = "an iterable object is expected, not {}"
 msg_not_list = "a list is expected, not {}"
+msg_not_number = "a number is expected, not {}"
 msg_not_player_instance = "an instance of Player is expected, not {}"
+msg_not_rng_instance = "an instance of RNG is expected, not {}"
 msg_not_str = "a string is expected, not {}"
 msg_not_table_instance = "an instance of Table is expected, not {}"
 
 # General value errors
 msg_not_positive_or_zero_value = "the value must be positive or zero (received {})"
 msg_not_positive_value = "the value must be positive (received {})"
+msg_not_probability = "the value must be between 0 and 1 (received {})"
 msg_not_zero_value = "the value must be zero (received {})"
 
 # Specific value errors
 msg_amount_larger_than_stack = "the amount ({}) cannot be larger than stack ({})"
+msg_card_not_in_card_set = "the requested card is not in the card set"
 msg_card_not_in_deck = "the requested card is not in the deck"
+msg_empty_deck = "there are no cards left in the deck"
 msg_invalid_action_name = "invalid action name, must be one of the following: {}"
+msg_invalid_card_id = "invalid card id, must be an integer from 0 to 51"
+msg_invalid_card_ids_array = "an integer array of card ids from 0 to 51 with shape (N, 5), (N, 6) or (N, 7) is expected"
+msg_invalid_card_set_bitmask = "invalid card set bitmask, must be an integer from 0 to 2**52 - 1"
 msg_invalid_card_suit = "invalid card suit, must be be one of the following: {}"
 msg_invalid_card_value = "invalid card value, must be one of the following: {}"
+msg_invalid_opponents_count = "invalid number of opponents, must be an integer from 1 to {}"
+msg_invalid_preflop_equity_file = "the file is not a preflop equity table"
+msg_invalid_starting_hand_class = "invalid starting hand class '{}'"
+msg_not_enough_cards_in_deck = "there are not enough cards left in the deck to complete the board"
+msg_not_enough_players = "at least {} players are expected"
 msg_not_five_cards_hand = "a hand expects exactly five cards"
+msg_not_five_to_seven_cards = "a hand can only be figured out from five to seven cards"
+msg_not_two_hole_cards = "exactly two distinct hole cards are expected"
+msg_player_is_not_current_player = "player '{}' is not the player to act"
 msg_player_not_in_table = "player '{}' is not in the table"
+msg_player_without_cards = "player '{}' has no cards"
 msg_repeated_cards = "cards cannot be repeated"
 msg_some_players_not_in_table = "some parsed players are not in the table"
+msg_too_many_common_cards = "there cannot be more than {} common cards"
+msg_too_many_runouts = "there are {} runouts to enumerate, but at most {} are allowed (estimate the equity instead)"
 msg_wildcard = "we live in a society"
 
 # Runtime errors
+msg_betting_round_is_completed = "the betting round is already completed"
 msg_betting_round_was_not_completed = "the betting round was closed before being completed"
+msg_betting_round_was_not_started = "the betting round has not been started"
+msg_hand_cycle_is_completed = "the hand cycle is already completed"
+msg_hand_cycle_is_running = "the hand cycle is already running"
+msg_hand_cycle_was_not_completed = "the hand cycle was closed before being completed"
+msg_hand_cycle_was_not_started = "the hand cycle has not been started"
 msg_overloaded_betting_round_message = "some players could not be listened because the betting round already ended"
 
+# Import errors
+msg_missing_numpy = "NumPy is required for this feature (install it with: pip install pokerpy[numpy])"
+
 # Invalid action error
-msg_forbidden_action = "the requested action is not allowed in this situation"
\ No newline at end of file
+msg_forbidden_action = "the requested action is not allowed in this situation"
+
+# Server errors
+msg_already_seated = "the connection already has a seat at table '{}'"
+msg_invalid_server_message = "a JSON object with a known type is expected, one per line"
+msg_not_seated = "the connection has no seat, join a table first"
+msg_seat_is_taken = "the name '{}' is already taken at table '{}'"
+msg_slow_connection = "the connection was closed for not reading its messages"
+msg_table_is_full = "table '{}' is full"
+msg_table_stopped = "table '{}' stopped because of an unexpected error"
@@ -0,0 +1,9 @@
+"""
+Namespace for the game server that hosts tables over TCP.
+"""
+
+
+from ._connection import Connection
+from ._game_server import GameServer
+from ._protocol import decode_message, encode_cards, encode_message
+from ._table_room import TableRoom
@@ -0,0 +1,66 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Runs the game server from the command line: python -m pokerpy.server --port 8765 --seats 6
+"""
+
+
+from argparse import ArgumentParser
+import asyncio
+
+
+from pokerpy.constants import DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT
+
+
+from ._game_server import GameServer
+
+
+def main():
+
+    """
+    Parses the command line arguments and serves until interrupted.
+    """
+
+    parser = ArgumentParser(prog='python -m pokerpy.server', description='Hosts poker tables over TCP, speaking JSON lines.')
+    parser.add_argument('--host', default=DEFAULT_SERVER_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVER_PORT)
+    parser.add_argument('--seats', type=int, default=6, help='number of players per table')
+    parser.add_argument('--stack', type=int, default=1_000, help='starting stack of every player')
+    parser.add_argument('--big-blind', type=int, default=10)
+    parser.add_argument('--small-blind', type=int, default=5)
+    parser.add_argument('--ante', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=30.0, help='seconds a player has to act')
+    arguments = parser.parse_args()
+
+    server = GameServer(
+        arguments.host,
+        arguments.port,
+        seats=arguments.seats,
+        stack=arguments.stack,
+        big_blind=arguments.big_blind,
+        small_blind=arguments.small_blind,
+        ante=arguments.ante,
+        timeout=arguments.timeout,
+    )
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents a client connection to the game server.
+"""
+
+
+import asyncio
+from typing import TYPE_CHECKING
+
+
+from pokerpy.constants import OUTGOING_QUEUE_SIZE
+from pokerpy.logger import get_logger
+from pokerpy.messages import msg_slow_connection
+from pokerpy.structures import Player
+
+
+from ._protocol import decode_message, encode_message
+if TYPE_CHECKING:
+    from ._table_room import TableRoom
+
+
+logger = get_logger()
+
+
+class Connection:
+
+
+    """
+    Represents a client connection. Outgoing messages wait in a bounded queue that a writer task
+    drains as fast as the client reads them, so a client that stops reading fills the queue and is
+    disconnected instead of making the server buffer without limit. Incoming messages are read one
+    at a time, so a client that floods the server is slowed down by the socket itself.
+    """
+
+
+    __slots__ = ('_reader', '_writer', '_queue', '_writer_task', '_is_closed', '_room', '_player')
+
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, *, queue_size: int = OUTGOING_QUEUE_SIZE):
+
+        # Fixed variables
+        self._reader = reader
+        self._writer = writer
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(queue_size)
+        self._writer_task = asyncio.create_task(self._write_messages())
+
+        # State variables
+        self._is_closed = False
+        self._room: ("TableRoom|None") = None
+        self._player: (Player|None) = None
+
+
+    @property
+    def is_closed(self):
+        return self._is_closed
+
+    @property
+    def room(self):
+        "Table room the connection is seated at (or None if it has not joined any)."
+        return self._room
+
+    @property
+    def player(self):
+        "Player the connection acts for (or None if it has not joined any table)."
+        return self._player
+
+
+    def set_seat(self, room: "TableRoom", player: Player):
+        "Registers the table room and the player the connection acts for."
+        self._room = room
+        self._player = player
+
+
+    def send(self, message: dict):
+        "Queues a message to be written to the client."
+        self.send_encoded(encode_message(message))
+
+
+    def send_encoded(self, data: bytes):
+        "Queues an already encoded message (messages broadcast to a table are encoded once)."
+        if self._is_closed:
+            return
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning('Closing connection of %s: %s.', self._player.name if self._player else 'a client', msg_slow_connection)
+            self.close()
+
+
+    async def receive(self):
+
+        """
+        Waits for the next message of the client and retrieves it (or None if the client is gone or
+        sent a line longer than allowed). Lines that are not valid messages raise a ValueError.
+        """
+
+        try:
+            line = await self._reader.readline()
+        except (ConnectionError, ValueError):
+            return None
+        if not line:
+            return None
+        return decode_message(line)
+
+
+    def close(self, *, flush: bool = False):
+        "Closes the connection, dropping the messages that were not written yet (unless flushed)."
+        if self._is_closed:
+            return
+        self._is_closed = True
+        if self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+        if flush:
+            while not self._queue.empty():
+                self._writer.write(self._queue.get_nowait())
+        self._writer.close()
+
+
+    async def _write_messages(self):
+
+        # Every queued message is written at once, and the next ones wait for the socket to drain
+
+        try:
+            while True:
+                self._writer.write(await self._queue.get())
+                while not self._queue.empty():
+                    self._writer.write(self._queue.get_nowait())
+                await self._writer.drain()
+        except ConnectionError:
+            self.close()
@@ -0,0 +1,291 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents the game server, which hosts many tables over TCP.
+"""
+
+
+import asyncio
+
+
+from pokerpy.constants import (
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
+    MAX_MESSAGE_SIZE,
+    MESSAGE_ACTION,
+    MESSAGE_ERROR,
+    MESSAGE_JOIN,
+    MESSAGE_SEATED,
+    OUTGOING_QUEUE_SIZE,
+)
+from pokerpy.logger import get_logger
+from pokerpy.messages import (
+    msg_already_seated,
+    msg_invalid_server_message,
+    msg_not_enough_players,
+    msg_not_int,
+    msg_not_number,
+    msg_not_positive_or_zero_value,
+    msg_not_positive_value,
+    msg_not_seated,
+    msg_not_str,
+)
+from pokerpy.structures import Action
+
+
+from ._connection import Connection
+from ._table_room import TableRoom
+
+
+logger = get_logger()
+
+
+class GameServer:
+
+
+    """
+    Represents a game server that hosts many tables over TCP, all of them in a single event loop.
+
+    Clients speak JSON, one object per line. A client joins a table by its name, which is created
+    on demand and starts playing once every seat is taken, and then sends the actions of its player
+    when it is its turn. The server pushes back every change on the table: the start of each hand
+    (with the hole cards of the client only), the common cards, the turns, the actions and the
+    results. Errors are sent back as messages, and never close the connection.
+    """
+
+
+    __slots__ = (
+        '_host',
+        '_port',
+        '_seats',
+        '_stack',
+        '_big_blind',
+        '_small_blind',
+        '_ante',
+        '_timeout',
+        '_hands',
+        '_queue_size',
+        '_server',
+        '_room_by_name',
+        '_connections',
+        '_handler_tasks',
+    )
+
+
+    def __init__(
+        self,
+        host: str = DEFAULT_SERVER_HOST,
+        port: int = DEFAULT_SERVER_PORT,
+        *,
+        seats: int = 6,
+        stack: int = 1_000,
+        big_blind: int = 10,
+        small_blind: int = 5,
+        ante: int = 0,
+        timeout: (float|None) = 30.0,
+        hands: (int|None) = None,
+        queue_size: int = OUTGOING_QUEUE_SIZE,
+    ):
+
+        # Type validations
+
+        if not isinstance(host, str):
+            raise TypeError(msg_not_str.format(type(host).__name__))
+
+        for value in (port, seats, stack, big_blind, small_blind, ante, queue_size):
+            if not isinstance(value, int):
+                raise TypeError(msg_not_int.format(type(value).__name__))
+
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise TypeError(msg_not_number.format(type(timeout).__name__))
+
+        if hands is not None and not isinstance(hands, int):
+            raise TypeError(msg_not_int.format(type(hands).__name__))
+
+        # Value validations
+
+        for value in (seats, stack, big_blind, queue_size):
+            if value <= 0:
+                raise ValueError(msg_not_positive_value.format(value))
+
+        if seats < 2:
+            raise ValueError(msg_not_enough_players.format(2))
+
+        for value in (port, small_blind, ante):
+            if value < 0:
+                raise ValueError(msg_not_positive_or_zero_value.format(value))
+
+        for value in (timeout, hands):
+            if value is not None and value <= 0:
+                raise ValueError(msg_not_positive_value.format(value))
+
+        # Fixed variables
+
+        self._host = host
+        self._port = port
+        self._seats = seats
+        self._stack = stack
+        self._big_blind = big_blind
+        self._small_blind = small_blind
+        self._ante = ante
+        self._timeout = timeout
+        self._hands = hands
+        self._queue_size = queue_size
+
+        # State variables
+
+        self._server: (asyncio.Server|None) = None
+        self._room_by_name: dict[str, TableRoom] = {}
+        self._connections: set[Connection] = set()
+        self._handler_tasks: set[asyncio.Task] = set()
+
+
+    @property
+    def host(self):
+        return self._host
+
+    @property
+    def port(self):
+        "Port the server listens to (the one picked by the system if it was created with port 0)."
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def rooms(self):
+        "Table rooms hosted by the server, mapped by their names."
+        return self._room_by_name.copy()
+
+    @property
+    def connections_count(self):
+        return len(self._connections)
+
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+
+    async def __aexit__(self, exception_type: (type|None), exception: (BaseException|None), _):
+        await self.close()
+
+
+    # Methods to run the server
+
+
+    async def start(self):
+        "Starts listening for connections."
+        self._server = await asyncio.start_server(self.handle_connection, self._host, self._port, limit=MAX_MESSAGE_SIZE)
+        logger.info('Game server listening on %s:%s.', self._host, self.port)
+
+
+    async def serve_forever(self):
+        "Starts listening for connections, and keeps serving them until cancelled."
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+
+    async def close(self):
+        "Stops listening, closes every connection and waits for every table to stop."
+        if self._server is not None:
+            self._server.close()
+        for connection in list(self._connections):
+            connection.close()
+        tasks = [room.task for room in self._room_by_name.values() if room.is_running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, *self._handler_tasks, return_exceptions=True)
+        self._room_by_name.clear()
+
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+
+        """
+        Serves a connection, one message at a time, until the client is gone.
+        """
+
+        connection = Connection(reader, writer, queue_size=self._queue_size)
+        self._connections.add(connection)
+        self._handler_tasks.add(handler_task := asyncio.current_task())
+
+        try:
+            while not connection.is_closed:
+                try:
+                    message = await connection.receive()
+                    if message is None:
+                        break
+                    self.dispatch(connection, message)
+                except (TypeError, ValueError) as error:
+                    connection.send({'type': MESSAGE_ERROR, 'message': error.args[0]})
+
+        finally:
+            self._connections.discard(connection)
+            self._handler_tasks.discard(handler_task)
+            connection.close()
+            if (room := connection.room) is not None:
+                room.unseat(connection)
+                if room.is_abandoned and self._room_by_name.get(room.name) is room:
+                    del self._room_by_name[room.name]
+
+
+    def dispatch(self, connection: Connection, message: dict):
+
+        """
+        Routes a message of a client: joins take a seat at a table, and actions are requested on
+        behalf of the player of the connection.
+        """
+
+        message_type = message['type']
+
+        if message_type == MESSAGE_JOIN:
+
+            table_name = message.get('table')
+            player_name = message.get('name')
+            for value in (table_name, player_name):
+                if not isinstance(value, str):
+                    raise TypeError(msg_not_str.format(type(value).__name__))
+            if connection.room is not None:
+                raise ValueError(msg_already_seated.format(connection.room.name))
+
+            # Full tables are not replaced while their connections are around
+            room = self._room_by_name.get(table_name)
+            if room is None:
+                room = self._room_by_name[table_name] = TableRoom(
+                    table_name,
+                    seats=self._seats,
+                    stack=self._stack,
+                    big_blind=self._big_blind,
+                    small_blind=self._small_blind,
+                    ante=self._ante,
+                    timeout=self._timeout,
+                    hands=self._hands,
+                )
+            player = room.seat(connection, player_name)
+            connection.send({'type': MESSAGE_SEATED, 'table': table_name, 'name': player.name, 'seat': room.players.index(player), 'stack': player.stack})
+
+        elif message_type == MESSAGE_ACTION:
+
+            if connection.room is None:
+                raise ValueError(msg_not_seated)
+            action = Action(message.get('name'), message.get('amount', 0))
+            connection.room.request_action(connection.player, action)
+
+        else:
+            raise ValueError(msg_invalid_server_message)
@@ -0,0 +1,51 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the functions that encode and decode the messages exchanged with clients.
+"""
+
+
+import json
+
+
+from pokerpy.messages import msg_invalid_server_message
+from pokerpy.structures import Card
+
+
+def encode_message(message: dict):
+    "Encodes a message as a line of compact JSON."
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+def decode_message(line: bytes):
+
+    """
+    Decodes a line of JSON into a message, which must be an object with a type.
+    """
+
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError(msg_invalid_server_message) from None
+
+    if not isinstance(message, dict) or not isinstance(message.get('type'), str):
+        raise ValueError(msg_invalid_server_message)
+    return message
+
+
+def encode_cards(cards: list[Card]):
+    "Encodes cards as short strings (like 'As' or 'Td')."
+    return [card.value + card.suit for card in cards]
@@ -0,0 +1,311 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents a table hosted by the game server.
+"""
+
+
+import asyncio
+
+
+from pokerpy.constants import (
+    ACTION_CHECK,
+    ACTION_FOLD,
+    MESSAGE_ERROR,
+    MESSAGE_HAND,
+    MESSAGE_PLAYED,
+    MESSAGE_RESULT,
+    MESSAGE_STREET,
+    MESSAGE_TURN,
+)
+from pokerpy.engines import HandCycle, ValidActions, wait_action
+from pokerpy.logger import get_logger
+from pokerpy.messages import (
+    msg_forbidden_action,
+    msg_player_is_not_current_player,
+    msg_seat_is_taken,
+    msg_table_is_full,
+    msg_table_stopped,
+)
+from pokerpy.structures import Action, Player, Table
+
+
+from ._connection import Connection
+from ._protocol import encode_cards, encode_message
+
+
+logger = get_logger()
+
+
+class TableRoom:
+
+
+    """
+    Represents a table hosted by the game server. It seats the connections that join it and, once
+    every seat is taken, plays hands one after another in its own task, awaiting the actions of the
+    players as they arrive from the network and pushing every change to the connections.
+    """
+
+
+    __slots__ = (
+        '_name',
+        '_seats',
+        '_stack',
+        '_big_blind',
+        '_small_blind',
+        '_ante',
+        '_timeout',
+        '_hands',
+        '_players',
+        '_connection_by_player',
+        '_hand_cycle',
+        '_task',
+    )
+
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        seats: int,
+        stack: int,
+        big_blind: int,
+        small_blind: int = 0,
+        ante: int = 0,
+        timeout: (float|None) = None,
+        hands: (int|None) = None,
+    ):
+
+        # Fixed variables
+        self._name = name
+        self._seats = seats
+        self._stack = stack
+        self._big_blind = big_blind
+        self._small_blind = small_blind
+        self._ante = ante
+        self._timeout = timeout
+        self._hands = hands
+
+        # State variables
+        self._players: list[Player] = []
+        self._connection_by_player: dict[Player, Connection] = {}
+        self._hand_cycle: (HandCycle|None) = None
+        self._task: (asyncio.Task|None) = None
+
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def players(self):
+        return self._players.copy()
+
+    @property
+    def is_full(self):
+        return len(self._players) == self._seats
+
+    @property
+    def is_running(self):
+        "Whether the table is playing hands or not."
+        return self._task is not None and not self._task.done()
+
+    @property
+    def is_abandoned(self):
+        "Whether every connection seated at the table is gone or not."
+        return not self._connection_by_player
+
+    @property
+    def task(self):
+        "Task that plays the hands (or None if the table is not full yet)."
+        return self._task
+
+
+    # Methods to seat connections
+
+
+    def seat(self, connection: Connection, name: str):
+
+        """
+        Seats a connection as a new player, and starts playing hands once every seat is taken.
+        """
+
+        if self.is_full:
+            raise ValueError(msg_table_is_full.format(self._name))
+        if any(player.name == name for player in self._players):
+            raise ValueError(msg_seat_is_taken.format(name, self._name))
+
+        player = Player(name, self._stack)
+        self._players.append(player)
+        self._connection_by_player[player] = connection
+        connection.set_seat(self, player)
+
+        if self.is_full:
+            self._task = asyncio.create_task(self.run())
+            self._task.add_done_callback(self.handle_stop)
+        return player
+
+
+    def unseat(self, connection: Connection):
+
+        """
+        Forgets a connection that is gone. Its player stays at the table and checks or folds every
+        time it is to act, and the table stops once every connection is gone.
+        """
+
+        player = connection.player
+        self._connection_by_player.pop(player, None)
+
+        if self.is_abandoned and self._task is not None:
+            self._task.cancel()
+        elif self._hand_cycle is not None and self._hand_cycle.current_player == player:
+            player.request_action(get_default_action(self._hand_cycle.get_action_ranges()))
+
+
+    def handle_stop(self, task: asyncio.Task):
+
+        """
+        Logs the error that stopped the hands (if any), and tells it to the connections before
+        closing them, so that their clients do not wait for a turn that never comes.
+        """
+
+        if task.cancelled() or (error := task.exception()) is None:
+            return
+
+        logger.error('Table %s stopped.', self._name, exc_info=error)
+        self.broadcast({'type': MESSAGE_ERROR, 'message': msg_table_stopped.format(self._name)})
+        for connection in list(self._connection_by_player.values()):
+            connection.close(flush=True)
+
+
+    # Methods to play hands
+
+
+    def request_action(self, player: Player, action: Action):
+        "Requests the action of a player, as long as it is its turn and the action is allowed."
+        if self._hand_cycle is None or self._hand_cycle.current_player != player:
+            raise ValueError(msg_player_is_not_current_player.format(player.name))
+        if not self._hand_cycle.get_action_ranges().is_valid(action.name, action.amount):
+            raise ValueError(msg_forbidden_action)
+        player.request_action(action)
+
+
+    async def run(self):
+
+        """
+        Plays hands until the given number of hands is reached (or until every connection is gone),
+        moving the button one seat per hand. Players who run out of chips are topped up to the
+        starting stack.
+        """
+
+        players = self._players
+        table = Table(players, trusted=True, preshuffle_deck=True)
+        hand_cycles = [
+            HandCycle(table, big_blind=self._big_blind, small_blind=self._small_blind, ante=self._ante, small_blind_player=player, ignore_invalid_actions=False)
+            for player in players
+        ]
+
+        # Tables also stop once abandoned, since a cancellation may be lost while a player is awaited
+
+        hand_index = 0
+        while (self._hands is None or hand_index < self._hands) and not self.is_abandoned:
+
+            for player in players:
+                if player.stack == 0:
+                    player.add_to_stack(self._stack)
+
+            hand_cycle = self._hand_cycle = hand_cycles[hand_index % len(players)]
+            hand_index += 1
+
+            player = hand_cycle.start()
+            self.push_hand(hand_cycle)
+            common_cards_count = 0
+
+            while player is not None:
+
+                if len(table.common_cards) > common_cards_count:
+                    common_cards_count = len(table.common_cards)
+                    self.broadcast({'type': MESSAGE_STREET, 'street': hand_cycle.street_name, 'cards': encode_cards(table.common_cards)})
+
+                valid_actions = hand_cycle.get_action_ranges()
+                self.broadcast({
+                    'type': MESSAGE_TURN,
+                    'player': player.name,
+                    'actions': {name: list(valid_actions.get_bounds(name)) for name in valid_actions},
+                    'pot': table.central_pot,
+                })
+
+                if player in self._connection_by_player:
+                    action = await wait_action(player, valid_actions, timeout=self._timeout)
+                else:
+                    action = get_default_action(valid_actions)
+
+                acting_player = player
+                player = hand_cycle.apply_action(action)
+                self.broadcast({
+                    'type': MESSAGE_PLAYED,
+                    'player': acting_player.name,
+                    'name': action.name,
+                    'amount': action.amount,
+                    'stack': acting_player.stack,
+                })
+
+            self.push_result(table)
+            self._hand_cycle = None
+
+            # Let the connections of other tables breathe between hands
+            await asyncio.sleep(0)
+
+
+    # Methods to push changes
+
+
+    def broadcast(self, message: dict):
+        "Sends a message to every connection seated at the table, encoding it once."
+        data = encode_message(message)
+        for connection in self._connection_by_player.values():
+            connection.send_encoded(data)
+
+
+    def push_hand(self, hand_cycle: HandCycle):
+        "Sends the start of a hand to every connection, along with the hole cards of its player only."
+        stacks = {player.name: player.stack for player in self._players}
+        for player, connection in self._connection_by_player.items():
+            connection.send({
+                'type': MESSAGE_HAND,
+                'hand': hand_cycle.hands_count,
+                'small_blind_player': hand_cycle.small_blind_player.name,
+                'big_blind_player': hand_cycle.big_blind_player.name,
+                'stacks': stacks,
+                'cards': encode_cards(player.cards),
+            })
+
+
+    def push_result(self, table: Table):
+        "Sends the end of a hand: the board, the cards shown down and the stacks."
+        players_in_hand = table.players_in_hand
+        shown_cards = {player.name: encode_cards(player.cards) for player in players_in_hand} if len(players_in_hand) > 1 else {}
+        self.broadcast({
+            'type': MESSAGE_RESULT,
+            'board': encode_cards(table.common_cards),
+            'shown_cards': shown_cards,
+            'stacks': {player.name: player.stack for player in self._players},
+        })
+
+
+def get_default_action(valid_actions: ValidActions):
+    "Retrieves the action of a player who does not act: a check when possible, and a fold otherwise."
+    return Action(ACTION_CHECK) if ACTION_CHECK in valid_actions else Action(ACTION_FOLD)
@@ -0,0 +1,10 @@
+"""
+Namespace for the headless simulator that plays hands between policies.
+"""
+
+
+from ._player_result import PlayerResult
+from ._policies import Policy, RandomPolicy, passive_policy, random_policy
+from ._run_simulation import run_simulation
+from ._simulate import iter_simulation, simulate
+from ._simulation_result import SimulationResult
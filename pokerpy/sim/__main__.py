@@ -0,0 +1,88 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Runs a simulation from the command line: python -m pokerpy.sim --hands 100000 --players 6
+"""
+
+
+from argparse import ArgumentParser
+
+
+from ._policies import passive_policy, random_policy
+from ._run_simulation import run_simulation
+from ._simulate import iter_simulation
+
+
+def main():
+
+    """
+    Parses the command line arguments, plays the hands and prints the results as they are reported.
+    """
+
+    parser = ArgumentParser(prog='python -m pokerpy.sim', description='Plays hands between policies and reports their results.')
+    parser.add_argument('--hands', type=int, default=10_000, help='number of hands to play')
+    parser.add_argument('--players', type=int, default=6, help='number of players at the table')
+    parser.add_argument('--policy', choices=('passive', 'random'), default='random', help='policy of every player')
+    parser.add_argument('--stack', type=int, default=1_000, help='stack of every player before each hand')
+    parser.add_argument('--big-blind', type=int, default=10)
+    parser.add_argument('--small-blind', type=int, default=5)
+    parser.add_argument('--ante', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=None, help='seed of the deck (and of the random policies)')
+    parser.add_argument('--report-every', type=int, default=None, help='number of hands between reports')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (reports only at the end)')
+    parser.add_argument('--batch-size', type=int, default=10_000, help='number of hands per batch of a worker')
+    arguments = parser.parse_args()
+
+    policies = {}
+    for index in range(arguments.players):
+        if arguments.policy == 'passive':
+            policies[f'Player {index + 1}'] = passive_policy
+        else:
+            policy_seed = None if arguments.seed is None else f'{arguments.seed}:{index}'
+            policies[f'Player {index + 1}'] = random_policy(policy_seed)
+
+    if arguments.workers is None:
+        results = iter_simulation(
+            policies,
+            hands=arguments.hands,
+            stack=arguments.stack,
+            big_blind=arguments.big_blind,
+            small_blind=arguments.small_blind,
+            ante=arguments.ante,
+            seed=arguments.seed,
+            report_every=arguments.report_every,
+        )
+    else:
+        results = [run_simulation(
+            policies,
+            hands=arguments.hands,
+            stack=arguments.stack,
+            big_blind=arguments.big_blind,
+            small_blind=arguments.small_blind,
+            ante=arguments.ante,
+            batch_size=arguments.batch_size,
+            workers=arguments.workers,
+            seed=arguments.seed,
+        )]
+
+    for result in results:
+        print(f'{result.hands} hands in {result.elapsed_seconds:.2f} s ({result.hands_per_second:.0f} hands per second)')
+        for player_result in result.player_results:
+            print(f'    {player_result.name}: {player_result.chip_delta:+} chips, {player_result.bb_per_100:+.2f} ± {player_result.margin_of_error:.2f} bb/100')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents the results of a simulated player.
+"""
+
+
+import math
+
+
+class PlayerResult:
+
+
+    """
+    Represents the results of a simulated player: the chips won or lost over the hands, and the
+    win rate in big blinds per 100 hands with its margin of error.
+    """
+
+
+    def __init__(self, name: str, hands: int, chip_delta: int, squared_chip_delta_sum: int, big_blind: int, z_score: float):
+
+        # Fixed variables
+        self._name = name
+        self._hands = hands
+        self._chip_delta = chip_delta
+        self._squared_chip_delta_sum = squared_chip_delta_sum
+        self._big_blind = big_blind
+        self._z_score = z_score
+
+
+    @property
+    def name(self):
+        "Name of the player."
+        return self._name
+
+    @property
+    def hands(self):
+        "Number of hands played."
+        return self._hands
+
+    @property
+    def chip_delta(self):
+        "Chips won (or lost, if negative) over all the hands."
+        return self._chip_delta
+
+    @property
+    def squared_chip_delta_sum(self):
+        "Sum of the squared chips won in every hand, which the variance of the chips won derives from."
+        return self._squared_chip_delta_sum
+
+    @property
+    def mean_chip_delta(self):
+        "Chips won per hand on average."
+        return self._chip_delta / self._hands
+
+    @property
+    def bb_per_100(self):
+        "Big blinds won per 100 hands on average."
+        return self.mean_chip_delta / self._big_blind * 100
+
+    @property
+    def margin_of_error(self):
+        "Half width of the confidence interval of the big blinds won per 100 hands."
+        mean = self.mean_chip_delta
+        variance = max(self._squared_chip_delta_sum / self._hands - mean * mean, 0.0)
+        return self._z_score * math.sqrt(variance / self._hands) / self._big_blind * 100
+
+
+    def __repr__(self):
+        return (
+            f'PlayerResult(name={self.name}, hands={self.hands}, chip_delta={self.chip_delta}, '
+            f'bb_per_100={self.bb_per_100:.2f}, margin_of_error={self.margin_of_error:.2f})'
+        )
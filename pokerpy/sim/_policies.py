@@ -0,0 +1,87 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the policies that choose the actions of the simulated players.
+"""
+
+
+from collections.abc import Callable
+import random
+
+
+from pokerpy.constants import ACTION_CALL, ACTION_CHECK
+from pokerpy.engines import ValidActions
+from pokerpy.structures import Action, Player, Table
+
+
+# Stateful policies may also define a reseed(seed) method, which the runner calls on its fresh copies
+# of the policies with a seed of their own for every batch
+Policy = Callable[[Player, ValidActions, Table], Action]
+
+
+def passive_policy(player: Player, valid_actions: ValidActions, table: Table):
+    "Checks when possible, and calls otherwise."
+    if ACTION_CHECK in valid_actions:
+        return Action(ACTION_CHECK)
+    return Action(ACTION_CALL, valid_actions.get_bounds(ACTION_CALL)[0])
+
+
+class RandomPolicy:
+
+
+    """
+    Policy that chooses a random valid action, and a random amount for it. It is a class rather
+    than a closure so that it can be pickled and sent to worker processes.
+    """
+
+
+    __slots__ = ('_seed', '_random')
+
+
+    def __init__(self, seed: (int|str|None) = None):
+
+        # Fixed variables
+        self._seed = seed
+
+        # Dynamic variables
+        self._random = random.Random(seed)
+
+
+    @property
+    def seed(self):
+        "Seed the random choices start from."
+        return self._seed
+
+
+    def reseed(self, seed: (int|str)):
+        "Starts the random choices over from another seed."
+        self._seed = seed
+        self._random.seed(seed)
+
+
+    def __call__(self, player: Player, valid_actions: ValidActions, table: Table):
+        action_name = self._random.choice(list(valid_actions))
+        smallest_amount, largest_amount = valid_actions.get_bounds(action_name)
+        return Action(action_name, self._random.randint(smallest_amount, largest_amount))
+
+
+    def __repr__(self):
+        return f'RandomPolicy(seed={self._seed})'
+
+
+def random_policy(seed: (int|str|None) = None) -> Policy:
+    "Builds a policy that chooses a random valid action, and a random amount for it."
+    return RandomPolicy(seed)
@@ -0,0 +1,172 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that plays hands between policies across a process pool.
+"""
+
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import pickle
+import random
+from statistics import NormalDist
+from time import perf_counter
+
+
+from pokerpy.messages import msg_not_int, msg_not_positive_value
+
+
+from ._player_result import PlayerResult
+from ._policies import Policy
+from ._simulate import simulate, validate_simulation_arguments
+from ._simulation_result import SimulationResult
+
+
+def load_batch_policies(pickled_policies: bytes, policy_seed: str):
+
+    """
+    Builds fresh copies of the policies for a batch, reseeding the ones that can be reseeded with a
+    seed derived from the batch and the name of their player, so that batches do not repeat the
+    same decisions.
+    """
+
+    policies: dict[str, Policy] = pickle.loads(pickled_policies)
+    for name, policy in policies.items():
+        if callable(reseed := getattr(policy, 'reseed', None)):
+            reseed(f'{policy_seed}:{name}')
+    return policies
+
+
+def run_simulation_batch(
+    pickled_policies: bytes,
+    policy_seed: str,
+    hands: int,
+    stack: int,
+    big_blind: int,
+    small_blind: int,
+    ante: int,
+    seed: int,
+):
+
+    """
+    Plays a batch of hands with fresh copies of the policies, and retrieves the chip deltas and the
+    squared chip delta sums of every player. It runs in worker processes, so it only deals with
+    plain values.
+    """
+
+    policies = load_batch_policies(pickled_policies, policy_seed)
+    result = simulate(policies, hands=hands, stack=stack, big_blind=big_blind, small_blind=small_blind, ante=ante, seed=seed)
+    return (
+        [player_result.chip_delta for player_result in result.player_results],
+        [player_result.squared_chip_delta_sum for player_result in result.player_results],
+    )
+
+
+def run_simulation(
+    policies: dict[str, Policy],
+    *,
+    hands: int,
+    stack: int,
+    big_blind: int,
+    small_blind: int = 0,
+    ante: int = 0,
+    batch_size: int = 10_000,
+    workers: (int|None) = None,
+    seed: (int|None) = None,
+    confidence_level: float = 0.95,
+):
+
+    """
+    Plays hands between policies across a process pool, and retrieves the aggregated results once
+    all the hands are played.
+
+    Hands are split into batches, each one played on its own table with a seed derived from the
+    master seed and with fresh copies of the policies (which must be picklable, and are reseeded
+    per batch when they define a reseed method), and sharded across a process pool (or run in this
+    process when workers is 1). Chip deltas are integers, so merging the batches is exact and the
+    result only depends on the seed and the batch size, never on the number of workers.
+    """
+
+    # Validate input
+
+    validate_simulation_arguments(policies, stack, big_blind, small_blind, ante, confidence_level)
+
+    for value in (hands, batch_size):
+        if not isinstance(value, int):
+            raise TypeError(msg_not_int.format(type(value).__name__))
+        if value <= 0:
+            raise ValueError(msg_not_positive_value.format(value))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int):
+        raise TypeError(msg_not_int.format(type(workers).__name__))
+    if workers <= 0:
+        raise ValueError(msg_not_positive_value.format(workers))
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if not isinstance(seed, int):
+        raise TypeError(msg_not_int.format(type(seed).__name__))
+
+    batch_hands = [min(batch_size, hands - start) for start in range(0, hands, batch_size)]
+    z_score = NormalDist().inv_cdf((1 + confidence_level) / 2)
+
+    # Aggregated deltas
+
+    names = list(policies)
+    chip_deltas = [0] * len(names)
+    squared_chip_delta_sums = [0] * len(names)
+
+    def merge(batch_totals: tuple[list[int], list[int]]):
+        for totals, batch_values in zip((chip_deltas, squared_chip_delta_sums), batch_totals):
+            for index, value in enumerate(batch_values):
+                totals[index] += value
+
+    # Every batch has its own seed, so results do not depend on the number of workers
+
+    pickled_policies = pickle.dumps(policies)
+    batch_arguments = [
+        (pickled_policies, f'{seed}:{batch_index}', count, stack, big_blind, small_blind, ante, random.Random(f'{seed}:{batch_index}').getrandbits(64))
+        for batch_index, count in enumerate(batch_hands)
+    ]
+
+    started_at = perf_counter()
+
+    if workers == 1 or len(batch_arguments) == 1:
+        for arguments in batch_arguments:
+            merge(run_simulation_batch(*arguments))
+
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending_arguments = deque(batch_arguments)
+            futures: deque[Future] = deque()
+            while pending_arguments or futures:
+                while pending_arguments and len(futures) < 2 * workers:
+                    futures.append(executor.submit(run_simulation_batch, *pending_arguments.popleft()))
+                merge(futures.popleft().result())
+
+    # Build results
+
+    return SimulationResult(
+        hands,
+        perf_counter() - started_at,
+        tuple(
+            PlayerResult(name, hands, chip_deltas[index], squared_chip_delta_sums[index], big_blind, z_score)
+            for index, name in enumerate(names)
+        ),
+    )
@@ -0,0 +1,225 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the functions that play hands between policies and aggregate their results.
+"""
+
+
+from collections.abc import Generator
+import random
+from statistics import NormalDist
+from time import perf_counter
+
+
+from pokerpy.engines import HandCycle
+from pokerpy.logger import is_silent, set_silent
+from pokerpy.messages import (
+    msg_not_all_callable_objects,
+    msg_not_dict,
+    msg_not_enough_players,
+    msg_not_int,
+    msg_not_number,
+    msg_not_positive_or_zero_value,
+    msg_not_positive_value,
+    msg_not_probability,
+)
+from pokerpy.structures import Player, SeededRNG, Table
+
+
+from ._player_result import PlayerResult
+from ._policies import Policy
+from ._simulation_result import SimulationResult
+
+
+def validate_simulation_arguments(
+    policies: dict[str, Policy],
+    stack: int,
+    big_blind: int,
+    small_blind: int,
+    ante: int,
+    confidence_level: float,
+):
+
+    """
+    Validates the policies, the table configuration and the confidence level of a simulation.
+    """
+
+    if not isinstance(policies, dict):
+        raise TypeError(msg_not_dict.format(type(policies).__name__))
+    if len(policies) < 2:
+        raise ValueError(msg_not_enough_players.format(2))
+    if not all(callable(policy) for policy in policies.values()):
+        raise TypeError(msg_not_all_callable_objects)
+
+    for value in (stack, big_blind, small_blind, ante):
+        if not isinstance(value, int):
+            raise TypeError(msg_not_int.format(type(value).__name__))
+    for value in (stack, big_blind):
+        if value <= 0:
+            raise ValueError(msg_not_positive_value.format(value))
+    for value in (small_blind, ante):
+        if value < 0:
+            raise ValueError(msg_not_positive_or_zero_value.format(value))
+
+    if not isinstance(confidence_level, (int, float)):
+        raise TypeError(msg_not_number.format(type(confidence_level).__name__))
+    if not 0 < confidence_level < 1:
+        raise ValueError(msg_not_probability.format(confidence_level))
+
+
+def iter_simulation(
+    policies: dict[str, Policy],
+    *,
+    hands: int,
+    stack: int,
+    big_blind: int,
+    small_blind: int = 0,
+    ante: int = 0,
+    seed: (int|None) = None,
+    report_every: (int|None) = None,
+    confidence_level: float = 0.95,
+) -> Generator[SimulationResult]:
+
+    """
+    Plays hands between policies, one seat per policy, and yields the aggregated results every
+    given number of hands and once all the hands are played.
+
+    A policy is called with the player to act, its valid actions and the table, and returns the
+    action to apply. The button moves one seat per hand, stacks are reset before every hand and
+    the logger is turned off while playing. Cards are dealt from a seeded deck, so a seed and a set
+    of deterministic policies always play the same hands.
+    """
+
+    # Validate input
+
+    validate_simulation_arguments(policies, stack, big_blind, small_blind, ante, confidence_level)
+
+    if report_every is None:
+        report_every = hands
+
+    for value in (hands, report_every):
+        if not isinstance(value, int):
+            raise TypeError(msg_not_int.format(type(value).__name__))
+        if value <= 0:
+            raise ValueError(msg_not_positive_value.format(value))
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if not isinstance(seed, int):
+        raise TypeError(msg_not_int.format(type(seed).__name__))
+
+    z_score = NormalDist().inv_cdf((1 + confidence_level) / 2)
+
+    # The table trusts the engines and deals from a preshuffled seeded deck
+
+    players = [Player(name, stack) for name in policies]
+    table = Table(players, trusted=True, preshuffle_deck=True, rng=SeededRNG(seed))
+    policy_by_player = {player: policies[player.name] for player in players}
+
+    # Every seat posts the small blind in turns, with its own hand cycle
+
+    hand_cycles = [
+        HandCycle(table, big_blind=big_blind, small_blind=small_blind, ante=ante, small_blind_player=player, ignore_invalid_actions=False)
+        for player in players
+    ]
+
+    # Aggregated deltas
+
+    players_count = len(players)
+    chip_deltas = [0] * players_count
+    squared_chip_delta_sums = [0] * players_count
+
+    def build_result(hands_played: int, elapsed_seconds: float):
+        return SimulationResult(
+            hands_played,
+            elapsed_seconds,
+            tuple(
+                PlayerResult(player.name, hands_played, chip_deltas[index], squared_chip_delta_sums[index], big_blind, z_score)
+                for index, player in enumerate(players)
+            ),
+        )
+
+    was_silent = is_silent()
+    set_silent()
+
+    try:
+
+        elapsed_seconds = 0.0
+        started_at = perf_counter()
+
+        for hand_index in range(hands):
+
+            for player in players:
+                if player.stack < stack:
+                    player.add_to_stack(stack - player.stack)
+                elif player.stack > stack:
+                    player.remove_from_stack(player.stack - stack)
+
+            hand_cycle = hand_cycles[hand_index % players_count]
+            player = hand_cycle.start()
+            while player is not None:
+                action = policy_by_player[player](player, hand_cycle.get_action_ranges(), table)
+                player = hand_cycle.apply_action(action)
+
+            for index, player in enumerate(players):
+                chip_delta = player.stack - stack
+                chip_deltas[index] += chip_delta
+                squared_chip_delta_sums[index] += chip_delta * chip_delta
+
+            # The clock stops while the caller handles a report
+
+            hands_played = hand_index + 1
+            if hands_played % report_every == 0 or hands_played == hands:
+                elapsed_seconds += perf_counter() - started_at
+                set_silent(was_silent)
+                yield build_result(hands_played, elapsed_seconds)
+                set_silent()
+                started_at = perf_counter()
+
+    finally:
+        set_silent(was_silent)
+
+
+def simulate(
+    policies: dict[str, Policy],
+    *,
+    hands: int,
+    stack: int,
+    big_blind: int,
+    small_blind: int = 0,
+    ante: int = 0,
+    seed: (int|None) = None,
+    confidence_level: float = 0.95,
+):
+
+    """
+    Plays hands between policies and retrieves the aggregated results once all the hands are
+    played (see iter_simulation).
+    """
+
+    for result in iter_simulation(
+        policies,
+        hands=hands,
+        stack=stack,
+        big_blind=big_blind,
+        small_blind=small_blind,
+        ante=ante,
+        seed=seed,
+        confidence_level=confidence_level,
+    ):
+        pass
+
+    return result
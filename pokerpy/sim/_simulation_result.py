@@ -0,0 +1,70 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents the aggregated results of a simulation.
+"""
+
+
+from ._player_result import PlayerResult
+
+
+class SimulationResult:
+
+
+    """
+    Represents the aggregated results of a simulation after a number of hands.
+    """
+
+
+    def __init__(self, hands: int, elapsed_seconds: float, player_results: tuple[PlayerResult, ...]):
+
+        # Fixed variables
+        self._hands = hands
+        self._elapsed_seconds = elapsed_seconds
+        self._player_results = player_results
+
+
+    @property
+    def hands(self):
+        "Number of hands played."
+        return self._hands
+
+    @property
+    def elapsed_seconds(self):
+        "Seconds spent playing the hands."
+        return self._elapsed_seconds
+
+    @property
+    def hands_per_second(self):
+        "Number of hands played per second."
+        return self._hands / self._elapsed_seconds if self._elapsed_seconds > 0 else float('inf')
+
+    @property
+    def player_results(self):
+        "Results of every player, following the seating order."
+        return self._player_results
+
+
+    def get_player_result(self, name: str):
+        "Retrieves the results of a player by its name."
+        for player_result in self._player_results:
+            if player_result.name == name:
+                return player_result
+        raise KeyError(name)
+
+
+    def __repr__(self):
+        return f'SimulationResult(hands={self.hands}, hands_per_second={self.hands_per_second:.0f})'
@@ -6,11 +6,21 @@ Namespace for structure-like classes.
 from ._action import Action
 
 from ._card import Card
+from ._card_set import CardSet
 
 from ._hand._hand import Hand
+from ._hand._best_hand import best_hand, evaluate_best_card_ids, pick_best_card_ids
 from ._hand._arrange_cards import arrange_cards
 from ._hand._get_category import get_category
+from ._hand._evaluate_cards import evaluate_card_ids, evaluate_cards, get_strength_category
+from ._hand._evaluate_batch import evaluate_batch
 
 from ._player import Player
 
-from ._table._table import Table
\ No newline at end of file
+from ._rng._hand_header import HandHeader
+from ._rng._rng import CryptoRNG, RNG
+from ._rng._scripted_deck import ScriptedDeck
+from ._rng._seeded_rng import SeededRNG
+
+from ._table._table import Table
+from ._table._trusted_mode import get_trusted_mode, set_trusted_mode
\ No newline at end of file
@@ -40,6 +40,9 @@ class Action:
     """
 
 
+    __slots__ = ('_name', '_amount')
+
+
     def __init__(self, name: str, amount: int = 0):
 
         # Check types
@@ -25,8 +25,10 @@ from pokerpy.constants import (
     unicode_code_point_by_card_suit,
 )
 from pokerpy.messages import (
+    msg_invalid_card_id,
     msg_invalid_card_suit,
     msg_invalid_card_value,
+    msg_not_int,
     msg_not_str,
     msg_wildcard,
 )
@@ -37,10 +39,17 @@ class Card:
 
     """
     Represents a poker card.
+
+    There are only 52 instances of this class: instantiating a card retrieves the interned instance
+    that has its value and suit. Each card is identified by an integer id from 0 to 51, which is its
+    position in a deck sorted from lowest to highest value and from lowest to highest suit.
     """
 
 
-    def __init__(self, value: str, suit: str):
+    __slots__ = ('_id', '_value', '_suit')
+
+
+    def __new__(cls, value: str, suit: str):
 
         # Check types
         if not isinstance(value, str):
@@ -48,6 +57,11 @@ class Card:
         if not isinstance(suit, str):
             raise TypeError(msg_not_str.format(type(suit).__name__))
 
+        # Retrieve interned card right away when parsed as expected
+        card = card_by_value_and_suit.get((value, suit))
+        if card is not None:
+            return card
+
         # Convert cases
         value = value.upper()
         suit = suit.lower()
@@ -62,10 +76,23 @@ class Card:
             message = msg_invalid_card_suit.format(', '.join(sorted_card_suits))
             raise ValueError(message)
 
-        # Fixed variables
-        self._value = value
-        self._suit = suit
+        return card_by_value_and_suit[(value, suit)]
+
 
+    @classmethod
+    def from_id(cls, card_id: int):
+        "Retrieves the card identified by an integer from 0 to 51."
+        if not isinstance(card_id, int):
+            raise TypeError(msg_not_int.format(type(card_id).__name__))
+        if not 0 <= card_id < 52:
+            raise ValueError(msg_invalid_card_id)
+        return sorted_deck[card_id]
+
+
+    @property
+    def id(self):
+        "Integer from 0 to 51 that identifies the card."
+        return self._id
 
     @property
     def value(self):
@@ -86,8 +113,13 @@ class Card:
         return f'[{self.value}{pretty_suit}]'
 
 
+    def __reduce__(self):
+        # Unpickled and copied cards are the interned ones as well
+        return (Card, (self.value, self.suit))
+
+
     def __hash__(self):
-        return hash((Card, self.value, self.suit))
+        return self._id
 
 
     def __eq__(self, other):
@@ -95,7 +127,7 @@ class Card:
         if not isinstance(other, Card):
             return NotImplemented
 
-        return (self.value == other.value) and (self.suit == other.suit)
+        return self._id == other._id
 
 
     def get_deck_position(self):
@@ -103,5 +135,20 @@ class Card:
         Retrieves the position of the card in a deck that is sorted from lowest value to highest
         value, and from lowest suit to highest suit.
         """
-        value_and_suit = (self.value, self.suit)
-        return full_sorted_values_and_suits.index(value_and_suit)
\ No newline at end of file
+        return self._id
+
+
+def intern_card(card_id: int):
+
+    """
+    Creates the only instance of a card.
+    """
+
+    card = object.__new__(Card)
+    card._id = card_id
+    card._value, card._suit = full_sorted_values_and_suits[card_id]
+    return card
+
+
+sorted_deck: tuple[Card, ...] = tuple(intern_card(card_id) for card_id in range(len(full_sorted_values_and_suits)))
+card_by_value_and_suit = {(card.value, card.suit): card for card in sorted_deck}
@@ -0,0 +1,207 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that represents a set of cards stored as a bitmask.
+"""
+
+
+from collections.abc import Iterable
+
+
+from pokerpy.messages import (
+    msg_card_not_in_card_set,
+    msg_invalid_card_set_bitmask,
+    msg_not_all_card_instances,
+    msg_not_card_instance,
+    msg_not_card_set_instance,
+    msg_not_int,
+    msg_not_iterable_object,
+)
+
+
+from ._card import Card, sorted_deck
+
+
+full_deck_bitmask = (1 << len(sorted_deck)) - 1
+
+
+class CardSet:
+
+
+    """
+    Represents a set of cards stored as a bitmask, where the bit at position N is set if the card
+    with id N belongs to the set. Membership, insertion and removal take constant time, and cards
+    are iterated from lowest to highest id.
+    """
+
+
+    __slots__ = ('_bitmask',)
+
+
+    def __init__(self, cards: Iterable[Card] = ()):
+
+        # Check input type
+        if not isinstance(cards, Iterable):
+            raise TypeError(msg_not_iterable_object.format(type(cards).__name__))
+
+        bitmask = 0
+        for card in cards:
+            if not isinstance(card, Card):
+                raise TypeError(msg_not_all_card_instances)
+            bitmask |= 1 << card.id
+
+        self._bitmask = bitmask
+
+
+    @classmethod
+    def from_bitmask(cls, bitmask: int):
+        "Creates a card set from a bitmask of card ids."
+        if not isinstance(bitmask, int):
+            raise TypeError(msg_not_int.format(type(bitmask).__name__))
+        if not 0 <= bitmask <= full_deck_bitmask:
+            raise ValueError(msg_invalid_card_set_bitmask)
+        card_set = cls.__new__(cls)
+        card_set._bitmask = bitmask
+        return card_set
+
+
+    @classmethod
+    def full_deck(cls):
+        "Creates a card set with all the cards."
+        return cls.from_bitmask(full_deck_bitmask)
+
+
+    @property
+    def bitmask(self):
+        "Integer whose set bits are the ids of the cards in the set."
+        return self._bitmask
+
+
+    def __repr__(self):
+        return f'CardSet({", ".join(repr(card) for card in self)})'
+
+
+    def __str__(self):
+        return ''.join(str(card) for card in self)
+
+
+    def __len__(self):
+        return self._bitmask.bit_count()
+
+
+    def __bool__(self):
+        return self._bitmask != 0
+
+
+    def __contains__(self, card: Card):
+        if not isinstance(card, Card):
+            return False
+        return (self._bitmask >> card.id) & 1 == 1
+
+
+    def __iter__(self):
+        for card_id in self.iter_card_ids():
+            yield sorted_deck[card_id]
+
+
+    __hash__ = None
+
+
+    def __eq__(self, other):
+
+        if not isinstance(other, CardSet):
+            return NotImplemented
+
+        return self._bitmask == other._bitmask
+
+
+    def __or__(self, other):
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return CardSet.from_bitmask(self._bitmask | other._bitmask)
+
+
+    def __and__(self, other):
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return CardSet.from_bitmask(self._bitmask & other._bitmask)
+
+
+    def __sub__(self, other):
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return CardSet.from_bitmask(self._bitmask & ~other._bitmask)
+
+
+    # Methods to read the set
+
+
+    def iter_card_ids(self):
+        "Iterates over the ids of the cards in the set, from lowest to highest."
+        bitmask = self._bitmask
+        while bitmask:
+            lowest_bit = bitmask & -bitmask
+            yield lowest_bit.bit_length() - 1
+            bitmask ^= lowest_bit
+
+
+    def isdisjoint(self, other: "CardSet"):
+        "Whether the set has no cards in common with another set."
+        if not isinstance(other, CardSet):
+            raise TypeError(msg_not_card_set_instance.format(type(other).__name__))
+        return self._bitmask & other._bitmask == 0
+
+
+    def copy(self):
+        "Retrieves a new set with the same cards."
+        return CardSet.from_bitmask(self._bitmask)
+
+
+    # Methods to affect the set
+
+
+    def add(self, card: Card):
+        "Adds a card to the set (nothing happens if the card is already there)."
+        if not isinstance(card, Card):
+            raise TypeError(msg_not_card_instance.format(type(card).__name__))
+        self._bitmask |= 1 << card.id
+
+
+    def remove(self, card: Card):
+        "Removes a card from the set, which is expected to be there."
+        if not isinstance(card, Card):
+            raise TypeError(msg_not_card_instance.format(type(card).__name__))
+        bit = 1 << card.id
+        if not self._bitmask & bit:
+            raise ValueError(msg_card_not_in_card_set)
+        self._bitmask ^= bit
+
+
+    def discard(self, card: Card):
+        "Removes a card from the set if it is there."
+        if not isinstance(card, Card):
+            raise TypeError(msg_not_card_instance.format(type(card).__name__))
+        self._bitmask &= ~(1 << card.id)
+
+
+    def clear(self):
+        "Removes all the cards from the set."
+        self._bitmask = 0
+
+
+    def fill(self):
+        "Adds all the cards of the deck to the set."
+        self._bitmask = full_deck_bitmask
@@ -0,0 +1,187 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that figures out the best hand that can be made from the hole cards and the
+common cards.
+"""
+
+
+from collections.abc import Iterable
+
+
+from pokerpy import constants
+from pokerpy.messages import (
+    msg_not_five_to_seven_cards,
+    msg_not_iterable_object,
+    msg_repeated_cards,
+)
+
+
+from .._card import Card, sorted_deck
+from .._card_set import CardSet
+from ._evaluate_cards import evaluate_card_ids
+from ._hand import Hand
+
+
+def get_straight_top(bitmask: int):
+
+    """
+    Retrieves the index of the highest value of the best straight contained in a values bitmask, or
+    None if there is no straight.
+    """
+
+    for top_index in range(12, 3, -1):
+        straight_bitmask = 0b11111 << (top_index - 4)
+        if bitmask & straight_bitmask == straight_bitmask:
+            return top_index
+
+    wheel_bitmask = 0b1000000001111 # A5432
+    if bitmask & wheel_bitmask == wheel_bitmask:
+        return 3
+
+    return None
+
+
+straight_top_by_bitmask = tuple(get_straight_top(bitmask) for bitmask in range(1 << 13))
+
+
+def get_straight_value_indices(top_index: int):
+    "Retrieves the value indices of a straight from its highest value index (aces may close a wheel)."
+    return [index % 13 for index in range(top_index, top_index - 5, -1)]
+
+
+def pick_best_card_ids(card_ids: Iterable[int]):
+
+    """
+    Picks the ids of the five cards that make the best hand out of five to seven distinct card ids,
+    looking at all the cards in one pass instead of comparing every five-card combination.
+    """
+
+    # Group card ids by value (from highest to lowest) and by suit
+
+    ids_by_value_index: list[list[int]] = [[] for _ in constants.sorted_card_values]
+    ids_by_suit_index: list[list[int]] = [[] for _ in constants.sorted_card_suits]
+
+    for card_id in card_ids:
+        ids_by_value_index[card_id >> 2].append(card_id)
+        ids_by_suit_index[card_id & 3].append(card_id)
+
+    # With seven cards at most, only one suit can make a flush
+
+    flush_ids: (list[int]|None) = None
+    for suit_ids in ids_by_suit_index:
+        if len(suit_ids) >= 5:
+            flush_ids = suit_ids
+            break
+
+    # Straight flush
+
+    if flush_ids is not None:
+        flush_id_by_value_index = {card_id >> 2: card_id for card_id in flush_ids}
+        flush_bitmask = sum(1 << index for index in flush_id_by_value_index)
+        top_index = straight_top_by_bitmask[flush_bitmask]
+        if top_index is not None:
+            return [flush_id_by_value_index[index] for index in get_straight_value_indices(top_index)]
+
+    # Values grouped by how many times they are repeated (from highest to lowest value)
+
+    descending_indices = range(12, -1, -1)
+    quads = [index for index in descending_indices if len(ids_by_value_index[index]) == 4]
+    trips = [index for index in descending_indices if len(ids_by_value_index[index]) == 3]
+    pairs = [index for index in descending_indices if len(ids_by_value_index[index]) == 2]
+
+    def pick_kickers(used_indices: list[int], count: int):
+        kickers: list[int] = []
+        for index in descending_indices:
+            if index in used_indices:
+                continue
+            for card_id in ids_by_value_index[index]:
+                if len(kickers) == count:
+                    return kickers
+                kickers.append(card_id)
+        return kickers
+
+    # Four of a kind
+
+    if quads:
+        return [*ids_by_value_index[quads[0]], *pick_kickers(quads[:1], 1)]
+
+    # Full house (a second three of a kind may act as the pair)
+
+    if trips and (len(trips) > 1 or pairs):
+        pair_index = max(trips[1:] + pairs)
+        return [*ids_by_value_index[trips[0]], *ids_by_value_index[pair_index][:2]]
+
+    # Flush
+
+    if flush_ids is not None:
+        return sorted(flush_ids, reverse=True)[:5]
+
+    # Straight
+
+    values_bitmask = sum(1 << index for index in descending_indices if ids_by_value_index[index])
+    top_index = straight_top_by_bitmask[values_bitmask]
+    if top_index is not None:
+        return [ids_by_value_index[index][0] for index in get_straight_value_indices(top_index)]
+
+    # Three of a kind
+
+    if trips:
+        return [*ids_by_value_index[trips[0]], *pick_kickers(trips[:1], 2)]
+
+    # Two pair (a third pair may act as the kicker)
+
+    if len(pairs) >= 2:
+        return [*ids_by_value_index[pairs[0]], *ids_by_value_index[pairs[1]], *pick_kickers(pairs[:2], 1)]
+
+    # One pair
+
+    if pairs:
+        return [*ids_by_value_index[pairs[0]], *pick_kickers(pairs[:1], 3)]
+
+    # High card
+
+    return pick_kickers([], 5)
+
+
+def evaluate_best_card_ids(card_ids: Iterable[int]):
+    "Retrieves the strength of the best hand that can be made from five to seven distinct card ids."
+    return evaluate_card_ids(pick_best_card_ids(card_ids))
+
+
+def best_hand(hole_cards: Iterable[Card], board: Iterable[Card] = ()):
+
+    """
+    Figures out the best hand that can be made from the hole cards and the common cards.
+    """
+
+    # Validate input
+
+    for cards in (hole_cards, board):
+        if not isinstance(cards, Iterable):
+            raise TypeError(msg_not_iterable_object.format(type(cards).__name__))
+
+    cards = [*hole_cards, *board]
+    card_set = CardSet(cards)
+
+    if not 5 <= len(cards) <= 7:
+        raise ValueError(msg_not_five_to_seven_cards)
+    if len(cards) != len(card_set):
+        raise ValueError(msg_repeated_cards)
+
+    # Build the hand from the best five cards
+
+    return Hand(sorted_deck[card_id] for card_id in pick_best_card_ids(card_set.iter_card_ids()))
@@ -0,0 +1,150 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that evaluates many rows of card ids at once with NumPy.
+"""
+
+
+from functools import cache
+from itertools import combinations
+
+
+from pokerpy import constants
+from pokerpy.messages import (
+    msg_invalid_card_ids_array,
+    msg_missing_numpy,
+    msg_repeated_cards,
+)
+
+
+from ._evaluate_cards import get_lookup_tables, prime_by_value_index
+
+
+# Rows are evaluated in chunks to bound the memory used by the five-card combinations
+ROWS_PER_CHUNK = 1 << 15
+
+
+def import_numpy():
+
+    """
+    Imports NumPy when it is first needed, since it is an optional dependency that importing PokerPy
+    (and every worker process) should not pay for.
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(msg_missing_numpy) from None
+    return numpy
+
+
+@cache
+def get_lookup_arrays():
+
+    """
+    Converts the evaluator lookup tables into arrays.
+    """
+
+    np = import_numpy()
+    strength_by_prime_product, strength_by_flush_bitmask, category_by_strength = get_lookup_tables()
+
+    flush_strengths = np.full(1 << 13, -1, dtype=np.int32)
+    for bitmask, strength in strength_by_flush_bitmask.items():
+        flush_strengths[bitmask] = strength
+
+    sorted_products = sorted(strength_by_prime_product)
+    products = np.array(sorted_products, dtype=np.int64)
+    product_strengths = np.array([strength_by_prime_product[product] for product in sorted_products], dtype=np.int32)
+
+    category_indices = np.array(
+        [constants.sorted_hand_categories.index(category) for category in category_by_strength],
+        dtype=np.int8,
+    )
+
+    return (
+        np.array(prime_by_value_index, dtype=np.int64),
+        flush_strengths,
+        products,
+        product_strengths,
+        category_indices,
+    )
+
+
+def evaluate_five_card_rows(card_ids):
+
+    """
+    Evaluates an (N, 5) array of card ids into an array of hand strengths.
+    """
+
+    np = import_numpy()
+    primes, flush_strengths, products, product_strengths, _ = get_lookup_arrays()
+
+    value_indices = card_ids >> 2
+    suit_indices = card_ids & 3
+
+    is_flush = (suit_indices == suit_indices[:, :1]).all(axis=1)
+    bitmasks = np.bitwise_or.reduce(np.left_shift(1, value_indices), axis=1)
+    prime_products = primes[value_indices].prod(axis=1)
+
+    # Flush bitmasks are looked up directly, and prime products by binary search
+    product_positions = np.searchsorted(products, prime_products)
+    np.minimum(product_positions, len(products) - 1, out=product_positions)
+
+    return np.where(is_flush, flush_strengths[bitmasks], product_strengths[product_positions])
+
+
+def evaluate_batch(card_ids):
+
+    """
+    Evaluates an (N, 5), (N, 6) or (N, 7) array of card ids, where each row holds the cards of a
+    player, into two arrays of length N: the strengths of the best hand of every row (ordered the
+    same way Hand instances are) and the indices of their categories in the sorted hand categories.
+    """
+
+    np = import_numpy()
+
+    # Validate input
+
+    card_ids = np.asarray(card_ids)
+
+    if (
+        card_ids.ndim != 2
+        or not 5 <= card_ids.shape[1] <= 7
+        or not np.issubdtype(card_ids.dtype, np.integer)
+    ):
+        raise ValueError(msg_invalid_card_ids_array)
+
+    card_ids = card_ids.astype(np.int64)
+    if card_ids.size and (card_ids.min() < 0 or card_ids.max() > 51):
+        raise ValueError(msg_invalid_card_ids_array)
+
+    sorted_card_ids = np.sort(card_ids, axis=1)
+    if (sorted_card_ids[:, 1:] == sorted_card_ids[:, :-1]).any():
+        raise ValueError(msg_repeated_cards)
+
+    # Evaluate every five-card combination of every row and keep the best one
+
+    combination_indices = np.array(list(combinations(range(card_ids.shape[1]), 5)), dtype=np.intp)
+    strengths = np.empty(len(card_ids), dtype=np.int32)
+
+    for start in range(0, len(card_ids), ROWS_PER_CHUNK):
+        chunk = card_ids[start:start + ROWS_PER_CHUNK]
+        combination_rows = chunk[:, combination_indices].reshape(-1, 5)
+        combination_strengths = evaluate_five_card_rows(combination_rows).reshape(len(chunk), -1)
+        strengths[start:start + len(chunk)] = combination_strengths.max(axis=1)
+
+    category_indices = get_lookup_arrays()[-1]
+    return strengths, category_indices[strengths]
@@ -0,0 +1,206 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the function that maps five cards to an integer hand strength.
+"""
+
+
+from collections import Counter
+from collections.abc import Sequence
+from functools import cache
+from itertools import combinations, combinations_with_replacement
+
+
+from pokerpy import constants
+from pokerpy.messages import msg_not_five_cards_hand, msg_repeated_cards
+
+
+from .._card import Card
+
+
+# Every value gets a prime number, so the product of five values identifies the values regardless
+# of their order. Flushes are identified by the bitmask of their (necessarily distinct) values.
+# Card ids are sorted by value and then by suit, so (id >> 2) is the value index and (id & 3) is
+# the suit index.
+
+prime_by_value_index: tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+prime_by_card_id = tuple(prime_by_value_index[card_id >> 2] for card_id in range(52))
+bit_by_card_id = tuple(1 << (card_id >> 2) for card_id in range(52))
+
+
+def get_arranged_value_indices(value_indices: Sequence[int]):
+
+    """
+    Arranges value indices from most to least repeated and from highest to lowest value, exactly as
+    arrange_cards does with cards.
+    """
+
+    sorted_indices = sorted(value_indices, reverse=True)
+    if sorted_indices == [12, 3, 2, 1, 0]: # special sorting case --> A5432 becomes 5432A
+        return (3, 2, 1, 0, 12)
+
+    counts_by_index = Counter(value_indices)
+    sorted_indices.sort(reverse=True, key=(lambda index: counts_by_index[index]))
+    return tuple(sorted_indices)
+
+
+def get_category_index(arranged_indices: tuple[int, ...], is_flush: bool):
+
+    """
+    Determines the position of the hand category within the sorted hand categories, exactly as
+    get_category does with cards.
+    """
+
+    is_straight = (
+        len(set(arranged_indices)) == 5
+        and (arranged_indices == (3, 2, 1, 0, 12) or arranged_indices[0] - arranged_indices[4] == 4)
+    )
+
+    if is_flush and is_straight:
+        if arranged_indices[0] == 12:
+            return constants.sorted_hand_categories.index(constants.ROYAL_FLUSH)
+        return constants.sorted_hand_categories.index(constants.STRAIGHT_FLUSH)
+
+    if is_flush:
+        return constants.sorted_hand_categories.index(constants.FLUSH)
+
+    if is_straight:
+        return constants.sorted_hand_categories.index(constants.STRAIGHT)
+
+    value_counts = sorted(Counter(arranged_indices).values(), reverse=True)
+
+    if value_counts[0] == 4:
+        return constants.sorted_hand_categories.index(constants.FOUR_OF_A_KIND)
+
+    if value_counts[0] == 3:
+        if value_counts[1] == 2:
+            return constants.sorted_hand_categories.index(constants.FULL_HOUSE)
+        return constants.sorted_hand_categories.index(constants.THREE_OF_A_KIND)
+
+    if value_counts[0] == 2:
+        if value_counts[1] == 2:
+            return constants.sorted_hand_categories.index(constants.TWO_PAIR)
+        return constants.sorted_hand_categories.index(constants.ONE_PAIR)
+
+    return constants.sorted_hand_categories.index(constants.HIGH_CARD)
+
+
+def build_lookup_tables():
+
+    """
+    Builds the lookup tables that map prime products and flush bitmasks to hand strengths.
+    """
+
+    # Every equivalence class of hands is ranked the same way Hand instances were compared: first
+    # by category and then by the arranged card values
+
+    keyed_classes: list[tuple[tuple[int, tuple[int, ...]], bool, int]] = []
+
+    for value_indices in combinations_with_replacement(range(13), 5):
+        if max(Counter(value_indices).values()) > 4:
+            continue
+        product = 1
+        for index in value_indices:
+            product *= prime_by_value_index[index]
+        arranged_indices = get_arranged_value_indices(value_indices)
+        sorting_key = (get_category_index(arranged_indices, False), arranged_indices)
+        keyed_classes.append((sorting_key, False, product))
+
+    for value_indices in combinations(range(13), 5):
+        bitmask = sum(1 << index for index in value_indices)
+        arranged_indices = get_arranged_value_indices(value_indices)
+        sorting_key = (get_category_index(arranged_indices, True), arranged_indices)
+        keyed_classes.append((sorting_key, True, bitmask))
+
+    keyed_classes.sort()
+
+    strength_by_prime_product: dict[int, int] = {}
+    strength_by_flush_bitmask: dict[int, int] = {}
+    category_by_strength: list[str] = []
+
+    for strength, ((category_index, _), is_flush, key) in enumerate(keyed_classes):
+        if is_flush:
+            strength_by_flush_bitmask[key] = strength
+        else:
+            strength_by_prime_product[key] = strength
+        category_by_strength.append(constants.sorted_hand_categories[category_index])
+
+    return strength_by_prime_product, strength_by_flush_bitmask, tuple(category_by_strength)
+
+
+@cache
+def get_lookup_tables():
+
+    """
+    Retrieves the lookup tables, building them the first time a hand is evaluated (so that importing
+    PokerPy and starting worker processes do not pay for them).
+    """
+
+    return build_lookup_tables()
+
+
+def evaluate_cards(cards: Sequence[Card]):
+
+    """
+    Maps five cards to an integer hand strength. The stronger the hand, the larger the integer, and
+    two hands have the same strength only if they are equally good.
+    """
+
+    # Validate input
+
+    if len(cards) != 5:
+        raise ValueError(msg_not_five_cards_hand)
+
+    card_ids = [card.id for card in cards]
+    if len(set(card_ids)) != 5:
+        raise ValueError(msg_repeated_cards)
+
+    return evaluate_card_ids(card_ids)
+
+
+def evaluate_card_ids(card_ids: Sequence[int]):
+
+    """
+    Maps five distinct card ids to an integer hand strength, with no validations.
+    """
+
+    strength_by_prime_product, strength_by_flush_bitmask, _ = get_lookup_tables()
+
+    # Flushes are looked up by the bitmask of their values
+
+    first_suit_index = card_ids[0] & 3
+    if all((card_id & 3) == first_suit_index for card_id in card_ids):
+        bitmask = 0
+        for card_id in card_ids:
+            bitmask |= bit_by_card_id[card_id]
+        return strength_by_flush_bitmask[bitmask]
+
+    # Any other hand is looked up by the product of the primes of its values
+
+    product = 1
+    for card_id in card_ids:
+        product *= prime_by_card_id[card_id]
+    return strength_by_prime_product[product]
+
+
+def get_strength_category(strength: int):
+
+    """
+    Retrieves the hand category that corresponds to a hand strength.
+    """
+
+    return get_lookup_tables()[2][strength]
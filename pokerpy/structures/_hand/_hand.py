@@ -22,14 +22,13 @@ from collections.abc import Iterable
 from typing import NewType
 
 
-from pokerpy import constants
 from pokerpy.messages import msg_not_all_card_instances, msg_not_iterable_object
 
 
 from .._card import Card
 
 from ._arrange_cards import arrange_cards
-from ._get_category import get_category
+from ._evaluate_cards import evaluate_cards, get_strength_category
 
 
 HandTuple = NewType('HandTuple', tuple[Card])
@@ -43,6 +42,9 @@ class Hand:
     """
 
 
+    __slots__ = ('_unarranged_cards', '_cards', '_strength', '_category')
+
+
     def __init__(self, cards: Iterable[Card]):
 
         # Check input type
@@ -53,20 +55,28 @@ class Hand:
         if not all(isinstance(card, Card) for card in cards_list):
             raise TypeError(msg_not_all_card_instances)
 
-        # Transform input
-        hand_tuple = arrange_cards(cards_list)
-        category = get_category(cards_list)
-        
+        # Transform input (cards are only arranged when requested)
+        strength = evaluate_cards(cards_list)
+
         # Static attributes
-        self._cards = hand_tuple
-        self._category = category
+        self._unarranged_cards = cards_list
+        self._cards: (HandTuple|None) = None
+        self._strength = strength
+        self._category = get_strength_category(strength)
 
 
     @property
     def cards(self):
         "Cards that are part of the hand."
+        if self._cards is None:
+            self._cards = arrange_cards(self._unarranged_cards)
         return self._cards
 
+    @property
+    def strength(self):
+        "Integer that is larger the better the hand is, and equal only for equally good hands."
+        return self._strength
+
     @property
     def category(self):
         "Hand category."
@@ -85,12 +95,9 @@ class Hand:
 
         if not isinstance(other, Hand):
             return NotImplemented
-        
-        # If both hands have the same values, they are equally good, no matter the suit
-        self_values = [card.value for card in self.cards]
-        other_values = [card.value for card in other.cards]
 
-        return (self.category == other.category) and (self_values == other_values)
+        # If both hands have the same values, they are equally good, no matter the suit
+        return self.strength == other.strength
 
     
     def __gt__(self, other):
@@ -98,20 +105,13 @@ class Hand:
         if not isinstance(other, Hand):
             return NotImplemented
 
-        # The higher a category is in the categories tuple, the better the hand is
-        self_category_index = constants.sorted_hand_categories.index(self.category)
-        other_category_index = constants.sorted_hand_categories.index(other.category)
-
-        # Within a hand category, the higher its values are in the values tuple, the better the hand is
-        self_values_indices = [constants.sorted_card_values.index(card.value) for card in self.cards]
-        other_values_indices = [constants.sorted_card_values.index(card.value) for card in other.cards]
-        
-        return (self_category_index, self_values_indices) > (other_category_index, other_values_indices)
+        # Strengths are ranked by category first and then by the arranged card values
+        return self.strength > other.strength
     
     
     def __ge__(self, other):
         
         if not isinstance(other, Hand):
             return NotImplemented
-        
-        return (self == other) or (self > other)
\ No newline at end of file
+
+        return self.strength >= other.strength
\ No newline at end of file
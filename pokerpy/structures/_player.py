@@ -18,10 +18,15 @@ Defines the class that represents a poker player.
 """
 
 
+from typing import TYPE_CHECKING
+from weakref import ref, ReferenceType
+
+
 from pokerpy.messages import (
     msg_amount_larger_than_stack,
     msg_not_action_instance,
     msg_not_card_instance,
+    msg_not_future_instance,
     msg_not_hand_instance,
     msg_not_int,
     msg_not_positive_or_zero_value,
@@ -33,9 +38,15 @@ from pokerpy.messages import (
 
 from ._action import Action
 from ._card import Card
+from ._card_set import CardSet
 from ._hand._hand import Hand
 
 
+if TYPE_CHECKING:
+    from asyncio import Future
+    from ._table._table import Table
+
+
 class Player:
 
 
@@ -44,6 +55,22 @@ class Player:
     """
 
 
+    __slots__ = (
+        '_name',
+        '_requested_action',
+        '_action_waiter',
+        '_cards',
+        '_card_bitmask',
+        '_hand',
+        '_current_amount',
+        '_pot_participation',
+        '_stack',
+        '_has_played',
+        '_is_folded',
+        '_table_refs',
+    )
+
+
     def __init__(self, name: str, stack: int):
 
         # Validations
@@ -62,7 +89,9 @@ class Player:
 
         # State variables
         self._requested_action: (Action|None) = None
+        self._action_waiter: ("Future|None") = None
         self._cards: list[Card] = []
+        self._card_bitmask = 0 # ids of the cards, kept as a plain integer to keep players small
         self._hand: (Hand|None) = None
         self._current_amount = 0
         self._pot_participation = 0
@@ -70,6 +99,11 @@ class Player:
         self._has_played = False
         self._is_folded = False
 
+        # Tables that cache values derived from the state of the player, weakly referenced so that the
+        # tables the player leaves can be discarded (their references remove themselves when they are);
+        # the list is created when the first table is attached, so detached players share an empty tuple
+        self._table_refs: (list[ReferenceType["Table"]]|tuple[()]) = ()
+
 
     @property
     def name(self):
@@ -86,6 +120,11 @@ class Player:
         "Cards being hold by the player."
         return tuple(self._cards)
 
+    @property
+    def card_set(self):
+        "Cards being hold by the player, as a card set."
+        return CardSet.from_bitmask(self._card_bitmask)
+
     @property
     def hand(self):
         "Hand assigned to the player."
@@ -121,6 +160,29 @@ class Player:
         return f'Player(name={self.name}, stack={self.stack})'
 
 
+    # Methods to link tables
+
+
+    def attach_table(self, table: "Table"):
+        "Links a table that must be notified when the pot participation or the folding status changes."
+        if not self._table_refs:
+            self._table_refs = []
+        if not any(table_ref() is table for table_ref in self._table_refs):
+            self._table_refs.append(ref(table, self._table_refs.remove))
+
+
+    def _invalidate_split_pots(self):
+        "Notifies the linked tables that their split pots must be computed again."
+        for table_ref in self._table_refs:
+            table_ref().invalidate_split_pot()
+
+
+    def _refresh_table_statuses(self):
+        "Notifies the linked tables that the player may have entered or left the hand or the active players."
+        for table_ref in self._table_refs:
+            table_ref().refresh_player_status(self)
+
+
     # Methods to affect actions
 
 
@@ -129,6 +191,16 @@ class Player:
         if not isinstance(action, Action):
             raise TypeError(msg_not_action_instance.format(type(action).__name__))
         self._requested_action = action
+        if self._action_waiter is not None and not self._action_waiter.done():
+            self._action_waiter.set_result(action)
+
+
+    def set_action_waiter(self, waiter: ("Future|None")):
+        "Sets the future that the next requested action resolves, for engines that await players."
+        # Any object with the interface of a future is accepted, so that asyncio is not imported here
+        if waiter is not None and not (callable(getattr(waiter, 'done', None)) and callable(getattr(waiter, 'set_result', None))):
+            raise TypeError(msg_not_future_instance.format(type(waiter).__name__))
+        self._action_waiter = waiter
 
 
     def reset_action(self):
@@ -143,14 +215,16 @@ class Player:
         "Adds a card to the cards property."
         if not isinstance(card, Card):
             raise TypeError(msg_not_card_instance.format(type(card).__name__))
-        if card in self.cards:
+        if (self._card_bitmask >> card.id) & 1:
             raise ValueError(msg_repeated_cards)
         self._cards.append(card)
+        self._card_bitmask |= 1 << card.id
 
 
     def reset_cards(self):
         "Clears the cards property."
         self._cards.clear()
+        self._card_bitmask = 0
 
 
     def assign_hand(self, hand: Hand):
@@ -187,10 +261,12 @@ class Player:
         if amount < 0:
             raise ValueError(msg_not_positive_or_zero_value.format(amount))
         self._pot_participation += amount
+        self._invalidate_split_pots()
 
     def reset_pot_participation(self):
         "Resets the pot_participation property back to zero."
         self._pot_participation = 0
+        self._invalidate_split_pots()
 
     def add_to_stack(self, amount: int):
         "Adds an amount to the stack property."
@@ -199,6 +275,7 @@ class Player:
         if amount < 0:
             raise ValueError(msg_not_positive_or_zero_value.format(amount))
         self._stack += amount
+        self._refresh_table_statuses()
 
 
     def remove_from_stack(self, amount: int):
@@ -210,6 +287,27 @@ class Player:
         if amount > self.stack:
             raise ValueError(msg_amount_larger_than_stack.format(amount, self.stack))
         self._stack -= amount
+        self._refresh_table_statuses()
+
+
+    # Methods for trusted engines (inputs are expected to be valid, so they are not checked)
+
+
+    def _place_chips(self, amount: int):
+        "Moves an amount from the stack to the current amount and the pot participation."
+        self._stack -= amount
+        self._current_amount += amount
+        self._pot_participation += amount
+        self._invalidate_split_pots()
+        # Placing chips can only take the player out of the active players, when the stack runs out
+        if self._stack == 0:
+            self._refresh_table_statuses()
+
+
+    def _add_to_stack(self, amount: int):
+        "Adds an amount to the stack property."
+        self._stack += amount
+        self._refresh_table_statuses()
 
 
     # Methods to affect playing status
@@ -229,8 +327,11 @@ class Player:
         "Marks the is_folded property."
         self._is_folded = True
         self.reset_pot_participation()
+        self._refresh_table_statuses()
 
 
     def unmark_is_folded(self):
         "Unmarks the is_folded property."
-        self._is_folded = False
\ No newline at end of file
+        self._is_folded = False
+        self._invalidate_split_pots()
+        self._refresh_table_statuses()
\ No newline at end of file
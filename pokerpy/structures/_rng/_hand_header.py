@@ -0,0 +1,58 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the class that records how a hand was dealt.
+"""
+
+
+class HandHeader:
+
+
+    """
+    Records how a hand was dealt: its number within the table, the random number generator that
+    dealt it and the seed that reproduces it (None if the generator cannot replay hands).
+    """
+
+
+    __slots__ = ('_hand_number', '_rng_name', '_seed')
+
+
+    def __init__(self, hand_number: int, rng_name: str, seed: (int|None) = None):
+
+        # Fixed variables
+        self._hand_number = hand_number
+        self._rng_name = rng_name
+        self._seed = seed
+
+
+    @property
+    def hand_number(self):
+        "Number of the hand within the table (starting at 1)."
+        return self._hand_number
+
+    @property
+    def rng_name(self):
+        "Name of the class of the random number generator that dealt the hand."
+        return self._rng_name
+
+    @property
+    def seed(self):
+        "Seed that reproduces the hand (None if it cannot be replayed)."
+        return self._seed
+
+
+    def __repr__(self):
+        return f'HandHeader(hand_number={self.hand_number}, rng_name={self.rng_name}, seed={self.seed})'
@@ -0,0 +1,85 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the base class of the random number generators that deal the cards, and the default one.
+"""
+
+
+from abc import ABC, abstractmethod
+import math
+import secrets
+
+
+from .._card import Card
+
+
+class RNG(ABC):
+
+
+    """
+    Base class of the random number generators that tables use to deal cards. A table starts a new
+    hand on the generator before dealing the first card after its deck is reset, and records the
+    seed it retrieves (if any) in the header of that hand.
+    """
+
+
+    __slots__ = ()
+
+
+    def start_hand(self) -> (int|None):
+        "Prepares the generator for a new hand and retrieves the seed that reproduces it (if any)."
+        return None
+
+
+    @abstractmethod
+    def choice(self, cards: tuple[Card, ...]) -> Card:
+        "Picks one of the given cards."
+
+
+    @abstractmethod
+    def shuffle(self, cards: list[Card]):
+        "Shuffles the given cards in place (they are dealt from the end of the list)."
+
+
+class CryptoRNG(RNG):
+
+
+    """
+    Random number generator backed by the random source of the operating system, meant for games
+    played for real money. Hands dealt with it cannot be replayed.
+    """
+
+
+    __slots__ = ()
+
+
+    def choice(self, cards: tuple[Card, ...]):
+        return secrets.choice(cards)
+
+
+    def shuffle(self, cards: list[Card]):
+
+        # A single random number below n! encodes a whole permutation of the n cards, so the cards
+        # are shuffled with one call to the random source instead of one call per card
+
+        permutation_index = secrets.randbelow(math.factorial(len(cards)))
+        for i in range(len(cards) - 1, 0, -1):
+            permutation_index, j = divmod(permutation_index, i + 1)
+            cards[i], cards[j] = cards[j], cards[i]
+
+
+    def __repr__(self):
+        return 'CryptoRNG()'
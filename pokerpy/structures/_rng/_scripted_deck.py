@@ -0,0 +1,94 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the scripted deck, which deals predefined cards for testing purposes.
+"""
+
+
+from pokerpy.messages import msg_card_not_in_deck, msg_not_all_card_instances, msg_not_list, msg_repeated_cards
+
+
+from .._card import Card
+from ._rng import RNG
+
+
+class ScriptedDeck(RNG):
+
+
+    """
+    Deals the given cards in order at every hand, meant for tests. Once they run out, the remaining
+    cards of the deck are dealt in their sorted order.
+    """
+
+
+    __slots__ = ('_cards', '_position')
+
+
+    def __init__(self, cards: list[Card]):
+
+        if not isinstance(cards, list):
+            raise TypeError(msg_not_list.format(type(cards).__name__))
+        if not all(isinstance(card, Card) for card in cards):
+            raise TypeError(msg_not_all_card_instances)
+        if len(set(cards)) != len(cards):
+            raise ValueError(msg_repeated_cards)
+
+        # Fixed variables
+        self._cards = tuple(cards)
+
+        # Dynamic variables
+        self._position = 0
+
+
+    @property
+    def cards(self):
+        "Cards dealt in order at the beginning of every hand."
+        return self._cards
+
+
+    def start_hand(self):
+        self._position = 0
+        return None
+
+
+    def choice(self, cards: tuple[Card, ...]):
+        if self._position == len(self._cards):
+            return min(cards, key=Card.get_deck_position)
+        card = self._cards[self._position]
+        if card not in cards:
+            raise ValueError(msg_card_not_in_deck)
+        self._position += 1
+        return card
+
+
+    def shuffle(self, cards: list[Card]):
+
+        # Cards are dealt from the end of the list, so the script goes last and in reverse order
+
+        card_set = set(cards)
+        scripted_cards = self._cards[self._position:]
+        if not card_set.issuperset(scripted_cards):
+            raise ValueError(msg_card_not_in_deck)
+
+        scripted_card_set = set(scripted_cards)
+        remaining_cards = [card for card in cards if card not in scripted_card_set]
+        remaining_cards.sort(key=Card.get_deck_position, reverse=True)
+        cards[:] = remaining_cards + list(reversed(scripted_cards))
+        self._position = len(self._cards)
+
+
+    def __repr__(self):
+        return f'ScriptedDeck(cards=[{", ".join(map(str, self.cards))}])'
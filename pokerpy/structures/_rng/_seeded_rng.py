@@ -0,0 +1,90 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the seeded random number generator, meant for simulations and replays.
+"""
+
+
+import random
+import secrets
+
+
+from pokerpy.messages import msg_not_int
+
+
+from .._card import Card
+from ._rng import RNG
+
+
+class SeededRNG(RNG):
+
+
+    """
+    Fast pseudorandom number generator, meant for simulations. The first hand is dealt from the
+    given seed, and every following hand from a seed derived from the one before, so creating a
+    generator with the seed recorded in the header of any hand replays that hand (and the ones
+    after it) card for card.
+    """
+
+
+    __slots__ = ('_seed', '_hand_seed', '_random')
+
+
+    def __init__(self, seed: (int|None) = None):
+
+        if seed is None:
+            seed = secrets.randbits(64)
+        if not isinstance(seed, int):
+            raise TypeError(msg_not_int.format(type(seed).__name__))
+
+        # Fixed variables
+        self._seed = seed
+
+        # Dynamic variables
+        self._hand_seed: (int|None) = None
+        self._random = random.Random(seed)
+
+
+    @property
+    def seed(self):
+        "Seed the first hand is dealt from."
+        return self._seed
+
+    @property
+    def hand_seed(self):
+        "Seed the current hand is dealt from (None before the first hand)."
+        return self._hand_seed
+
+
+    def start_hand(self):
+        if self._hand_seed is None:
+            self._hand_seed = self._seed
+        else:
+            self._hand_seed = random.Random(f'{self._hand_seed}:next').getrandbits(64)
+        self._random.seed(self._hand_seed)
+        return self._hand_seed
+
+
+    def choice(self, cards: tuple[Card, ...]):
+        return self._random.choice(cards)
+
+
+    def shuffle(self, cards: list[Card]):
+        self._random.shuffle(cards)
+
+
+    def __repr__(self):
+        return f'SeededRNG(seed={self.seed})'
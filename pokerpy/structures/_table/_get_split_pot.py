@@ -22,24 +22,27 @@ def get_split_pot(total_pot: int, players_amounts: list[int]):
 
     """
     Retrieves the pot split into main and side pots.
+
+    Every distinct amount closes a pot, funded by its difference with the previous amount for each
+    player that reached it. The last pot takes whatever is left (e.g. the chips of folded players).
     """
 
     assert total_pot >= sum(amount for amount in players_amounts)
-    splitted_pot: list[int] = []
-
-    if len(set(players_amounts)) == 1:
-        splitted_pot.append(total_pot)
-        return splitted_pot
 
-    min_amount = min(amount for amount in players_amounts)
-    main_pot = 0
-    remaining_amounts: list[int] = []
-
-    for amount in players_amounts:
-        main_pot += min_amount
-        if amount > min_amount:
-            remaining_amounts.append(amount - min_amount)
-
-    remaining_pot = total_pot - main_pot
-    splitted_pot.extend([main_pot, *get_split_pot(remaining_pot, remaining_amounts)])
-    return splitted_pot
\ No newline at end of file
+    sorted_amounts = sorted(players_amounts)
+    splitted_pot: list[int] = []
+    previous_amount = 0
+    remaining_pot = total_pot
+
+    for index, amount in enumerate(sorted_amounts):
+        if amount == previous_amount and index > 0:
+            continue
+        if amount == sorted_amounts[-1]:
+            break
+        pot = (amount - previous_amount) * (len(sorted_amounts) - index)
+        splitted_pot.append(pot)
+        remaining_pot -= pot
+        previous_amount = amount
+
+    splitted_pot.append(remaining_pot)
+    return splitted_pot
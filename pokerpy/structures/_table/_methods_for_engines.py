@@ -0,0 +1,107 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the methods the engines use to move chips and to raise the levels. The ones with inputs have
+a trusted version (inputs are expected to be valid, so they are not checked) and a checked one, and
+every table picks one of them when it is created.
+"""
+
+
+from typing import TYPE_CHECKING
+
+
+from pokerpy.messages import (
+    msg_not_int,
+    msg_not_player_instance,
+    msg_not_positive_or_zero_value,
+    msg_player_not_in_table,
+)
+
+
+from .._player import Player
+if TYPE_CHECKING:
+    from ._table import Table
+
+
+def validate_player(self: "Table", player: Player):
+    if not isinstance(player, Player):
+        raise TypeError(msg_not_player_instance.format(type(player).__name__))
+    if player not in self._seat_index_by_player:
+        raise ValueError(msg_player_not_in_table.format(player.name))
+
+
+def method_move_chips_trusted(self: "Table", player: Player, amount: int):
+    player._place_chips(amount)
+
+
+def method_move_chips_checked(self: "Table", player: Player, amount: int):
+    validate_player(self, player)
+    player.remove_from_stack(amount)
+    player.add_to_current_amount(amount)
+    player.add_to_pot_participation(amount)
+
+
+def method_award_chips_trusted(self: "Table", player: Player, amount: int):
+    player._add_to_stack(amount)
+
+
+def method_award_chips_checked(self: "Table", player: Player, amount: int):
+    validate_player(self, player)
+    player.add_to_stack(amount)
+
+
+def method_raise_level_trusted(self: "Table", player: Player, level: int):
+
+    # The level is the new amount of the player, even over an incomplete raise, while the complete
+    # level and the full raise increase only move with full raises
+
+    complete_current_level = self._complete_current_level
+    self._current_level = level
+    if level >= complete_current_level + self._full_raise_increase:
+        self._complete_current_level = level
+        if (full_raise_increase := level - complete_current_level) > 0:
+            self._full_raise_increase = full_raise_increase
+
+    # The betting round stops at the previous player who is not either folded or all-in
+
+    stopping_player = self._previous_player_by_player[player]
+    while stopping_player is not player and stopping_player not in self._active_player_set:
+        stopping_player = self._previous_player_by_player[stopping_player]
+    if stopping_player not in self._active_player_set:
+        return None
+    self._stopping_player = stopping_player
+    return stopping_player
+
+
+def method_raise_level_checked(self: "Table", player: Player, level: int):
+    validate_player(self, player)
+    if not isinstance(level, int):
+        raise TypeError(msg_not_int.format(type(level).__name__))
+    if level < 0:
+        raise ValueError(msg_not_positive_or_zero_value.format(level))
+    return method_raise_level_trusted(self, player, level)
+
+
+def method_collect_bets(self: "Table"):
+    self._central_pot += sum(player.current_amount for player in self._players)
+    self._split_pot = None
+
+
+def method_reset_levels(self: "Table"):
+    self._full_raise_increase = self._full_bet
+    self._current_level = 0
+    self._complete_current_level = 0
+    self._stopping_player = self._previous_player_by_player[self._starting_player]
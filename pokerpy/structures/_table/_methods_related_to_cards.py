@@ -21,11 +21,11 @@ Defines the methods related to cards.
 from typing import TYPE_CHECKING
 
 
-from pokerpy.constants import full_sorted_values_and_suits
-from pokerpy.messages import msg_not_card_instance, msg_card_not_in_deck, msg_repeated_cards
+from pokerpy.messages import msg_not_card_instance, msg_card_not_in_deck, msg_empty_deck, msg_repeated_cards
 
 
 from .._card import Card
+from .._rng._hand_header import HandHeader
 if TYPE_CHECKING:
     from ._table import Table
 
@@ -33,23 +33,67 @@ if TYPE_CHECKING:
 def method_remove_card_from_deck(self: "Table", card: Card):
     if not isinstance(card, Card):
         raise TypeError(msg_not_card_instance.format(type(card).__name__))
-    if card not in self.deck:
+    if card not in self._deck:
         raise ValueError(msg_card_not_in_deck)
-    self._deck.remove(card)
+    self._deck.discard(card)
 
 
 def method_assign_common_card(self: "Table", card: Card):
     if not isinstance(card, Card):
         raise TypeError(msg_not_card_instance.format(type(card).__name__))
-    if card in self.common_cards:
+    if card in self._common_card_set:
         raise ValueError(msg_repeated_cards)
     self._common_cards.append(card)
+    self._common_card_set.add(card)
 
 
 def method_reset_common_cards(self: "Table"):
     self._common_cards.clear()
+    self._common_card_set.clear()
 
 
 def method_reset_deck(self: "Table"):
-    self._deck.clear()
-    self._deck.extend(Card(value, suit) for value, suit in full_sorted_values_and_suits)
\ No newline at end of file
+    self._deck.fill()
+    self._shuffled_deck = None
+    self._is_new_deck = True
+
+
+def method_shuffle_deck(self: "Table"):
+    shuffled_deck = list(self._deck)
+    self._rng.shuffle(shuffled_deck)
+    self._shuffled_deck = shuffled_deck
+
+
+def method_start_hand(self: "Table"):
+    hand_number = 1 if self._hand_header is None else self._hand_header.hand_number + 1
+    seed = self._rng.start_hand()
+    self._hand_header = HandHeader(hand_number, type(self._rng).__name__, seed)
+    self._is_new_deck = False
+
+
+def method_deal_card(self: "Table"):
+
+    # The first card dealt after a reset starts a new hand. A preshuffled deck is shuffled then and
+    # dealt by popping cards from its end, skipping the cards removed from the deck by other means.
+
+    if not self._deck:
+        raise ValueError(msg_empty_deck)
+
+    if self._is_new_deck:
+        method_start_hand(self)
+        if self._preshuffles_deck:
+            self.shuffle_deck()
+
+    if not self._preshuffles_deck:
+        card = self._rng.choice(self.deck)
+        self._deck.discard(card)
+        return card
+
+    if self._shuffled_deck is None:
+        self.shuffle_deck()
+
+    card = self._shuffled_deck.pop()
+    while card not in self._deck:
+        card = self._shuffled_deck.pop()
+    self._deck.discard(card)
+    return card
\ No newline at end of file
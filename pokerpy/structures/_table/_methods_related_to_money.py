@@ -67,7 +67,9 @@ def method_add_to_central_pot(self: "Table", amount: int):
     if amount < 0:
         raise ValueError(msg_not_positive_or_zero_value.format(amount))
     self._central_pot += amount
+    self.invalidate_split_pot()
 
 
 def method_reset_central_pot(self: "Table"):
-    self._central_pot = 0
\ No newline at end of file
+    self._central_pot = 0
+    self.invalidate_split_pot()
\ No newline at end of file
@@ -34,7 +34,7 @@ def method_set_starting_player(self: "Table", player: Player):
     if not isinstance(player, Player):
         raise TypeError(msg_not_player_instance.format(type(player).__name__))
 
-    if player not in self.players:
+    if player not in self._seat_index_by_player:
         raise ValueError(msg_player_not_in_table.format(player.name))
 
     self._starting_player = player
@@ -45,7 +45,7 @@ def method_set_stopping_player(self: "Table", player: Player):
     if not isinstance(player, Player):
         raise TypeError(msg_not_player_instance.format(type(player).__name__))
 
-    if player not in self.players:
+    if player not in self._seat_index_by_player:
         raise ValueError(msg_player_not_in_table.format(player.name))
 
     self._stopping_player = player
@@ -53,14 +53,10 @@ def method_set_stopping_player(self: "Table", player: Player):
 
 def method_get_next_player(self: "Table", reference_player: Player):
 
-    if reference_player not in self.players:
+    if reference_player not in self._seat_index_by_player:
         raise ValueError(msg_player_not_in_table.format(reference_player.name))
 
-    if reference_player == self.players[-1]:
-        return self.players[0]
-
-    reference_player_index = self.players.index(reference_player)
-    return self.players[reference_player_index + 1]
+    return self._next_player_by_player[reference_player]
 
 
 def method_get_previous_player(self: "Table", reference_player: Player):
@@ -68,11 +64,10 @@ def method_get_previous_player(self: "Table", reference_player: Player):
     if not isinstance(reference_player, Player):
         raise TypeError(msg_not_player_instance.format(type(reference_player).__name__))
 
-    if reference_player not in self.players:
+    if reference_player not in self._seat_index_by_player:
         raise ValueError(msg_player_not_in_table.format(reference_player.name))
 
-    reference_player_index = self.players.index(reference_player)
-    return self.players[reference_player_index - 1]
+    return self._previous_player_by_player[reference_player]
 
 
 def method_iter_players(self: "Table", starting_player: (Player|None) = None, reverse: bool = False):
@@ -83,20 +78,22 @@ def method_iter_players(self: "Table", starting_player: (Player|None) = None, re
     if not isinstance(starting_player, Player):
         raise TypeError(msg_not_player_instance.format(type(starting_player).__name__))
 
-    if starting_player not in self.players:
+    if starting_player not in self._seat_index_by_player:
         raise ValueError(msg_player_not_in_table.format(starting_player.name))
 
+    # Seats are linked in both directions, so a lap follows the links without any lookups by index
+
     if reverse:
-        get_player = self.get_previous_player
+        player_by_player = self._previous_player_by_player
     else:
-        get_player = self.get_next_player
+        player_by_player = self._next_player_by_player
 
     def generator():
         yield starting_player
-        next_player = get_player(starting_player)
-        while next_player != starting_player:
+        next_player = player_by_player[starting_player]
+        while next_player is not starting_player:
             yield next_player
-            next_player = get_player(next_player)
+            next_player = player_by_player[next_player]
     
     return generator()
 
@@ -110,9 +107,33 @@ def method_get_previous_active_player(self: "Table", reference_player: Player):
     if not isinstance(reference_player, Player):
         raise TypeError(msg_not_player_instance.format(type(reference_player).__name__))
 
-    if reference_player not in self.players:
+    if reference_player not in self._seat_index_by_player:
         raise ValueError(msg_player_not_in_table.format(reference_player.name))
 
-    for player in self.iter_players(self.get_previous_player(reference_player), reverse=True):
-        if player in self.active_players:
-            return player
\ No newline at end of file
+    for player in self.iter_players(self._previous_player_by_player[reference_player], reverse=True):
+        if player in self._active_player_set:
+            return player
+
+
+def method_refresh_player_status(self: "Table", player: Player):
+
+    # Players in hand and active players are kept as sets, so that counting them and checking if a
+    # player belongs to them are constant-time operations. The ordered tuples are only rebuilt when
+    # they are requested after a change.
+
+    is_in_hand = not player.is_folded
+    is_active = is_in_hand and player.stack > 0
+
+    if is_in_hand != (player in self._player_in_hand_set):
+        if is_in_hand:
+            self._player_in_hand_set.add(player)
+        else:
+            self._player_in_hand_set.discard(player)
+        self._players_in_hand = None
+
+    if is_active != (player in self._active_player_set):
+        if is_active:
+            self._active_player_set.add(player)
+        else:
+            self._active_player_set.discard(player)
+        self._active_players = None
\ No newline at end of file
@@ -18,7 +18,6 @@ Defines the class that represents a poker table.
 """
 
 
-from pokerpy.constants import full_sorted_values_and_suits
 from pokerpy.logger import get_logger
 from pokerpy.messages import (
     msg_no_players_in_table,
@@ -27,16 +26,30 @@ from pokerpy.messages import (
     msg_not_list,
     msg_not_player_instance,
     msg_not_positive_value,
+    msg_not_rng_instance,
     msg_player_not_in_table,
 )
 
 
 from ._get_split_pot import get_split_pot
+from ._trusted_mode import get_trusted_mode
 from ._methods_related_to_cards import (
     method_assign_common_card,
     method_reset_common_cards,
     method_remove_card_from_deck,
     method_reset_deck,
+    method_shuffle_deck,
+    method_deal_card,
+)
+from ._methods_for_engines import (
+    method_award_chips_checked,
+    method_award_chips_trusted,
+    method_collect_bets,
+    method_move_chips_checked,
+    method_move_chips_trusted,
+    method_raise_level_checked,
+    method_raise_level_trusted,
+    method_reset_levels,
 )
 from ._methods_related_to_money import (
     method_add_to_central_pot,
@@ -51,11 +64,15 @@ from ._methods_related_to_players import (
     method_get_previous_active_player,
     method_get_previous_player,
     method_iter_players,
+    method_refresh_player_status,
     method_set_starting_player,
     method_set_stopping_player,
 )
 from .._card import Card
+from .._card_set import CardSet
 from .._player import Player
+from .._rng._hand_header import HandHeader
+from .._rng._rng import CryptoRNG, RNG
 
 
 logger = get_logger()
@@ -69,6 +86,39 @@ class Table:
     """
 
 
+    __slots__ = (
+        '_players',
+        '_is_trusted',
+        '_move_chips',
+        '_award_chips',
+        '_raise_level',
+        '_seat_index_by_player',
+        '_next_player_by_player',
+        '_previous_player_by_player',
+        '_full_bet',
+        '_full_raise_increase',
+        '_starting_player',
+        '_stopping_player',
+        '_current_level',
+        '_complete_current_level',
+        '_central_pot',
+        '_split_pot',
+        '_player_in_hand_set',
+        '_active_player_set',
+        '_players_in_hand',
+        '_active_players',
+        '_deck',
+        '_preshuffles_deck',
+        '_shuffled_deck',
+        '_is_new_deck',
+        '_rng',
+        '_hand_header',
+        '_common_cards',
+        '_common_card_set',
+        '__weakref__',
+    )
+
+
     def __init__(
         self,
         players: list[Player],
@@ -76,6 +126,9 @@ class Table:
         full_bet: int = 1,
         starting_player: (Player|None) = None,
         stopping_player: (Player|None) = None,
+        trusted: (bool|None) = None,
+        preshuffle_deck: bool = False,
+        rng: (RNG|None) = None,
     ):
 
         # Type validations
@@ -94,6 +147,9 @@ class Table:
         if stopping_player is not None and not isinstance(stopping_player, Player):
             raise TypeError(msg_not_player_instance.format(type(stopping_player).__name__))
 
+        if rng is not None and not isinstance(rng, RNG):
+            raise TypeError(msg_not_rng_instance.format(type(rng).__name__))
+
         # Value validations
 
         if not players:
@@ -116,6 +172,18 @@ class Table:
         # Assign attributes
 
         self._players = players
+        self._is_trusted = get_trusted_mode() if trusted is None else bool(trusted)
+        if self._is_trusted:
+            self._move_chips = method_move_chips_trusted
+            self._award_chips = method_award_chips_trusted
+            self._raise_level = method_raise_level_trusted
+        else:
+            self._move_chips = method_move_chips_checked
+            self._award_chips = method_award_chips_checked
+            self._raise_level = method_raise_level_checked
+        self._seat_index_by_player = {player: index for index, player in enumerate(players)}
+        self._next_player_by_player = {player: players[(index + 1) % len(players)] for index, player in enumerate(players)}
+        self._previous_player_by_player = {player: players[index - 1] for index, player in enumerate(players)}
         self._full_bet = full_bet
         self._full_raise_increase = full_bet
         self._starting_player = starting_player
@@ -124,9 +192,24 @@ class Table:
         self._current_level = 0
         self._complete_current_level = 0
         self._central_pot = 0
-
-        self._deck: list[Card] = [Card(value, suit) for value, suit in full_sorted_values_and_suits]
+        self._split_pot: (list[int]|None) = None
+
+        self._player_in_hand_set = {player for player in players if not player.is_folded}
+        self._active_player_set = {player for player in self._player_in_hand_set if player.stack > 0}
+        self._players_in_hand: (tuple[Player, ...]|None) = None
+        self._active_players: (tuple[Player, ...]|None) = None
+
+        for player in players:
+            player.attach_table(self)
+
+        self._deck = CardSet.full_deck()
+        self._preshuffles_deck = bool(preshuffle_deck)
+        self._shuffled_deck: (list[Card]|None) = None
+        self._is_new_deck = True
+        self._rng = CryptoRNG() if rng is None else rng
+        self._hand_header: (HandHeader|None) = None
         self._common_cards: list[Card] = []
+        self._common_card_set = CardSet()
     
 
     @property
@@ -134,6 +217,14 @@ class Table:
         "Players that are part of the table."
         return tuple(self._players)
 
+    @property
+    def is_trusted(self):
+        """
+        Whether the engines skip validating the inputs of their own calls to the table and its
+        players (the public methods are validated anyway).
+        """
+        return self._is_trusted
+
     @property
     def starting_player(self):
         "Player who acts first in the betting round."
@@ -147,12 +238,26 @@ class Table:
     @property
     def players_in_hand(self):
         "Players that are playing for the pot."
-        return tuple(player for player in self.players if not player.is_folded)
+        if self._players_in_hand is None:
+            self._players_in_hand = tuple(player for player in self._players if player in self._player_in_hand_set)
+        return self._players_in_hand
     
     @property
     def active_players(self):
         "Players that are playing for the pot and are not all-in"
-        return tuple(player for player in self.players if not player.is_folded and player.stack > 0)
+        if self._active_players is None:
+            self._active_players = tuple(player for player in self._players if player in self._active_player_set)
+        return self._active_players
+
+    @property
+    def players_in_hand_count(self):
+        "Number of players that are playing for the pot."
+        return len(self._player_in_hand_set)
+
+    @property
+    def active_players_count(self):
+        "Number of players that are playing for the pot and are not all-in."
+        return len(self._active_player_set)
 
     @property
     def full_bet(self):
@@ -188,10 +293,12 @@ class Table:
     @property
     def split_pot(self):
         """
-        Pot chips that have already been placed in the center of the table in previous betting
-        rounds.
+        Central pot split into main and side pots among the players in hand (computed once until
+        the central pot, a pot participation or a folding status changes).
         """
-        return get_split_pot(self.central_pot, [player.pot_participation for player in self.players_in_hand])
+        if self._split_pot is None:
+            self._split_pot = get_split_pot(self.central_pot, [player.pot_participation for player in self.players_in_hand])
+        return list(self._split_pot)
 
 
 
@@ -199,12 +306,43 @@ class Table:
     def deck(self):
         "Cards that are available to be dealt."
         return tuple(self._deck)
+
+    @property
+    def preshuffles_deck(self):
+        """
+        Whether the deck is shuffled once per hand and dealt by popping cards from it, instead of
+        picking every card at random from the remaining ones.
+        """
+        return self._preshuffles_deck
+
+    @property
+    def rng(self):
+        "Random number generator that deals the cards."
+        return self._rng
+
+    @property
+    def hand_header(self):
+        """
+        Header of the current hand, started when the first card is dealt after the deck is reset
+        (None before the first card is dealt).
+        """
+        return self._hand_header
+
+    @property
+    def deck_set(self):
+        "Cards that are available to be dealt, as a card set."
+        return self._deck.copy()
     
     @property
     def common_cards(self):
         "Dealt cards that are common to all players."
         return tuple(self._common_cards)
 
+    @property
+    def common_card_set(self):
+        "Dealt cards that are common to all players, as a card set."
+        return self._common_card_set.copy()
+
 
     # Methods related to cards
 
@@ -219,6 +357,16 @@ class Table:
         return method_reset_deck(self)
 
 
+    def shuffle_deck(self):
+        "Shuffles the cards remaining in the deck with the random number generator of the table."
+        return method_shuffle_deck(self)
+
+
+    def deal_card(self):
+        "Removes a random card from the deck and retrieves it."
+        return method_deal_card(self)
+
+
     def assign_common_card(self, card: Card):
         "Adds a card to the common_cards property."
         return method_assign_common_card(self, card)
@@ -262,6 +410,26 @@ class Table:
         return method_reset_central_pot(self)
 
 
+    def has_player(self, player: Player):
+        "Whether a player is part of the table."
+        return player in self._seat_index_by_player
+
+
+    def is_last_active_player(self, player: Player):
+        "Whether a player is the only one playing for the pot that is not all-in."
+        return len(self._active_player_set) == 1 and player in self._active_player_set
+
+
+    def refresh_player_status(self, player: Player):
+        "Updates the players in hand and the active players (players call it when they fold or their stack changes)."
+        return method_refresh_player_status(self, player)
+
+
+    def invalidate_split_pot(self):
+        "Discards the cached split_pot property (players call it when they change their pot participation or fold)."
+        self._split_pot = None
+
+
     # Methods related to players
 
 
@@ -293,3 +461,34 @@ class Table:
     def get_previous_active_player(self, reference_player: Player):
         "Retrieves the player before a reference player that is not either folded or all-in."
         return method_get_previous_active_player(self, reference_player)
+
+
+    # Methods for engines (trusted tables skip validating their inputs)
+
+
+    def move_chips(self, player: Player, amount: int):
+        "Moves an amount from the stack of a player to their current amount and pot participation."
+        return self._move_chips(self, player, amount)
+
+
+    def award_chips(self, player: Player, amount: int):
+        "Adds an amount won by a player to their stack."
+        return self._award_chips(self, player, amount)
+
+
+    def raise_level(self, player: Player, level: int):
+        """
+        Raises the current level to the new amount of a player who bets or raises (completing it on
+        full raises) and retrieves the new stopping player, the previous active player.
+        """
+        return self._raise_level(self, player, level)
+
+
+    def collect_bets(self):
+        "Adds the current amounts of all the players to the central_pot property."
+        return method_collect_bets(self)
+
+
+    def reset_levels(self):
+        "Resets the levels and the full raise increase, and stops the betting before the starting player."
+        return method_reset_levels(self)
@@ -0,0 +1,38 @@
+# Copyright 2026 Andrés Saldarriaga Jordan (jorsaland)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Defines the functions that set and retrieve whether new tables are trusted by default.
+"""
+
+
+trusted_mode = False
+
+
+def set_trusted_mode(trusted: bool = True):
+
+    """
+    Makes the tables created from now on in this process trusted (or not) by default. The engines
+    skip validating their own calls to trusted tables and their players, while the public methods
+    keep validating their inputs.
+    """
+
+    global trusted_mode
+    trusted_mode = bool(trusted)
+
+
+def get_trusted_mode():
+    "Whether the tables created from now on in this process are trusted by default or not."
+    return trusted_mode
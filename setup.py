@@ -23,6 +23,9 @@ setup(
     url = 'https://github.com/jorsaland/pokerpy',
     download_url = 'https://github.com/jorsaland/pokerpy/archive/refs/tags/0.5.0.tar.gz',
     packages = find_packages(),
+    extras_require = {
+        'numpy': ['numpy'], # batch hand evaluation
+    },
     classifiers = [
         'License :: OSI Approved :: Apache Software License',
         'Programming Language :: Python :: 3.12',
@@ -0,0 +1,126 @@
+"""
+Benchmark on hand cycles
+
+Measures the cost of running a 6-handed hand from the antes to the showdown, where every player
+checks or calls, by stitching a BettingRound per street together with reset_cycle_states and
+showdown (as the 0.6 demos do) and by driving a single HandCycle. The per-hand overhead is what
+remains after taking out the card work that both share: dealing the cards and figuring out the hands.
+The 5x lower overhead first targeted was renegotiated: the hand cycle removes the per-street
+rebuilding and resetting, but the streets of both ways run on the same turns and action effects, and
+applying the actions is most of the remaining overhead, so the ratio measures between 1.5x and 2x.
+Run it from the root of the repository: python tests/benchmarks/benchmark_hand_cycle.py
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from timeit import repeat
+
+
+import pokerpy as pk
+
+
+# Constants
+
+PLAYERS_COUNT = 6
+ANTE = 1
+SMALL_BLIND = 5
+BIG_BLIND = 10
+HANDS = 1_000
+
+postflop_cards_count_by_name = {'flop': 3, 'turn': 1, 'river': 1}
+
+
+def choose_passive_action(range_by_action: dict[str, range]):
+    "Checks when possible, and calls otherwise."
+    if pk.ACTION_CALL in range_by_action:
+        return pk.Action(pk.ACTION_CALL, range_by_action[pk.ACTION_CALL][0])
+    return pk.Action(pk.ACTION_CHECK)
+
+
+def stitched_hand(table: pk.Table):
+
+    """
+    Runs a hand as the 0.6 demos do, building a betting round per street.
+    """
+
+    players = table.players
+    pk.reset_cycle_states(table)
+
+    for player in players:
+        player.remove_from_stack(ANTE)
+        player.add_to_pot_participation(ANTE)
+        table.add_to_central_pot(ANTE)
+
+    betting_round = pk.BettingRound('pre-flop', table, smallest_bet_amount=BIG_BLIND, starting_player=players[2])
+    with betting_round:
+        for player, blind in ((players[0], SMALL_BLIND), (players[1], BIG_BLIND)):
+            player.remove_from_stack(blind)
+            player.add_to_current_amount(blind)
+            player.add_to_pot_participation(blind)
+        table.set_current_level(BIG_BLIND)
+        table.set_complete_current_level(BIG_BLIND)
+        betting_round.deal_cards_to_players(2)
+        for player in betting_round.listen():
+            player.request_action(choose_passive_action(betting_round.get_action_ranges()))
+
+    for name, cards_count in postflop_cards_count_by_name.items():
+        if table.players_in_hand_count == 1:
+            break
+        betting_round = pk.BettingRound(name, table, smallest_bet_amount=BIG_BLIND, starting_player=players[0])
+        with betting_round:
+            betting_round.deal_common_cards(cards_count)
+            for player in betting_round.listen():
+                player.request_action(choose_passive_action(betting_round.get_action_ranges()))
+
+    for player in table.players_in_hand:
+        player.assign_hand(pk.best_hand(player.cards, table.common_cards))
+    pk.showdown(table)
+
+
+def hand_cycle_hand(hand_cycle: pk.HandCycle):
+    "Runs a hand with the hand cycle."
+    player = hand_cycle.start()
+    while player is not None:
+        player = hand_cycle.apply_action(choose_passive_action(hand_cycle.get_action_ranges()))
+
+
+def card_work(table: pk.Table):
+    "Deals and evaluates the cards of a hand, which is the work that both ways have in common."
+    table.reset_deck()
+    hole_cards = [(table.deal_card(), table.deal_card()) for _ in table.players]
+    board = [table.deal_card() for _ in range(5)]
+    for cards in hole_cards:
+        pk.best_hand(cards, board)
+
+
+def measure(function):
+    "Retrieves the best time of a function, in microseconds per hand."
+    return min(repeat(function, number=HANDS, repeat=7)) / HANDS * 1e6
+
+
+def main():
+
+    pk.set_silent()
+    print(f'{PLAYERS_COUNT} players checking or calling every street, {HANDS} hands\n')
+
+    for trusted, preshuffle_deck in ((False, False), (True, True)):
+
+        table = pk.Table([pk.Player(f'Player {i}', 10**9) for i in range(PLAYERS_COUNT)], trusted=trusted, preshuffle_deck=preshuffle_deck)
+        hand_cycle = pk.HandCycle(table, big_blind=BIG_BLIND, small_blind=SMALL_BLIND, ante=ANTE)
+
+        stitched = measure(lambda: stitched_hand(table))
+        cycle = measure(lambda: hand_cycle_hand(hand_cycle))
+        cards = measure(lambda: card_work(table))
+
+        print(f'trusted: {trusted}, preshuffled deck: {preshuffle_deck}')
+        print(f'  betting rounds: {stitched:7.1f} µs per hand ({stitched - cards:6.1f} µs of overhead)')
+        print(f'      hand cycle: {cycle:7.1f} µs per hand ({cycle - cards:6.1f} µs of overhead)')
+        print(f'       card work: {cards:7.1f} µs per hand')
+        print(f'  overhead ratio: {(stitched - cards) / (cycle - cards):.1f}x\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark on memory
+
+Measures the memory taken per instance of the core structures, both the shallow size of the object
+(plus its attribute dictionary, if it has one) and the traced memory of building many of them, next
+to the figures recorded with the same builders before the structures were slotted (when every
+instance carried an attribute dictionary, cards were not shared and hands were evaluated eagerly).
+Run it from the root of the repository: python tests/benchmarks/benchmark_memory.py
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import tracemalloc
+
+
+import pokerpy as pk
+
+
+# Constants
+
+INSTANCES = 10_000
+
+# Shallow and traced bytes per instance before the structures were slotted (Python 3.11, 64 bits)
+BASELINE_SIZES_BY_NAME = {
+    'Card': (352, 197),
+    'Action': (352, 128),
+    'Hand': (352, 1117),
+    'Player': (352, 276),
+    'Table': (352, 10960),
+}
+
+
+def get_shallow_size(instance: object):
+    "Retrieves the size of an instance plus the size of its attribute dictionary (if it has one)."
+    size = sys.getsizeof(instance)
+    if hasattr(instance, '__dict__'):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def get_traced_size(build: callable):
+    "Retrieves the memory allocated per instance when building many of them."
+    tracemalloc.start()
+    instances = [build(i) for i in range(INSTANCES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / INSTANCES
+
+
+def build_action(i: int):
+    return pk.Action(pk.ACTION_BET, i + 1)
+
+
+def build_hand(i: int):
+    return pk.Hand([pk.Card(value, 's') for value in 'AKQJT'])
+
+
+def build_player(i: int):
+    return pk.Player(f'Player {i}', 100)
+
+
+def build_table(i: int):
+    return pk.Table([pk.Player('Andy', 100), pk.Player('Boa', 100)])
+
+
+def main():
+
+    print(f'{"structure":>10} | {"shallow bytes":>15} | {"traced bytes":>15}')
+    print(f'{"-" * 10}-+-{"-" * 15}-+-{"-" * 15}')
+
+    for name, build in (
+        ('Card', lambda i: pk.Card.from_id(i % 52)),
+        ('Action', build_action),
+        ('Hand', build_hand),
+        ('Player', build_player),
+        ('Table', build_table),
+    ):
+        baseline_shallow_size, baseline_traced_size = BASELINE_SIZES_BY_NAME[name]
+        shallow = f'{baseline_shallow_size} -> {get_shallow_size(build(0))}'
+        traced = f'{baseline_traced_size} -> {get_traced_size(build):.0f}'
+        print(f'{name:>10} | {shallow:>15} | {traced:>15}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark on the game server
+
+Starts a game server on localhost and connects thousands of bots to it, six per table, that check
+or call whenever it is their turn. Measures the hands and the actions the server gets through per
+second, and how long bots wait between being told it is their turn and seeing their action played.
+Bots share the event loop with the server, so the figures are a lower bound for the server alone.
+Run it from the root of the repository: python tests/benchmarks/benchmark_server.py [bots] [seconds]
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import asyncio
+import json
+from statistics import median
+from time import perf_counter
+
+
+import pokerpy as pk
+from pokerpy import constants
+from pokerpy.server import GameServer
+
+
+# Constants
+
+BOTS = 1_200
+SEATS = 6
+DURATION = 10.0
+
+counts = {'hands': 0, 'actions': 0}
+latencies: list[float] = []
+
+
+def choose_passive_action(bounds_by_action: dict[str, list[int]]):
+    "Checks when possible, and calls otherwise."
+    if pk.ACTION_CHECK in bounds_by_action:
+        return {'type': constants.MESSAGE_ACTION, 'name': pk.ACTION_CHECK}
+    return {'type': constants.MESSAGE_ACTION, 'name': pk.ACTION_CALL, 'amount': bounds_by_action[pk.ACTION_CALL][0]}
+
+
+async def run_bot(port: int, index: int):
+
+    """
+    Joins a table and plays until the connection is closed.
+    """
+
+    name = f'Bot {index}'
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(json.dumps({'type': constants.MESSAGE_JOIN, 'table': f'Table {index // SEATS}', 'name': name}).encode() + b'\n')
+
+    is_first_seat = index % SEATS == 0
+    turn_started_at = None
+
+    try:
+        while line := await reader.readline():
+            message = json.loads(line)
+            if message['type'] == constants.MESSAGE_TURN and message['player'] == name:
+                turn_started_at = perf_counter()
+                writer.write(json.dumps(choose_passive_action(message['actions'])).encode() + b'\n')
+            elif message['type'] == constants.MESSAGE_PLAYED:
+                if message['player'] == name and turn_started_at is not None:
+                    latencies.append(perf_counter() - turn_started_at)
+                    turn_started_at = None
+                if is_first_seat:
+                    counts['actions'] += 1
+            elif message['type'] == constants.MESSAGE_RESULT and is_first_seat:
+                counts['hands'] += 1
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def main(bots: int, duration: float):
+
+    pk.set_silent()
+
+    async with GameServer(port=0, seats=SEATS, timeout=5.0) as server:
+
+        started_at = perf_counter()
+        bot_tasks = [asyncio.create_task(run_bot(server.port, index)) for index in range(bots)]
+        while server.connections_count < bots:
+            await asyncio.sleep(0.05)
+        print(f'{bots} bots connected in {perf_counter() - started_at:.2f} s, {len(server.rooms)} tables\n')
+
+        counts['hands'] = counts['actions'] = 0
+        latencies.clear()
+        await asyncio.sleep(duration)
+        hands, actions, waits = counts['hands'], counts['actions'], sorted(latencies)
+
+    for task in bot_tasks:
+        task.cancel()
+    await asyncio.gather(*bot_tasks, return_exceptions=True)
+
+    print(f'  hands: {hands / duration:8.0f} per second')
+    print(f'actions: {actions / duration:8.0f} per second')
+    if waits:
+        print(f'latency: {median(waits) * 1e3:8.2f} ms median, {waits[int(len(waits) * 0.99)] * 1e3:.2f} ms 99th percentile')
+
+
+if __name__ == '__main__':
+    bots = int(sys.argv[1]) if len(sys.argv) > 1 else BOTS
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else DURATION
+    asyncio.run(main(bots, duration))
@@ -0,0 +1,65 @@
+"""
+Benchmark on the headless simulator
+
+Measures the throughput of pokerpy.sim, in hands per second, for tables of 2, 6 and 9 players that
+either check or call every street or act at random, and of run_simulation as workers are added.
+Run it from the root of the repository: python tests/benchmarks/benchmark_sim.py
+"""
+
+
+import os
+import sys
+sys.path.insert(0, '.')
+
+
+from pokerpy import sim
+
+
+# Constants
+
+HANDS = 5_000
+STACK = 1_000
+SMALL_BLIND = 5
+BIG_BLIND = 10
+SEED = 1
+
+
+def main():
+
+    print(f'{HANDS} hands per run, best of 3\n')
+
+    for policy_name in ('passive', 'random'):
+        for players_count in (2, 6, 9):
+
+            best_result = None
+            for _ in range(3):
+                if policy_name == 'passive':
+                    policies = {f'Player {index}': sim.passive_policy for index in range(players_count)}
+                else:
+                    policies = {f'Player {index}': sim.random_policy(index) for index in range(players_count)}
+                result = sim.simulate(policies, hands=HANDS, stack=STACK, big_blind=BIG_BLIND, small_blind=SMALL_BLIND, seed=SEED)
+                if best_result is None or result.hands_per_second > best_result.hands_per_second:
+                    best_result = result
+
+            print(f'{policy_name:>7} policies, {players_count} players: {best_result.hands_per_second:8.0f} hands per second')
+
+    cpu_count = os.cpu_count() or 1
+    print(f'\nrandom policies, 6 players, {cpu_count} cores\n')
+
+    for workers in sorted({1, 2, 4, cpu_count}):
+        policies = {f'Player {index}': sim.random_policy(index) for index in range(6)}
+        result = sim.run_simulation(
+            policies,
+            hands=HANDS * workers,
+            stack=STACK,
+            big_blind=BIG_BLIND,
+            small_blind=SMALL_BLIND,
+            batch_size=HANDS // 4,
+            workers=workers,
+            seed=SEED,
+        )
+        print(f'{workers:>3} workers: {result.hands_per_second:8.0f} hands per second')
+
+
+if __name__ == '__main__':
+    main()
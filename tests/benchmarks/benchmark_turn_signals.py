@@ -0,0 +1,85 @@
+"""
+Benchmark on turn signals
+
+Measures the per-lap cost of passing over folded and all-in seats in a 9-handed table, when turns
+report their outcome by raising signal exceptions (prompt_player) and by returning them (run_turn).
+Run it from the root of the repository: python tests/benchmarks/benchmark_turn_signals.py
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from timeit import repeat
+
+
+import pokerpy as pk
+from pokerpy.engines import prompt_player, run_turn
+from pokerpy.exceptions import CloseBettingRoundSignal, JumpToNextPlayerSignal
+
+
+# Constants
+
+PLAYERS_COUNT = 9
+FOLDED_PLAYERS_COUNT = 4
+ALL_IN_PLAYERS_COUNT = 2
+LAPS = 20_000
+
+
+def build_table():
+
+    """
+    Builds a table where some players are folded or all-in, so their turns are skipped.
+    """
+
+    table = pk.Table([pk.Player(f'Player {i}', 100) for i in range(PLAYERS_COUNT)])
+    players = table.players
+
+    for player in players[:FOLDED_PLAYERS_COUNT]:
+        player.mark_is_folded()
+    for player in players[FOLDED_PLAYERS_COUNT:FOLDED_PLAYERS_COUNT + ALL_IN_PLAYERS_COUNT]:
+        player.remove_from_stack(player.stack)
+    table.set_stopping_player(players[-1])
+
+    return table
+
+
+def lap_with_signals(table: pk.Table, skipped_players: tuple[pk.Player, ...]):
+    "Passes over the skipped seats as run_listener used to do, catching signal exceptions."
+    for player in skipped_players:
+        try:
+            yield from prompt_player(table=table, current_player=player, open_fold_allowed=False, ignore_invalid_actions=True)
+        except JumpToNextPlayerSignal:
+            continue
+        except CloseBettingRoundSignal:
+            break
+
+
+def lap_with_return_codes(table: pk.Table, skipped_players: tuple[pk.Player, ...]):
+    "Passes over the skipped seats as run_listener does now, checking the returned signals."
+    for player in skipped_players:
+        signal = yield from run_turn(table=table, current_player=player, open_fold_allowed=False, ignore_invalid_actions=True)
+        if signal in pk.engines.closing_signals:
+            break
+
+
+def main():
+
+    table = build_table()
+    skipped_players = tuple(player for player in table.players if player.is_folded or player.stack == 0)
+
+    print(f'{PLAYERS_COUNT} players, {len(skipped_players)} skipped seats per lap, {LAPS} laps\n')
+
+    results = {}
+    for name, lap in (('signal exceptions', lap_with_signals), ('return codes', lap_with_return_codes)):
+        seconds = min(repeat(lambda: [*lap(table, skipped_players)], number=LAPS, repeat=5))
+        results[name] = seconds / LAPS * 1e6
+        print(f'{name:>18}: {results[name]:.2f} µs per lap')
+
+    saving = results['signal exceptions'] - results['return codes']
+    print(f'\nsaving: {saving:.2f} µs per lap ({saving / results["signal exceptions"]:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -275,6 +275,7 @@ def game():
 
 
 def main():
+    pk.configure_logging()
     game()
 
 if __name__ == '__main__':
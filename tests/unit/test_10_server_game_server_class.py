@@ -0,0 +1,276 @@
+"""
+Defines unit tests on GameServer class.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import patch
+
+
+from pokerpy import constants, logger, messages, server
+
+
+class Client:
+
+
+    """
+    Minimal client that speaks JSON lines with the game server.
+    """
+
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+
+    @classmethod
+    async def connect(cls, port: int):
+        return cls(*await asyncio.open_connection('127.0.0.1', port))
+
+
+    def send(self, message: dict):
+        self.writer.write(json.dumps(message).encode() + b'\n')
+
+
+    async def receive(self):
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 2))
+
+
+    async def receive_until(self, message_type: str):
+        while (message := await self.receive())['type'] != message_type:
+            pass
+        return message
+
+
+    async def play_passively(self, name: str, hands: int):
+
+        """
+        Checks or calls every turn of the player until the given number of hands is over, and
+        retrieves the received messages.
+        """
+
+        received_messages = []
+        while sum(message['type'] == constants.MESSAGE_RESULT for message in received_messages) < hands:
+            message = await self.receive()
+            received_messages.append(message)
+            if message['type'] == constants.MESSAGE_TURN and message['player'] == name:
+                if constants.ACTION_CHECK in message['actions']:
+                    self.send({'type': constants.MESSAGE_ACTION, 'name': constants.ACTION_CHECK})
+                else:
+                    self.send({'type': constants.MESSAGE_ACTION, 'name': constants.ACTION_CALL, 'amount': message['actions'][constants.ACTION_CALL][0]})
+        return received_messages
+
+
+    def close(self):
+        self.writer.close()
+
+
+class StalledWriter:
+
+
+    """
+    Stream writer whose client never reads, so draining never ends.
+    """
+
+
+    def __init__(self):
+        self.is_closed = False
+
+    def write(self, data: bytes):
+        pass
+
+    async def drain(self):
+        await asyncio.Event().wait()
+
+    def close(self):
+        self.is_closed = True
+
+
+class TestGameServer(IsolatedAsyncioTestCase):
+
+
+    """
+    Runs unit tests on GameServer class.
+    """
+
+
+    def setUp(self):
+        self.was_silent = logger.is_silent()
+        logger.set_silent()
+
+
+    def tearDown(self):
+        logger.set_silent(self.was_silent)
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on GameServer class with an invalid input.
+        """
+
+
+        with self.assertRaises(TypeError) as cm:
+            server.GameServer(8765)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_str.format(int.__name__))
+
+        with self.assertRaises(ValueError) as cm:
+            server.GameServer(seats=0)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_positive_value.format(0))
+
+        with self.assertRaises(ValueError) as cm:
+            server.GameServer(seats=1)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_enough_players.format(2))
+
+        with self.assertRaises(ValueError) as cm:
+            server.GameServer(timeout=-1)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_positive_value.format(-1))
+
+
+    async def test_hands(self):
+
+
+        """
+        Runs test cases on hands played by clients over the network.
+        """
+
+
+        async with server.GameServer(port=0, seats=2, stack=100, big_blind=2, small_blind=1, timeout=1, hands=3) as game_server:
+
+            Andy = await Client.connect(game_server.port)
+            Boa = await Client.connect(game_server.port)
+
+            Andy.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': 'Andy'})
+            seated_message = await Andy.receive()
+            self.assertEqual(seated_message, {'type': constants.MESSAGE_SEATED, 'table': 'Wood', 'name': 'Andy', 'seat': 0, 'stack': 100})
+            Boa.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': 'Boa'})
+            await Boa.receive()
+
+            messages_by_name = dict(zip(('Andy', 'Boa'), await asyncio.gather(Andy.play_passively('Andy', 3), Boa.play_passively('Boa', 3))))
+
+            # Hole cards are only sent to their player
+
+            hand_messages = [[message for message in received if message['type'] == constants.MESSAGE_HAND] for received in messages_by_name.values()]
+            self.assertEqual(len(hand_messages[0]), 3)
+            for Andy_message, Boa_message in zip(*hand_messages):
+                self.assertEqual(len(Andy_message['cards']), 2)
+                self.assertFalse(set(Andy_message['cards']) & set(Boa_message['cards']))
+
+            # Both players see the same changes, and chips are never lost
+
+            shared_messages = [[message for message in received if message['type'] != constants.MESSAGE_HAND] for received in messages_by_name.values()]
+            self.assertEqual(shared_messages[0], shared_messages[1])
+
+            result_messages = [message for message in shared_messages[0] if message['type'] == constants.MESSAGE_RESULT]
+            self.assertTrue(all(sum(message['stacks'].values()) == 200 for message in result_messages))
+            self.assertTrue(all(len(message['board']) == 5 for message in result_messages))
+
+            Andy.close()
+            Boa.close()
+
+
+    async def test_errors_and_timeouts(self):
+
+
+        """
+        Runs test cases on the errors sent back to clients and on players who do not act in time.
+        """
+
+
+        async with server.GameServer(port=0, seats=2, stack=100, big_blind=2, small_blind=1, timeout=0.05, hands=1) as game_server:
+
+            Andy = await Client.connect(game_server.port)
+            Boa = await Client.connect(game_server.port)
+            Coral = await Client.connect(game_server.port)
+
+            Andy.writer.write(b'Wood\n')
+            self.assertEqual(await Andy.receive(), {'type': constants.MESSAGE_ERROR, 'message': messages.msg_invalid_server_message})
+
+            Andy.send({'type': constants.MESSAGE_ACTION, 'name': constants.ACTION_CHECK})
+            self.assertEqual((await Andy.receive())['message'], messages.msg_not_seated)
+
+            Andy.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': 'Andy'})
+            await Andy.receive()
+            Boa.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': 'Andy'})
+            self.assertEqual((await Boa.receive())['message'], messages.msg_seat_is_taken.format('Andy', 'Wood'))
+
+            Boa.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': 'Boa'})
+            await Boa.receive()
+            Coral.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': 'Coral'})
+            self.assertEqual((await Coral.receive())['message'], messages.msg_table_is_full.format('Wood'))
+
+            # The small blind acts first heads-up, so the big blind cannot act yet
+
+            turn_message = await Boa.receive_until(constants.MESSAGE_TURN)
+            self.assertEqual(turn_message['player'], 'Andy')
+            Boa.send({'type': constants.MESSAGE_ACTION, 'name': constants.ACTION_CHECK})
+            self.assertEqual((await Boa.receive_until(constants.MESSAGE_ERROR))['message'], messages.msg_player_is_not_current_player.format('Boa'))
+
+            # Nobody acts, so the small blind folds when time runs out
+
+            played_message = await Boa.receive_until(constants.MESSAGE_PLAYED)
+            self.assertEqual((played_message['player'], played_message['name']), ('Andy', constants.ACTION_FOLD))
+            result_message = await Boa.receive_until(constants.MESSAGE_RESULT)
+            self.assertEqual(result_message['stacks'], {'Andy': 99, 'Boa': 101})
+
+            for client in (Andy, Boa, Coral):
+                client.close()
+
+
+    async def test_table_errors(self):
+
+
+        """
+        Runs test cases on tables whose hands stop because of an unexpected error.
+        """
+
+
+        async with server.GameServer(port=0, seats=2, stack=100, big_blind=2, small_blind=1) as game_server:
+
+            Andy = await Client.connect(game_server.port)
+            Boa = await Client.connect(game_server.port)
+
+            with patch.object(server.TableRoom, 'push_hand', side_effect=RuntimeError('Wood')):
+                for name, client in (('Andy', Andy), ('Boa', Boa)):
+                    client.send({'type': constants.MESSAGE_JOIN, 'table': 'Wood', 'name': name})
+                    await client.receive_until(constants.MESSAGE_SEATED)
+
+                # The clients are told about the error, and then their connections are closed
+                for client in (Andy, Boa):
+                    self.assertEqual(await client.receive(), {'type': constants.MESSAGE_ERROR, 'message': messages.msg_table_stopped.format('Wood')})
+                    self.assertEqual(await asyncio.wait_for(client.reader.readline(), 2), b'')
+
+            for client in (Andy, Boa):
+                client.close()
+
+
+    async def test_backpressure(self):
+
+
+        """
+        Runs test cases on connections whose client stops reading.
+        """
+
+
+        writer = StalledWriter()
+        connection = server.Connection(asyncio.StreamReader(), writer, queue_size=3)
+
+        for _ in range(4):
+            connection.send({'type': constants.MESSAGE_PLAYED})
+            await asyncio.sleep(0)
+        self.assertFalse(connection.is_closed)
+
+        connection.send({'type': constants.MESSAGE_PLAYED})
+        self.assertTrue(connection.is_closed)
+        self.assertTrue(writer.is_closed)
+
+
+if __name__ == '__main__':
+    main()
@@ -57,6 +57,7 @@ class TestAction(TestCase):
         # Zero amount
         structures.Action(constants.ACTION_FOLD)
         structures.Action(constants.ACTION_FOLD, 0)
+        self.assertFalse(hasattr(structures.Action(constants.ACTION_FOLD), '__dict__'))
 
         # Non-zero amount
         with self.assertRaises(ValueError) as cm:
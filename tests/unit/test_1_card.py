@@ -7,6 +7,8 @@ import sys
 sys.path.insert(0, '.')
 
 
+import copy
+import pickle
 from unittest import main, TestCase
 
 
@@ -365,5 +367,47 @@ class TestCard(TestCase):
         self.assertEqual(structures.Card('2', 'c').get_deck_position(), 0)
 
 
+
+    def test_interning(self):
+
+
+        """
+        Runs test cases to check cards are interned instances identified by their ids.
+        """
+
+
+        # Same value and suit always retrieve the same instance
+
+        self.assertIs(structures.Card('A', 's'), structures.Card('A', 's'))
+        self.assertIs(structures.Card('a', 'S'), structures.Card('A', 's'))
+        self.assertIs(copy.deepcopy(structures.Card('7', 'd')), structures.Card('7', 'd'))
+        self.assertIs(pickle.loads(pickle.dumps(structures.Card('7', 'd'))), structures.Card('7', 'd'))
+
+
+        # Ids match deck positions and hashes
+
+        for card_id, (value, suit) in enumerate(constants.full_sorted_values_and_suits):
+            card = structures.Card(value, suit)
+            self.assertEqual(card.id, card_id)
+            self.assertEqual(hash(card), card_id)
+            self.assertIs(structures.Card.from_id(card_id), card)
+
+
+        # No per-instance dictionary
+
+        self.assertFalse(hasattr(structures.Card('A', 's'), '__dict__'))
+
+
+        # Invalid ids
+
+        with self.assertRaises(TypeError) as cm:
+            structures.Card.from_id('51')
+        self.assertEqual(cm.exception.args[0], messages.msg_not_int.format(str.__name__))
+
+        with self.assertRaises(ValueError) as cm:
+            structures.Card.from_id(52)
+        self.assertEqual(cm.exception.args[0], messages.msg_invalid_card_id)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
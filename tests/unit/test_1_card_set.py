@@ -0,0 +1,130 @@
+"""
+Defines unit tests on CardSet class.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import constants, messages, structures
+
+
+class TestCardSet(TestCase):
+
+
+    """
+    Runs unit tests on CardSet class.
+    """
+
+
+    def test_instantiation(self):
+
+
+        """
+        Runs test cases to check if card set instantiation works as expected.
+        """
+
+
+        # Valid inputs
+
+        card_set = structures.CardSet([structures.Card('A', 's'), structures.Card('2', 'c')])
+        self.assertEqual(card_set.bitmask, (1 << 51) | 1)
+        self.assertEqual(len(structures.CardSet()), 0)
+        self.assertEqual(len(structures.CardSet.full_deck()), 52)
+        self.assertEqual(structures.CardSet.from_bitmask(card_set.bitmask), card_set)
+
+
+        # Invalid inputs
+
+        with self.assertRaises(TypeError) as cm:
+            structures.CardSet(98765)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_iterable_object.format(int.__name__))
+
+        with self.assertRaises(TypeError) as cm:
+            structures.CardSet(['As'])
+        self.assertEqual(cm.exception.args[0], messages.msg_not_all_card_instances)
+
+        with self.assertRaises(TypeError) as cm:
+            structures.CardSet.from_bitmask('1')
+        self.assertEqual(cm.exception.args[0], messages.msg_not_int.format(str.__name__))
+
+        with self.assertRaises(ValueError) as cm:
+            structures.CardSet.from_bitmask(1 << 52)
+        self.assertEqual(cm.exception.args[0], messages.msg_invalid_card_set_bitmask)
+
+
+    def test_methods(self):
+
+
+        """
+        Runs test cases on membership, insertion, removal and iteration.
+        """
+
+
+        card_set = structures.CardSet()
+
+        card_set.add(structures.Card('T', 'd'))
+        card_set.add(structures.Card('3', 'h'))
+        card_set.add(structures.Card('3', 'h'))
+        self.assertEqual(len(card_set), 2)
+        self.assertIn(structures.Card('T', 'd'), card_set)
+        self.assertNotIn(structures.Card('T', 'h'), card_set)
+        self.assertNotIn('Td', card_set)
+
+        # Cards are iterated from lowest to highest id
+        self.assertListEqual(list(card_set), [structures.Card('3', 'h'), structures.Card('T', 'd')])
+        self.assertListEqual(list(card_set.iter_card_ids()), [6, 33])
+
+        card_set.remove(structures.Card('3', 'h'))
+        self.assertListEqual(list(card_set), [structures.Card('T', 'd')])
+
+        with self.assertRaises(ValueError) as cm:
+            card_set.remove(structures.Card('3', 'h'))
+        self.assertEqual(cm.exception.args[0], messages.msg_card_not_in_card_set)
+
+        card_set.discard(structures.Card('3', 'h'))
+        card_set.discard(structures.Card('T', 'd'))
+        self.assertFalse(card_set)
+
+        card_set.fill()
+        self.assertEqual(card_set, structures.CardSet.full_deck())
+
+        with self.assertRaises(TypeError) as cm:
+            card_set.add('3h')
+        self.assertEqual(cm.exception.args[0], messages.msg_not_card_instance.format(str.__name__))
+
+
+    def test_set_operations(self):
+
+
+        """
+        Runs test cases on copies, unions, intersections and differences.
+        """
+
+
+        deck = structures.CardSet.full_deck()
+        board = structures.CardSet([structures.Card('A', 's'), structures.Card('K', 's'), structures.Card('Q', 's')])
+        hole_cards = structures.CardSet([structures.Card('A', 'h'), structures.Card('A', 's')])
+
+        self.assertEqual(len(deck - board), 49)
+        self.assertEqual(len(board | hole_cards), 4)
+        self.assertEqual(list(board & hole_cards), [structures.Card('A', 's')])
+        self.assertFalse(board.isdisjoint(hole_cards))
+        self.assertTrue((deck - board).isdisjoint(board))
+
+        copied_board = board.copy()
+        copied_board.clear()
+        self.assertEqual(len(board), 3)
+
+        self.assertSetEqual(
+            set(deck),
+            {structures.Card(value, suit) for value, suit in constants.full_sorted_values_and_suits},
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Defines unit tests on the random number generators that deal the cards.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import messages, structures
+
+
+def deal_hands(table: structures.Table, hands_count: int, cards_count: int = 9):
+
+    """
+    Deals the given number of cards at every hand, and retrieves the cards and the hand headers.
+    """
+
+    cards_by_hand: list[list[structures.Card]] = []
+    hand_headers: list[structures.HandHeader] = []
+
+    for _ in range(hands_count):
+        table.reset_deck()
+        cards_by_hand.append([table.deal_card() for _ in range(cards_count)])
+        hand_headers.append(table.hand_header)
+
+    return cards_by_hand, hand_headers
+
+
+class TestRNG(TestCase):
+
+
+    """
+    Runs unit tests on the random number generators that deal the cards.
+    """
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on random number generators with an invalid input.
+        """
+
+
+        with self.assertRaises(TypeError) as context:
+            structures.Table([structures.Player('Andy', 10)], rng='Wood')
+        self.assertEqual(context.exception.args[0], messages.msg_not_rng_instance.format(str.__name__))
+
+        with self.assertRaises(TypeError) as context:
+            structures.SeededRNG('Wood')
+        self.assertEqual(context.exception.args[0], messages.msg_not_int.format(str.__name__))
+
+        with self.assertRaises(TypeError) as context:
+            structures.ScriptedDeck([structures.Card('A', 's'), 'Kd'])
+        self.assertEqual(context.exception.args[0], messages.msg_not_all_card_instances)
+
+        with self.assertRaises(ValueError) as context:
+            structures.ScriptedDeck([structures.Card('A', 's'), structures.Card('A', 's')])
+        self.assertEqual(context.exception.args[0], messages.msg_repeated_cards)
+
+        # The base class leaves choosing and shuffling cards to its subclasses
+        with self.assertRaises(TypeError):
+            structures.RNG()
+
+
+    def test_hand_headers(self):
+
+
+        """
+        Runs test cases on the hand headers recorded by the table.
+        """
+
+
+        table = structures.Table([structures.Player('Andy', 10)])
+        self.assertIsInstance(table.rng, structures.CryptoRNG)
+        self.assertIsNone(table.hand_header)
+
+        _, hand_headers = deal_hands(table, 2)
+        self.assertEqual([header.hand_number for header in hand_headers], [1, 2])
+        self.assertEqual([header.rng_name for header in hand_headers], ['CryptoRNG', 'CryptoRNG'])
+        self.assertEqual([header.seed for header in hand_headers], [None, None])
+
+
+        # The first hand of a seeded generator is dealt from its seed
+
+        table = structures.Table([structures.Player('Andy', 10)], rng=structures.SeededRNG(7))
+        _, hand_headers = deal_hands(table, 3)
+        self.assertEqual(hand_headers[0].seed, 7)
+        self.assertEqual(len({header.seed for header in hand_headers}), 3)
+
+
+    def test_seeded_replay(self):
+
+
+        """
+        Runs test cases on replaying hands from the seeds recorded in their headers.
+        """
+
+
+        for preshuffle_deck in (False, True):
+
+            table = structures.Table([structures.Player('Andy', 10)], preshuffle_deck=preshuffle_deck, rng=structures.SeededRNG(7))
+            cards_by_hand, hand_headers = deal_hands(table, 4)
+
+
+            # The same seed deals the same hands
+
+            replay_table = structures.Table([structures.Player('Andy', 10)], preshuffle_deck=preshuffle_deck, rng=structures.SeededRNG(7))
+            self.assertEqual(deal_hands(replay_table, 4)[0], cards_by_hand)
+
+
+            # The seed of any hand replays it, and the hands after it
+
+            replay_table = structures.Table(
+                [structures.Player('Andy', 10)],
+                preshuffle_deck=preshuffle_deck,
+                rng=structures.SeededRNG(hand_headers[2].seed),
+            )
+            self.assertEqual(deal_hands(replay_table, 2)[0], cards_by_hand[2:])
+
+
+    def test_scripted_deck(self):
+
+
+        """
+        Runs test cases on dealing the cards of a scripted deck.
+        """
+
+
+        script = [structures.Card('A', 's'), structures.Card('A', 'h'), structures.Card('K', 'd')]
+
+        for preshuffle_deck in (False, True):
+
+            table = structures.Table([structures.Player('Andy', 10)], preshuffle_deck=preshuffle_deck, rng=structures.ScriptedDeck(script))
+
+
+            # The script is dealt at every hand, followed by the rest of the deck in its sorted order
+
+            cards_by_hand, _ = deal_hands(table, 2, cards_count=5)
+            for cards in cards_by_hand:
+                self.assertEqual(cards, script + [structures.Card('2', 'c'), structures.Card('2', 'd')])
+
+
+            # Scripted cards cannot be dealt if they are no longer in the deck
+
+            table.reset_deck()
+            table.remove_card_from_deck(structures.Card('A', 's'))
+            with self.assertRaises(ValueError) as context:
+                table.deal_card()
+            self.assertEqual(context.exception.args[0], messages.msg_card_not_in_deck)
+
+
+if __name__ == '__main__':
+    main()
@@ -31,13 +31,14 @@ class TestHandInstantiation(TestCase):
 
         # Valid inputs
 
-        structures.Hand([ ## list
+        hand = structures.Hand([ ## list
             structures.Card('A', 's'),
             structures.Card('K', 's'),
             structures.Card('Q', 's'),
             structures.Card('J', 's'),
             structures.Card('T', 's'),
         ])
+        self.assertFalse(hasattr(hand, '__dict__'))
 
         structures.Hand(( ## tuple
             structures.Card('A', 's'),
@@ -0,0 +1,168 @@
+"""
+Defines unit tests on evaluate_cards function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import subprocess
+from itertools import combinations
+from unittest import main, TestCase
+
+
+from pokerpy import constants, messages, structures
+
+
+class TestHandEvaluateCards(TestCase):
+
+
+    """
+    Runs unit tests on evaluate_cards function.
+    """
+
+
+    def test_input(self):
+
+
+        """
+        Runs test cases to check input is valid.
+        """
+
+
+        # More cards than expected
+
+        cards = [
+            structures.Card('K', 'h'),
+            structures.Card('7', 'h'),
+            structures.Card('2', 'd'),
+            structures.Card('5', 's'),
+            structures.Card('K', 'c'),
+            structures.Card('A', 'c'),
+        ]
+
+        with self.assertRaises(ValueError) as cm:
+            structures.evaluate_cards(cards)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_five_cards_hand)
+
+
+        # Exactly five cards but some repeated
+
+        cards = [
+            structures.Card('2', 'd'),
+            structures.Card('5', 's'),
+            structures.Card('2', 'd'),
+            structures.Card('5', 's'),
+            structures.Card('A', 'c'),
+        ]
+
+        with self.assertRaises(ValueError) as cm:
+            structures.evaluate_cards(cards)
+        self.assertEqual(cm.exception.args[0], messages.msg_repeated_cards)
+
+
+    def test_categories(self):
+
+
+        """
+        Runs test cases to check strengths map to the same category as get_category function.
+        """
+
+
+        hands = [
+            ('A', 's', 'K', 's', 'Q', 's', 'J', 's', 'T', 's'),
+            ('9', 'h', 'K', 'h', 'Q', 'h', 'J', 'h', 'T', 'h'),
+            ('5', 'c', '4', 'c', '3', 'c', '2', 'c', 'A', 'c'),
+            ('7', 'd', '7', 'c', '7', 'h', '7', 's', 'T', 'h'),
+            ('7', 'd', '7', 'c', '7', 'h', 'T', 's', 'T', 'h'),
+            ('A', 'd', '8', 'd', '7', 'd', '4', 'd', '3', 'd'),
+            ('5', 'c', '4', 'd', '3', 'c', '2', 'c', 'A', 'c'),
+            ('A', 'c', 'K', 'd', 'Q', 'c', 'J', 'c', 'T', 'c'),
+            ('7', 'd', '7', 'c', '7', 'h', '2', 's', 'T', 'h'),
+            ('7', 'd', '7', 'c', '2', 'h', '2', 's', 'T', 'h'),
+            ('7', 'd', '7', 'c', '3', 'h', '2', 's', 'T', 'h'),
+            ('8', 'd', '3', 's', 'J', 'c', '7', 'c', '4', 's'),
+        ]
+
+        for hand in hands:
+            cards = [structures.Card(hand[i], hand[i + 1]) for i in range(0, 10, 2)]
+            strength = structures.evaluate_cards(cards)
+            self.assertEqual(structures.get_strength_category(strength), structures.get_category(cards))
+
+
+    def test_strengths(self):
+
+
+        """
+        Runs test cases to check strengths are sorted as hands are, ignoring suits.
+        """
+
+
+        def evaluate(*values_and_suits: str):
+            return structures.evaluate_cards([structures.Card(value, suit) for value, suit in values_and_suits])
+
+
+        # Same values with different suits are equally good
+
+        self.assertEqual(evaluate('As', 'Ks', 'Qs', 'Js', 'Ts'), evaluate('Ac', 'Kc', 'Qc', 'Jc', 'Tc'))
+        self.assertEqual(evaluate('Ad', 'Ah', '3c', '3h', '9s'), evaluate('As', 'Ac', '3d', '3s', '9h'))
+
+
+        # Higher categories beat lower categories
+
+        ordered_hands = [
+            evaluate('8d', '3s', 'Jc', '7c', '4s'), # high card
+            evaluate('2d', '2s', '3c', '4c', '5s'), # pair
+            evaluate('2d', '2s', '3c', '3h', '4s'), # two pair
+            evaluate('2d', '2s', '2c', '3h', '4s'), # three of a kind
+            evaluate('5c', '4d', '3c', '2c', 'Ac'), # straight
+            evaluate('7d', '5d', '4d', '3d', '2d'), # flush
+            evaluate('2d', '2s', '2c', '3h', '3s'), # full house
+            evaluate('2d', '2s', '2c', '2h', '3s'), # four of a kind
+            evaluate('5c', '4c', '3c', '2c', 'Ac'), # straight flush
+            evaluate('As', 'Ks', 'Qs', 'Js', 'Ts'), # royal flush
+        ]
+        self.assertListEqual(ordered_hands, sorted(ordered_hands))
+        self.assertEqual(len(set(ordered_hands)), len(ordered_hands))
+
+
+        # Within a category, arranged values decide
+
+        self.assertGreater(evaluate('6c', '5d', '4c', '3c', '2c'), evaluate('5c', '4d', '3c', '2c', 'Ac'))
+        self.assertGreater(evaluate('3d', '3s', '3c', '2h', '2s'), evaluate('2d', '2s', '2c', 'Ah', 'As'))
+        self.assertGreater(evaluate('Kd', 'Ks', '2c', '2h', '3s'), evaluate('Qd', 'Qs', 'Jc', 'Jh', 'As'))
+        self.assertGreater(evaluate('Ad', 'Ks', 'Qc', 'Jh', '9s'), evaluate('Ad', 'Ks', 'Qc', 'Jh', '8s'))
+
+
+        # Strengths range over the 7462 distinct classes of five card hands
+
+        deck = [structures.Card(value, suit) for value, suit in constants.full_sorted_values_and_suits]
+        strengths = {structures.evaluate_cards(cards) for cards in combinations(deck[:24], 5)}
+        self.assertTrue(all(0 <= strength < 7462 for strength in strengths))
+        self.assertEqual(structures.get_strength_category(0), constants.HIGH_CARD)
+        self.assertEqual(structures.get_strength_category(7461), constants.ROYAL_FLUSH)
+
+
+
+    def test_lookup_tables_are_built_lazily(self):
+
+
+        """
+        Runs test cases to check the lookup tables are built on the first evaluation, not on import.
+        """
+
+
+        code = (
+            "from pokerpy import structures; "
+            "from pokerpy.structures._hand._evaluate_cards import get_lookup_tables; "
+            "print(get_lookup_tables.cache_info().currsize); "
+            "structures.get_strength_category(0); "
+            "print(get_lookup_tables.cache_info().currsize)"
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['0', '1'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Defines unit tests on best_hand function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from itertools import combinations
+from random import Random
+from unittest import main, TestCase
+
+
+from pokerpy import constants, messages, structures
+
+
+class TestHandBestHand(TestCase):
+
+
+    """
+    Runs unit tests on best_hand function.
+    """
+
+
+    def test_input(self):
+
+
+        """
+        Runs test cases to check input is valid.
+        """
+
+
+        # Invalid input types
+
+        with self.assertRaises(TypeError) as cm:
+            structures.best_hand(98765, [])
+        self.assertEqual(cm.exception.args[0], messages.msg_not_iterable_object.format(int.__name__))
+
+        with self.assertRaises(TypeError) as cm:
+            structures.best_hand([structures.Card('A', 's')], ['Ah', 'Kh', 'Qh', 'Jh'])
+        self.assertEqual(cm.exception.args[0], messages.msg_not_all_card_instances)
+
+
+        # Not enough or too many cards
+
+        with self.assertRaises(ValueError) as cm:
+            structures.best_hand([structures.Card('A', 's'), structures.Card('A', 'h')], [structures.Card('A', 'd')])
+        self.assertEqual(cm.exception.args[0], messages.msg_not_five_to_seven_cards)
+
+        with self.assertRaises(ValueError) as cm:
+            structures.best_hand(
+                [structures.Card('A', 's'), structures.Card('A', 'h')],
+                [structures.Card(value, 'c') for value in '23456J'],
+            )
+        self.assertEqual(cm.exception.args[0], messages.msg_not_five_to_seven_cards)
+
+
+        # Repeated cards
+
+        with self.assertRaises(ValueError) as cm:
+            structures.best_hand(
+                [structures.Card('A', 's'), structures.Card('A', 'h')],
+                [structures.Card('A', 's'), structures.Card('2', 'c'), structures.Card('3', 'c')],
+            )
+        self.assertEqual(cm.exception.args[0], messages.msg_repeated_cards)
+
+
+    def test_specific_hands(self):
+
+
+        """
+        Runs test cases on hands whose best five cards are not obvious.
+        """
+
+
+        def figure_out(hole_cards: str, board: str):
+            return structures.best_hand(
+                [structures.Card(hole_cards[i], hole_cards[i + 1]) for i in range(0, len(hole_cards), 2)],
+                [structures.Card(board[i], board[i + 1]) for i in range(0, len(board), 2)],
+            )
+
+        # A straight and a flush that do not make a straight flush
+        hand = figure_out('9h8h', '7h6s5hAd')
+        self.assertEqual(hand.category, constants.STRAIGHT)
+        hand = figure_out('9h8h', '7h6s5hAd2h')
+        self.assertEqual(hand.category, constants.FLUSH)
+
+        # A wheel straight flush beating a higher flush
+        hand = figure_out('Ac2c', '3c4c5cKcQc')
+        self.assertEqual(hand.category, constants.STRAIGHT_FLUSH)
+        self.assertEqual([card.value for card in hand.cards], ['5', '4', '3', '2', 'A'])
+
+        # Two three of a kinds make a full house
+        hand = figure_out('9h9c', '9d5s5h5dAh')
+        self.assertEqual(hand.category, constants.FULL_HOUSE)
+        self.assertEqual([card.value for card in hand.cards], ['9', '9', '9', '5', '5'])
+
+        # Three pairs make two pair with the best kicker
+        hand = figure_out('9h9c', '5s5hAhAdKd')
+        self.assertEqual(hand.category, constants.TWO_PAIR)
+        self.assertEqual([card.value for card in hand.cards], ['A', 'A', '9', '9', 'K'])
+
+
+    def test_same_hand_as_every_combination(self):
+
+
+        """
+        Runs test cases to check the hand is as good as the best five-card combination.
+        """
+
+
+        deck = [structures.Card(value, suit) for value, suit in constants.full_sorted_values_and_suits]
+        random = Random(0)
+
+        for cards_count in (5, 6, 7):
+            for _ in range(300):
+                cards = random.sample(deck, cards_count)
+                hand = structures.best_hand(cards[:2], cards[2:])
+                expected_hand = max(structures.Hand(combination) for combination in combinations(cards, 5))
+                self.assertEqual(hand, expected_hand)
+                self.assertEqual(hand.category, expected_hand.category)
+                self.assertTrue(set(hand.cards).issubset(cards))
+
+
+if __name__ == '__main__':
+    main()
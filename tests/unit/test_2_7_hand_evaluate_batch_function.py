@@ -0,0 +1,102 @@
+"""
+Defines unit tests on evaluate_batch function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from random import Random
+from unittest import main, skipIf, TestCase
+from unittest.mock import patch
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+from pokerpy import constants, messages, structures
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class TestHandEvaluateBatch(TestCase):
+
+
+    """
+    Runs unit tests on evaluate_batch function.
+    """
+
+
+    def test_input(self):
+
+
+        """
+        Runs test cases to check input is valid.
+        """
+
+
+        # Invalid shapes, types and ids
+
+        for card_ids in ([1, 2, 3, 4, 5], [[1, 2, 3, 4]], [[0.0, 1.0, 2.0, 3.0, 4.0]], [[0, 1, 2, 3, 52]]):
+            with self.assertRaises(ValueError) as cm:
+                structures.evaluate_batch(card_ids)
+            self.assertEqual(cm.exception.args[0], messages.msg_invalid_card_ids_array)
+
+
+        # Repeated cards within a row
+
+        with self.assertRaises(ValueError) as cm:
+            structures.evaluate_batch([[0, 1, 2, 3, 4], [0, 1, 2, 3, 3]])
+        self.assertEqual(cm.exception.args[0], messages.msg_repeated_cards)
+
+
+    def test_same_ordering_as_hands(self):
+
+
+        """
+        Runs test cases to check strengths and categories match the ones of the best hands.
+        """
+
+
+        random = Random(0)
+
+        for cards_count in (5, 6, 7):
+
+            rows = [random.sample(range(52), cards_count) for _ in range(500)]
+            strengths, category_indices = structures.evaluate_batch(np.array(rows))
+            self.assertEqual(strengths.shape, (500,))
+            self.assertEqual(category_indices.shape, (500,))
+
+            hands = [structures.best_hand([structures.Card.from_id(card_id) for card_id in row]) for row in rows]
+            for hand, strength, category_index in zip(hands, strengths, category_indices):
+                self.assertEqual(hand.strength, strength)
+                self.assertEqual(hand.category, constants.sorted_hand_categories[category_index])
+
+
+class TestHandEvaluateBatchWithoutNumpy(TestCase):
+
+
+    """
+    Runs unit tests on evaluate_batch function when NumPy is missing.
+    """
+
+
+    def test_missing_numpy(self):
+
+
+        """
+        Runs test cases to check NumPy is only required once a batch is evaluated.
+        """
+
+
+        with patch.dict(sys.modules, {'numpy': None}):
+            with self.assertRaises(ImportError) as cm:
+                structures.evaluate_batch([[0, 1, 2, 3, 4]])
+        self.assertEqual(cm.exception.args[0], messages.msg_missing_numpy)
+
+
+if __name__ == '__main__':
+    main()
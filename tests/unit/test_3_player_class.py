@@ -7,6 +7,8 @@ import sys
 sys.path.insert(0, '.')
 
 
+import gc
+import weakref
 from unittest import main, TestCase
 
 
@@ -29,9 +31,10 @@ class TestPlayerClass(TestCase):
         """
 
 
-        # Valid inputs
+        # Valid inputs (slotted, without an attribute dictionary)
 
-        structures.Player('Andy', 1000)
+        player = structures.Player('Andy', 1000)
+        self.assertFalse(hasattr(player, '__dict__'))
 
 
         # Invalid inputs
@@ -82,6 +85,10 @@ class TestPlayerClass(TestCase):
             Andy.request_action(constants.ACTION_BET)
         self.assertEqual(cm.exception.args[0], messages.msg_not_action_instance.format(str.__name__))
 
+        with self.assertRaises(TypeError) as cm:
+            Andy.set_action_waiter('Wood')
+        self.assertEqual(cm.exception.args[0], messages.msg_not_future_instance.format(str.__name__))
+
 
     def test_card_methods(self):
 
@@ -343,5 +350,28 @@ class TestPlayerClass(TestCase):
         self.assertFalse(Andy.has_played)
 
 
+    def test_attach_table_method(self):
+
+
+        """
+        Runs test cases on attach_table method.
+        """
+
+
+        Andy = structures.Player('Andy', 1000)
+        Boa = structures.Player('Boa', 1000)
+
+        table = structures.Table([Andy, Boa])
+        table_ref = weakref.ref(table)
+        Andy.remove_from_stack(1000)
+        self.assertEqual(table.active_players_count, 1)
+
+        # The player does not keep alive the tables it leaves
+        del table
+        gc.collect()
+        self.assertIsNone(table_ref())
+        Andy.add_to_stack(1000)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
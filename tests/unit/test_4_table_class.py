@@ -36,6 +36,7 @@ class TestTableClassInstantiation(TestCase):
             Boa := structures.Player('Boa', 10),
             Coral := structures.Player('Coral', 10),
         ])
+        self.assertFalse(hasattr(table, '__dict__'))
         self.assertSetEqual(set(table.players), {Andy, Boa, Coral})
         self.assertEqual(table.starting_player, Andy)
         self.assertEqual(table.stopping_player, Coral)
@@ -193,6 +194,49 @@ class TestTableClassMethodsForCards(TestCase):
         self.assertEqual(context.exception.args[0], messages.msg_card_not_in_deck)
 
 
+    def test_deal_card_method(self):
+
+
+        """
+        Runs test cases on deal_card method, with and without a preshuffled deck.
+        """
+
+
+        for preshuffle_deck in (False, True):
+
+            table = structures.Table(
+                [structures.Player('Andy', 10), structures.Player('Boa', 10)],
+                preshuffle_deck=preshuffle_deck,
+            )
+            self.assertEqual(table.preshuffles_deck, preshuffle_deck)
+
+
+            # Dealt cards leave the deck, which stays sorted, and are never repeated
+
+            table.remove_card_from_deck(structures.Card('A', 's'))
+            dealt_cards = [table.deal_card() for _ in range(51)]
+
+            self.assertEqual(table.deck, ())
+            self.assertEqual(len(set(dealt_cards)), 51)
+            self.assertNotIn(structures.Card('A', 's'), dealt_cards)
+
+            with self.assertRaises(ValueError) as context:
+                table.deal_card()
+            self.assertEqual(context.exception.args[0], messages.msg_empty_deck)
+
+
+            # Cards removed after shuffling are skipped, and resetting the deck reshuffles it
+
+            table.reset_deck()
+            table.deal_card()
+            table.remove_card_from_deck(structures.Card('K', 'h'))
+            dealt_cards = [table.deal_card() for _ in range(10)]
+
+            self.assertNotIn(structures.Card('K', 'h'), dealt_cards)
+            self.assertEqual(len(table.deck), 40)
+            self.assertEqual(table.deck, tuple(sorted(table.deck)))
+
+
     def test_methods_for_common_cards(self):
 
 
@@ -366,6 +410,102 @@ class TestTableClassMethodsForCards(TestCase):
         self.assertEqual(context.exception.args[0], messages.msg_not_positive_or_zero_value.format(-10))
 
 
+    def test_split_pot_property(self):
+
+
+        """
+        Runs test cases on split_pot property, which is cached until the pot changes.
+        """
+
+
+        table = structures.Table([
+            Andy := structures.Player('Andy', 10),
+            Boa := structures.Player('Boa', 10),
+            Coral := structures.Player('Coral', 10),
+        ])
+
+
+        # Equal participations make a single pot
+
+        for player in table.players:
+            player.add_to_pot_participation(4)
+        table.add_to_central_pot(12)
+
+        self.assertEqual(table.split_pot, [12])
+
+
+        # Changes in the central pot or in the participations split it again
+
+        Andy.add_to_pot_participation(3)
+        Boa.add_to_pot_participation(5)
+        table.add_to_central_pot(8)
+
+        self.assertEqual(table.split_pot, [12, 6, 2])
+
+
+        # Folded players leave their chips in the last pot
+
+        Coral.mark_is_folded()
+        self.assertEqual(table.split_pot, [14, 6])
+
+        Coral.unmark_is_folded()
+        self.assertEqual(table.split_pot, [0, 14, 6])
+
+
+        # Returned lists do not affect the cached value
+
+        table.split_pot.append(100)
+        self.assertEqual(table.split_pot, [0, 14, 6])
+
+        table.reset_central_pot()
+        for player in table.players:
+            player.reset_pot_participation()
+        self.assertEqual(table.split_pot, [0])
+
+
+    def test_players_in_hand_and_active_players(self):
+
+
+        """
+        Runs test cases on players_in_hand and active_players properties, which follow the players.
+        """
+
+
+        table = structures.Table([
+            Andy := structures.Player('Andy', 10),
+            Boa := structures.Player('Boa', 10),
+            Coral := structures.Player('Coral', 10),
+        ])
+
+        self.assertEqual(table.players_in_hand, (Andy, Boa, Coral))
+        self.assertEqual(table.active_players, (Andy, Boa, Coral))
+        self.assertEqual(table.players_in_hand_count, 3)
+        self.assertEqual(table.active_players_count, 3)
+
+
+        # Folded players leave both, all-in players only leave the active players
+
+        Boa.mark_is_folded()
+        Coral.remove_from_stack(10)
+
+        self.assertEqual(table.players_in_hand, (Andy, Coral))
+        self.assertEqual(table.active_players, (Andy,))
+        self.assertEqual(table.players_in_hand_count, 2)
+        self.assertEqual(table.active_players_count, 1)
+        self.assertTrue(table.is_last_active_player(Andy))
+        self.assertFalse(table.is_last_active_player(Coral))
+
+
+        # Players come back in their seating order
+
+        Coral.add_to_stack(5)
+        Boa.unmark_is_folded()
+
+        self.assertEqual(table.players_in_hand, (Andy, Boa, Coral))
+        self.assertEqual(table.active_players, (Andy, Boa, Coral))
+        self.assertFalse(table.is_last_active_player(Andy))
+
+
 
 class TestTableClassMethodsForIteration(TestCase):
 
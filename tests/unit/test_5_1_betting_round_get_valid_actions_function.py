@@ -2847,5 +2847,78 @@ class TestFacingAnOverAggression(TestCase):
         )
 
 
+
+class TestValidActionsResult(TestCase):
+
+
+    """
+    Runs unit tests on the result retrieved by get_valid_actions function.
+    """
+
+
+    def test_result(self):
+
+        """
+        Runs test cases on the mapping interface of the result, and on sharing it between queries.
+        """
+
+        kwargs = dict(
+            player_stack = 100,
+            player_current_amount = 2,
+            player_has_played = False,
+            current_level = 6,
+            complete_current_level = 6,
+            full_bet = 2,
+            full_raise_increase = 4,
+            is_last_active_player = False,
+            open_fold_allowed = False,
+        )
+        valid_actions = engines.get_valid_actions(**kwargs)
+
+        self.assertIsInstance(valid_actions, engines.ValidActions)
+        self.assertEqual(
+            valid_actions,
+            {
+                constants.ACTION_CALL: range(4, 5),
+                constants.ACTION_FOLD: range(0, 1),
+                constants.ACTION_RAISE: range(8, 101),
+            },
+        )
+        self.assertEqual(list(valid_actions), [constants.ACTION_CALL, constants.ACTION_FOLD, constants.ACTION_RAISE])
+        self.assertNotIn(constants.ACTION_CHECK, valid_actions)
+        self.assertIsNone(valid_actions.get(constants.ACTION_BET))
+        self.assertEqual(valid_actions.get_bounds(constants.ACTION_RAISE), (8, 100))
+
+        self.assertTrue(valid_actions.is_valid(constants.ACTION_RAISE, 100))
+        self.assertFalse(valid_actions.is_valid(constants.ACTION_RAISE, 7))
+        self.assertFalse(valid_actions.is_valid(constants.ACTION_CHECK, 0))
+
+        # The same decision point retrieves the same instance
+
+        self.assertIs(engines.get_valid_actions(**kwargs), valid_actions)
+        self.assertFalse(hasattr(valid_actions, '__dict__'))
+
+
+    def test_shared_with_betting_round(self):
+
+        """
+        Runs test cases on the ranges a betting round retrieves for its current player.
+        """
+
+        table = structures.Table([
+            structures.Player('Andy', 10),
+            structures.Player('Boa', 10),
+        ])
+        betting_round = engines.BettingRound('preflop', table)
+        Andy = betting_round.start()
+
+        valid_actions = betting_round.get_action_ranges()
+        self.assertEqual(valid_actions, {constants.ACTION_CHECK: range(0, 1), constants.ACTION_BET: range(1, 11)})
+        self.assertIs(betting_round.get_action_ranges(), valid_actions)
+
+        self.assertIsNot(betting_round.apply_action(structures.Action(constants.ACTION_BET, 5)), Andy)
+        self.assertNotEqual(betting_round.get_action_ranges(), valid_actions)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
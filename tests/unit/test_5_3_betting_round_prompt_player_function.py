@@ -266,5 +266,63 @@ class TestBettingRoundPromptPlayerFunction(TestCase):
         self.assertIsNone(context.exception.value)
 
 
+class TestBettingRoundRunTurnFunction(TestCase):
+
+
+    """
+    Runs unit tests on run_turn function, which returns the signals that prompt_player raises.
+    """
+
+
+    def test_skipped_players(self):
+
+        """
+        Runs test cases where the prompted player cannot parse an action, comparing both functions.
+        """
+
+        table = structures.Table(players = [
+            Andy := structures.Player('Andy', 10),
+            Boa := structures.Player('Boa', 10),
+            Coral := structures.Player('Coral', 10),
+            Dino := structures.Player('Dino', 10),
+        ])
+        Andy.mark_is_folded()
+        Boa.remove_from_stack(10)
+        table.set_stopping_player(Dino)
+
+        cases = (
+            (Andy, exceptions.JumpToNextPlayerSignal, messages.signal_folded_player),
+            (Boa, exceptions.JumpToNextPlayerSignal, messages.signal_all_in_player),
+        )
+
+        for player, signal_class, signal in cases:
+
+            with self.assertRaises(StopIteration) as context:
+                next(engines.run_turn(table=table, current_player=player, open_fold_allowed=False, ignore_invalid_actions=True))
+            self.assertEqual(context.exception.value, signal)
+
+            with self.assertRaises(signal_class) as context:
+                next(engines.prompt_player(table=table, current_player=player, open_fold_allowed=False, ignore_invalid_actions=True))
+            self.assertEqual(context.exception.cause, signal)
+
+        # A player able to act is awaited by both functions
+
+        self.assertIs(next(engines.run_turn(table=table, current_player=Coral, open_fold_allowed=False, ignore_invalid_actions=True)), Coral)
+        self.assertIs(next(engines.prompt_player(table=table, current_player=Coral, open_fold_allowed=False, ignore_invalid_actions=True)), Coral)
+
+        # Closing signals
+
+        Coral.mark_is_folded()
+        Dino.mark_is_folded()
+
+        with self.assertRaises(StopIteration) as context:
+            next(engines.run_turn(table=table, current_player=Dino, open_fold_allowed=False, ignore_invalid_actions=True))
+        self.assertEqual(context.exception.value, messages.signal_last_player_in_hand)
+
+        with self.assertRaises(exceptions.CloseBettingRoundSignal) as context:
+            next(engines.prompt_player(table=table, current_player=Dino, open_fold_allowed=False, ignore_invalid_actions=True))
+        self.assertEqual(context.exception.cause, messages.signal_last_player_in_hand)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+Defines unit tests on the methods that drive a betting round without the listener.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from random import Random
+from unittest import main, TestCase
+
+
+from pokerpy import constants, engines, messages, structures
+
+
+def build_table(stacks: list[int]):
+    "Builds a table with one player per stack."
+    return structures.Table([structures.Player(f'Player {i}', stack) for i, stack in enumerate(stacks)])
+
+
+def choose_action(betting_round: engines.BettingRound, random: Random):
+
+    """
+    Chooses a random valid action for the current player (or an invalid one, from time to time).
+    """
+
+    if random.random() < 0.1:
+        return structures.Action(constants.ACTION_CHECK, 0) if constants.ACTION_CALL in betting_round.get_action_ranges() else structures.Action(constants.ACTION_CALL, 1)
+
+    range_by_action = betting_round.get_action_ranges()
+    action_name, amount_range = random.choice([(name, amount_range) for name, amount_range in range_by_action.items() if amount_range is not None])
+    return structures.Action(action_name, random.choice(amount_range))
+
+
+def get_table_state(table: structures.Table):
+    "Retrieves the states that a betting round changes."
+    return (
+        table.central_pot,
+        [(player.stack, player.pot_participation, player.is_folded, player.current_amount) for player in table.players],
+    )
+
+
+class TestBettingRoundApplyAction(TestCase):
+
+
+    """
+    Runs unit tests on start and apply_action methods.
+    """
+
+
+    def test_invalid_usage(self):
+
+
+        """
+        Runs test cases on apply_action method when it is not expected.
+        """
+
+
+        betting_round = engines.BettingRound('pre-flop', build_table([10, 10]))
+
+        with self.assertRaises(RuntimeError) as context:
+            betting_round.apply_action(structures.Action(constants.ACTION_CHECK, 0))
+        self.assertEqual(context.exception.args[0], messages.msg_betting_round_was_not_started)
+
+        betting_round.start()
+
+        with self.assertRaises(TypeError) as context:
+            betting_round.apply_action('check')
+        self.assertEqual(context.exception.args[0], messages.msg_not_action_instance.format(str.__name__))
+
+        betting_round.apply_action(structures.Action(constants.ACTION_BET, 10))
+        self.assertIsNone(betting_round.apply_action(structures.Action(constants.ACTION_FOLD, 0)))
+        self.assertTrue(betting_round.is_completed)
+
+        with self.assertRaises(RuntimeError) as context:
+            betting_round.apply_action(structures.Action(constants.ACTION_CHECK, 0))
+        self.assertEqual(context.exception.args[0], messages.msg_betting_round_is_completed)
+
+
+    def test_invalid_actions(self):
+
+
+        """
+        Runs test cases on apply_action method with actions that are not allowed.
+        """
+
+
+        betting_round = engines.BettingRound('pre-flop', table := build_table([10, 10, 10]))
+        first_player, second_player, _ = table.players
+
+        self.assertIs(betting_round.start(), first_player)
+        self.assertIs(betting_round.apply_action(structures.Action(constants.ACTION_CALL, 3)), first_player)
+        self.assertIs(betting_round.apply_action(structures.Action(constants.ACTION_BET, 2)), second_player)
+
+        betting_round = engines.BettingRound('pre-flop', build_table([10, 10, 10]), ignore_invalid_actions=False)
+        betting_round.start()
+        with self.assertRaises(RuntimeError) as context:
+            betting_round.apply_action(structures.Action(constants.ACTION_CALL, 3))
+        self.assertEqual(context.exception.args[0], messages.msg_forbidden_action)
+
+
+    def test_raises_over_an_incomplete_raise(self):
+
+
+        """
+        Runs test cases on the levels set by raises that follow an incomplete all-in raise.
+        """
+
+
+        betting_round = engines.BettingRound('flop', table := build_table([100, 100, 25, 100]), smallest_bet_amount=10)
+        first_player, _, third_player, fourth_player = table.players
+
+        betting_round.start()
+        betting_round.apply_action(structures.Action(constants.ACTION_BET, 10))
+        self.assertIs(betting_round.apply_action(structures.Action(constants.ACTION_RAISE, 20)), third_player)
+
+        # An incomplete all-in raise moves the level to the amount of the player, but not the complete level
+
+        self.assertIs(betting_round.apply_action(structures.Action(constants.ACTION_RAISE, 25)), fourth_player)
+        self.assertEqual((table.current_level, table.complete_current_level, table.full_raise_increase), (25, 20, 10))
+        self.assertEqual(betting_round.get_action_ranges().get_bounds(constants.ACTION_RAISE), (30, 100))
+
+        # A full raise over it sets the level to the amount of the raiser, not to the complete level plus the raise over 25
+
+        self.assertIs(betting_round.apply_action(structures.Action(constants.ACTION_RAISE, 30)), first_player)
+        self.assertEqual((table.current_level, table.complete_current_level, table.full_raise_increase), (30, 30, 10))
+        self.assertEqual(betting_round.get_action_ranges().get_bounds(constants.ACTION_CALL), (20, 20))
+        self.assertEqual(betting_round.get_action_ranges().get_bounds(constants.ACTION_RAISE), (30, 90))
+
+
+    def test_same_behavior_as_listener(self):
+
+
+        """
+        Runs test cases to check apply_action method plays exactly as the listener.
+        """
+
+
+        for seed in range(200):
+
+            stacks = Random(seed).choices([1, 3, 10, 25, 60], k=Random(seed).randint(2, 6))
+
+            # Driven by the listener
+
+            random = Random(seed)
+            table = build_table(stacks)
+            listened_actions = []
+            with engines.BettingRound('pre-flop', table) as betting_round:
+                for player in betting_round.listen():
+                    action = choose_action(betting_round, random)
+                    listened_actions.append((player.name, action.name, action.amount))
+                    player.request_action(action)
+            listened_state = get_table_state(table)
+
+            # Driven by apply_action
+
+            random = Random(seed)
+            table = build_table(stacks)
+            applied_actions = []
+            betting_round = engines.BettingRound('pre-flop', table)
+            player = betting_round.start()
+            while player is not None:
+                action = choose_action(betting_round, random)
+                applied_actions.append((player.name, action.name, action.amount))
+                player = betting_round.apply_action(action)
+
+            self.assertTrue(betting_round.is_completed)
+            self.assertEqual(applied_actions, listened_actions)
+            self.assertEqual(get_table_state(table), listened_state)
+
+
+if __name__ == '__main__':
+    main()
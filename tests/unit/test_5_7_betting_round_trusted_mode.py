@@ -0,0 +1,140 @@
+"""
+Defines unit tests on betting rounds played on trusted tables.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from random import Random
+from unittest import main, TestCase
+
+
+from pokerpy import constants, engines, messages, structures
+
+
+def play_betting_round(stacks: list[int], seed: int, trusted: bool):
+
+    """
+    Plays a betting round with random actions and retrieves the actions and the final states.
+    """
+
+    random = Random(seed)
+    table = structures.Table([structures.Player(f'Player {i}', stack) for i, stack in enumerate(stacks)], trusted=trusted)
+    actions = []
+
+    with engines.BettingRound('pre-flop', table) as betting_round:
+        for player in betting_round.listen():
+            range_by_action = betting_round.get_action_ranges()
+            action_name, amount_range = random.choice([(name, amount_range) for name, amount_range in range_by_action.items() if amount_range is not None])
+            action = structures.Action(action_name, random.choice(amount_range))
+            actions.append((player.name, action.name, action.amount))
+            player.request_action(action)
+
+    states = (
+        table.central_pot,
+        table.split_pot,
+        [(player.stack, player.pot_participation, player.is_folded) for player in table.players],
+    )
+    return actions, states
+
+
+class TestTrustedMode(TestCase):
+
+
+    """
+    Runs unit tests on trusted tables.
+    """
+
+
+    def tearDown(self):
+        structures.set_trusted_mode(False)
+
+
+    def test_trusted_mode_switches(self):
+
+        """
+        Runs test cases on the table argument and the process-wide default.
+        """
+
+        players = [structures.Player('Andy', 10), structures.Player('Boa', 10)]
+
+        self.assertFalse(structures.Table(players).is_trusted)
+        self.assertTrue(structures.Table(players, trusted=True).is_trusted)
+
+        structures.set_trusted_mode()
+        self.assertTrue(structures.get_trusted_mode())
+        self.assertTrue(structures.Table(players).is_trusted)
+        self.assertFalse(structures.Table(players, trusted=False).is_trusted)
+
+
+    def test_public_methods_stay_strict(self):
+
+        """
+        Runs test cases to check the public methods of trusted tables and players still validate inputs.
+        """
+
+        table = structures.Table([Andy := structures.Player('Andy', 10), structures.Player('Boa', 10)], trusted=True)
+
+        with self.assertRaises(TypeError) as context:
+            table.set_current_level('10')
+        self.assertEqual(context.exception.args[0], messages.msg_not_int.format(str.__name__))
+
+        with self.assertRaises(ValueError) as context:
+            Andy.remove_from_stack(11)
+        self.assertEqual(context.exception.args[0], messages.msg_amount_larger_than_stack.format(11, 10))
+
+        with self.assertRaises(ValueError) as context:
+            table.set_stopping_player(structures.Player('Coral', 10))
+        self.assertEqual(context.exception.args[0], messages.msg_player_not_in_table.format('Coral'))
+
+
+    def test_engine_methods(self):
+
+        """
+        Runs test cases to check the engine methods move the same chips on trusted and validated tables,
+        and only validated tables check their inputs.
+        """
+
+        for trusted in (True, False):
+            table = structures.Table([Andy := structures.Player('Andy', 10), Boa := structures.Player('Boa', 10)], trusted=trusted)
+            table.move_chips(Andy, 4)
+            self.assertEqual(table.raise_level(Andy, 4), Boa)
+            self.assertEqual((table.current_level, table.complete_current_level, table.full_raise_increase), (4, 4, 4))
+            table.move_chips(Boa, 4)
+            table.collect_bets()
+            table.award_chips(Boa, 8)
+            self.assertEqual((Andy.stack, Boa.stack, table.central_pot), (6, 14, 8))
+            table.reset_levels()
+            self.assertEqual((table.current_level, table.complete_current_level, table.full_raise_increase), (0, 0, 1))
+            self.assertEqual(table.stopping_player, Boa)
+
+        table = structures.Table([Andy := structures.Player('Andy', 10), structures.Player('Boa', 10)])
+
+        with self.assertRaises(ValueError) as context:
+            table.move_chips(Andy, 11)
+        self.assertEqual(context.exception.args[0], messages.msg_amount_larger_than_stack.format(11, 10))
+
+        with self.assertRaises(ValueError) as context:
+            table.award_chips(structures.Player('Coral', 10), 5)
+        self.assertEqual(context.exception.args[0], messages.msg_player_not_in_table.format('Coral'))
+
+        with self.assertRaises(TypeError) as context:
+            table.raise_level(Andy, '10')
+        self.assertEqual(context.exception.args[0], messages.msg_not_int.format(str.__name__))
+
+
+    def test_same_behavior_as_validated_tables(self):
+
+        """
+        Runs test cases to check betting rounds play the same on trusted and validated tables.
+        """
+
+        for seed in range(200):
+            stacks = Random(seed).choices([1, 3, 10, 25, 60], k=Random(seed).randint(2, 6))
+            self.assertEqual(play_betting_round(stacks, seed, trusted=True), play_betting_round(stacks, seed, trusted=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Defines unit tests on the methods that await player actions in an event loop.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import asyncio
+import subprocess
+from unittest import IsolatedAsyncioTestCase, main
+
+
+from pokerpy import constants, engines, logger, messages, structures
+
+
+def build_table(stacks: list[int]):
+    "Builds a table with one player per stack."
+    return structures.Table([structures.Player(f'Player {i}', stack) for i, stack in enumerate(stacks)])
+
+
+class TestBettingRoundAsyncMethods(IsolatedAsyncioTestCase):
+
+
+    """
+    Runs unit tests on wait_action and alisten methods.
+    """
+
+
+    def setUp(self):
+        self.was_silent = logger.is_silent()
+        logger.set_silent()
+
+
+    def tearDown(self):
+        logger.set_silent(self.was_silent)
+
+
+    def test_asyncio_is_imported_lazily(self):
+
+        """
+        Runs test cases to check importing PokerPy does not load asyncio until a player is awaited.
+        """
+
+        code = "import sys; import pokerpy; print('asyncio' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+
+    async def test_wait_action(self):
+
+
+        """
+        Runs test cases on wait_action method.
+        """
+
+
+        table = build_table([10, 10])
+        Andy, Boa = table.players
+        betting_round = engines.BettingRound('flop', table, smallest_bet_amount=2)
+        betting_round.start()
+
+        with self.assertRaises(ValueError) as context:
+            await betting_round.wait_action(Boa)
+        self.assertEqual(context.exception.args[0], messages.msg_player_is_not_current_player.format('Player 1'))
+
+        with self.assertRaises(ValueError) as context:
+            await betting_round.wait_action(Andy, timeout=0)
+        self.assertEqual(context.exception.args[0], messages.msg_not_positive_value.format(0))
+
+
+        # The request resolves the future, and the player is left without requested action
+
+        asyncio.get_running_loop().call_soon(Andy.request_action, structures.Action(constants.ACTION_BET, 2))
+        action = await betting_round.wait_action(Andy, timeout=1)
+        self.assertEqual((action.name, action.amount), (constants.ACTION_BET, 2))
+        self.assertIsNone(Andy.requested_action)
+
+
+        # An action requested before waiting is retrieved straight away
+
+        Andy.request_action(structures.Action(constants.ACTION_CHECK))
+        action = await betting_round.wait_action(Andy)
+        self.assertEqual(action.name, constants.ACTION_CHECK)
+
+
+        # Running out of time checks when possible, and folds otherwise
+
+        action = await betting_round.wait_action(Andy, timeout=0.01)
+        self.assertEqual(action.name, constants.ACTION_CHECK)
+
+        betting_round.apply_action(structures.Action(constants.ACTION_BET, 2))
+        action = await betting_round.wait_action(Boa, timeout=0.01)
+        self.assertEqual(action.name, constants.ACTION_FOLD)
+
+
+    async def test_alisten(self):
+
+
+        """
+        Runs test cases on alisten method with many betting rounds sharing the event loop.
+        """
+
+
+        async def play(table: structures.Table):
+
+            Andy, Boa, Coral = table.players
+            betting_round = engines.BettingRound('flop', table, smallest_bet_amount=2)
+
+            async for player in betting_round.alisten(timeout=0.05):
+                if player is Andy:
+                    asyncio.get_running_loop().call_later(0.001, Andy.request_action, structures.Action(constants.ACTION_BET, 2))
+                elif player is Coral:
+                    Coral.request_action(structures.Action(constants.ACTION_CALL, 2))
+
+            return betting_round
+
+        tables = [build_table([10, 10, 10]) for _ in range(100)]
+        betting_rounds = await asyncio.gather(*(play(table) for table in tables))
+
+        for table, betting_round in zip(tables, betting_rounds):
+            Andy, Boa, Coral = table.players
+            self.assertTrue(betting_round.is_completed)
+            self.assertEqual(table.central_pot, 4)
+            self.assertEqual([player.is_folded for player in table.players], [False, True, False])
+            self.assertEqual([player.stack for player in table.players], [8, 10, 8])
+
+
+    async def test_alisten_timeouts(self):
+
+
+        """
+        Runs test cases on the time every turn of alisten method is given.
+        """
+
+
+        betting_round = engines.BettingRound('flop', build_table([10, 10]), smallest_bet_amount=2)
+        with self.assertRaises(ValueError) as context:
+            await anext(betting_round.alisten(timeout=0))
+        self.assertEqual(context.exception.args[0], messages.msg_not_positive_value.format(0))
+
+
+        # Every turn is given the whole timeout, so two players who do not act take twice the time
+
+        loop = asyncio.get_running_loop()
+        table = build_table([10, 10])
+        betting_round = engines.BettingRound('flop', table, smallest_bet_amount=2)
+        started_at = loop.time()
+        async for _ in betting_round.alisten(timeout=0.05):
+            pass
+        self.assertGreaterEqual(loop.time() - started_at, 0.1)
+        self.assertTrue(betting_round.is_completed)
+        self.assertEqual([player.stack for player in table.players], [10, 10])
+
+
+        # The time of a turn counts from the moment its player is yielded, so a turn whose time is
+        # spent before awaiting the action is not given more
+
+        table = build_table([10, 10])
+        betting_round = engines.BettingRound('flop', table, smallest_bet_amount=2)
+        started_at = loop.time()
+        async for _ in betting_round.alisten(timeout=0.05):
+            await asyncio.sleep(0.06)
+        self.assertLess(loop.time() - started_at, 0.2)
+        self.assertTrue(betting_round.is_completed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+"""
+Defines unit tests on HandCycle class.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from random import Random
+from unittest import main, TestCase
+
+
+from pokerpy import constants, engines, messages, structures
+
+
+def build_table(stacks: list[int], cards: str = ''):
+
+    """
+    Builds a table with one player per stack, whose deck deals the parsed cards (written as 'AsKd')
+    at the beginning of every hand.
+    """
+
+    scripted_cards = [structures.Card(cards[i], cards[i + 1]) for i in range(0, len(cards), 2)]
+    return structures.Table(
+        [structures.Player(f'Player {i}', stack) for i, stack in enumerate(stacks)],
+        rng = structures.ScriptedDeck(scripted_cards),
+    )
+
+
+class TestHandCycle(TestCase):
+
+
+    """
+    Runs unit tests on HandCycle class.
+    """
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on HandCycle class with an invalid input or an unexpected usage.
+        """
+
+
+        table = build_table([100, 100])
+
+        with self.assertRaises(TypeError) as context:
+            engines.HandCycle('Wood', big_blind=10)
+        self.assertEqual(context.exception.args[0], messages.msg_not_table_instance.format(str.__name__))
+
+        with self.assertRaises(ValueError) as context:
+            engines.HandCycle(table, big_blind=0)
+        self.assertEqual(context.exception.args[0], messages.msg_not_positive_value.format(0))
+
+        with self.assertRaises(ValueError) as context:
+            engines.HandCycle(table, big_blind=10, ante=-1)
+        self.assertEqual(context.exception.args[0], messages.msg_not_positive_or_zero_value.format(-1))
+
+        with self.assertRaises(ValueError) as context:
+            engines.HandCycle(table, big_blind=10, small_blind_player=structures.Player('Wood', 10))
+        self.assertEqual(context.exception.args[0], messages.msg_player_not_in_table.format('Wood'))
+
+        hand_cycle = engines.HandCycle(table, big_blind=10, small_blind=5)
+
+        with self.assertRaises(RuntimeError) as context:
+            hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0))
+        self.assertEqual(context.exception.args[0], messages.msg_hand_cycle_was_not_started)
+
+        hand_cycle.start()
+
+        with self.assertRaises(RuntimeError) as context:
+            hand_cycle.start()
+        self.assertEqual(context.exception.args[0], messages.msg_hand_cycle_is_running)
+
+        self.assertIsNone(hand_cycle.apply_action(structures.Action(constants.ACTION_FOLD, 0)))
+
+        with self.assertRaises(RuntimeError) as context:
+            hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0))
+        self.assertEqual(context.exception.args[0], messages.msg_hand_cycle_is_completed)
+
+        with self.assertRaises(RuntimeError) as context:
+            with hand_cycle:
+                hand_cycle.start()
+        self.assertEqual(context.exception.args[0], messages.msg_hand_cycle_was_not_completed)
+
+
+    def test_full_hand(self):
+
+
+        """
+        Runs test cases on a hand that goes from the antes to the showdown.
+        """
+
+
+        table = build_table([100, 100, 100], 'AsKs7cAhKh2d3c8d9sJh4c')
+        Player0, Player1, Player2 = table.players
+        hand_cycle = engines.HandCycle(table, big_blind=10, small_blind=5, ante=1)
+
+
+        # Antes, blinds and hole cards
+
+        self.assertIs(hand_cycle.start(), Player2)
+        self.assertEqual(hand_cycle.street_name, constants.PREFLOP)
+        self.assertEqual(table.central_pot, 3)
+        self.assertEqual((Player0.current_amount, Player1.current_amount), (5, 10))
+        self.assertEqual(Player0.cards, (structures.Card('A', 's'), structures.Card('A', 'h')))
+        self.assertEqual(hand_cycle.get_action_ranges(), {
+            constants.ACTION_CALL: range(10, 11),
+            constants.ACTION_FOLD: range(0, 1),
+            constants.ACTION_RAISE: range(20, 100),
+        })
+
+
+        # Pre-flop (the big blind closes the street)
+
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_FOLD, 0)), Player0)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CALL, 5)), Player1)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0)), Player0)
+
+
+        # Flop (invalid actions are ignored by default)
+
+        self.assertEqual(hand_cycle.street_name, constants.FLOP)
+        self.assertEqual(len(table.common_cards), 3)
+        self.assertEqual(table.central_pot, 23)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CALL, 10)), Player0)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0)), Player1)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_BET, 10)), Player0)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CALL, 10)), Player0)
+
+
+        # Turn and river
+
+        self.assertEqual(hand_cycle.street_name, constants.TURN)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0)), Player1)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0)), Player0)
+        self.assertEqual(hand_cycle.street_name, constants.RIVER)
+        self.assertIs(hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0)), Player1)
+        self.assertIsNone(hand_cycle.apply_action(structures.Action(constants.ACTION_CHECK, 0)))
+
+
+        # Showdown
+
+        self.assertTrue(hand_cycle.is_completed)
+        self.assertIsNone(hand_cycle.get_action_ranges())
+        self.assertEqual(Player0.hand.category, constants.ONE_PAIR)
+        self.assertEqual(table.central_pot, 43)
+        self.assertEqual([player.stack for player in table.players], [122, 79, 99])
+
+
+    def test_hands_without_actions(self):
+
+
+        """
+        Runs test cases on hands that end before anyone can act.
+        """
+
+
+        # Players who cannot cover the antes are all-in, and the board is run out for the showdown
+
+        table = build_table([1, 1, 1], 'AsKs7cAhKh2d3c8d9sJh4c')
+        hand_cycle = engines.HandCycle(table, big_blind=10, small_blind=5, ante=1)
+
+        self.assertIsNone(hand_cycle.start())
+        self.assertTrue(hand_cycle.is_completed)
+        self.assertEqual(len(table.common_cards), 5)
+        self.assertEqual([player.stack for player in table.players], [3, 0, 0])
+
+
+        # Players without chips sit the hand out
+
+        self.assertIsNone(hand_cycle.start())
+        self.assertEqual(hand_cycle.hands_count, 2)
+        self.assertEqual(table.players_in_hand, (table.players[0],))
+        self.assertEqual([player.stack for player in table.players], [3, 0, 0])
+
+
+    def test_short_stacks(self):
+
+
+        """
+        Runs test cases on a short-stacked big blind and on incomplete raises.
+        """
+
+
+        # A short big blind still makes the others call and raise from the full big blind
+
+        table = build_table([100, 4, 100])
+        hand_cycle = engines.HandCycle(table, big_blind=10, small_blind=5)
+        Andy, Boa, Coral = table.players
+
+        self.assertEqual(hand_cycle.start(), Coral)
+        self.assertEqual((table.current_level, table.complete_current_level), (10, 10))
+        self.assertEqual(hand_cycle.get_action_ranges().get_bounds(constants.ACTION_CALL), (10, 10))
+        self.assertEqual(hand_cycle.get_action_ranges().get_bounds(constants.ACTION_RAISE), (20, 100))
+
+
+        # An incomplete all-in raise moves the level to the amount of the player, but not the complete level
+
+        table = build_table([100, 100, 100, 25])
+        hand_cycle = engines.HandCycle(table, big_blind=10, small_blind=5)
+        Andy, Boa, Coral, Dave = table.players
+
+        self.assertEqual(hand_cycle.start(), Coral)
+        hand_cycle.apply_action(structures.Action(constants.ACTION_RAISE, 20))
+        self.assertEqual((table.current_level, table.complete_current_level), (20, 20))
+        self.assertEqual(hand_cycle.apply_action(structures.Action(constants.ACTION_RAISE, 25)), Andy)
+        self.assertEqual((table.current_level, table.complete_current_level), (25, 20))
+
+        # A full raise is measured from the complete level, and the others call the amount of the raiser
+
+        self.assertEqual(hand_cycle.get_action_ranges().get_bounds(constants.ACTION_RAISE), (25, 95))
+        self.assertEqual(hand_cycle.apply_action(structures.Action(constants.ACTION_RAISE, 25)), Boa)
+        self.assertEqual((table.current_level, table.complete_current_level), (30, 30))
+        self.assertEqual(hand_cycle.get_action_ranges().get_bounds(constants.ACTION_CALL), (20, 20))
+
+
+    def test_listen_method(self):
+
+
+        """
+        Runs test cases on hands driven by the listener, with random actions.
+        """
+
+
+        random = Random(5)
+
+        for trusted in (False, True):
+
+            table = structures.Table([structures.Player(f'Player {i}', 200) for i in range(6)], trusted=trusted)
+            hand_cycle = engines.HandCycle(table, big_blind=10, small_blind=5, ante=1, small_blind_player=table.players[-1])
+
+            for _ in range(30):
+
+                with hand_cycle:
+                    for player in hand_cycle.listen():
+                        action_name, amount_range = random.choice(list(hand_cycle.get_action_ranges().items()))
+                        player.request_action(structures.Action(action_name, random.choice(amount_range)))
+
+                self.assertEqual(sum(player.stack for player in table.players), 1200)
+                self.assertTrue(all(player.current_amount == 0 for player in table.players))
+                self.assertGreaterEqual(table.central_pot, sum(player.pot_participation for player in table.players))
+
+
+if __name__ == '__main__':
+    main()
@@ -426,5 +426,72 @@ class TestShowdownTie(TestCase):
         self.assertEqual(Dino.stack, 14)
 
 
+class TestShowdownSidePots(TestCase):
+
+
+    """
+    Runs unit tests on showdown function when there are side pots.
+    """
+
+
+    def test_side_pots(self):
+
+        """
+        Runs test cases on showdown function when an all-in player wins the main pot and other players share a side pot.
+        """
+
+        table = structures.Table([
+            Andy := structures.Player('Andy', 10),
+            Boa := structures.Player('Boa', 10),
+            Coral := structures.Player('Coral', 10),
+            Dino := structures.Player('Coral', 10),
+        ])
+
+        Andy.add_to_pot_participation(2)
+        Boa.add_to_pot_participation(5)
+        Coral.add_to_pot_participation(5)
+        Dino.add_to_pot_participation(5)
+        table.add_to_central_pot(17)
+
+        Andy.assign_hand(structures.Hand([
+            structures.Card('A', 's'),
+            structures.Card('K', 's'),
+            structures.Card('Q', 's'),
+            structures.Card('J', 's'),
+            structures.Card('T', 's'),
+        ]))
+        Boa.assign_hand(structures.Hand([
+            structures.Card('A', 'h'),
+            structures.Card('A', 'd'),
+            structures.Card('A', 'c'),
+            structures.Card('2', 's'),
+            structures.Card('2', 'h'),
+        ]))
+        Coral.assign_hand(structures.Hand([
+            structures.Card('A', 'h'),
+            structures.Card('K', 'h'),
+            structures.Card('Q', 'd'),
+            structures.Card('J', 'c'),
+            structures.Card('T', 'h'),
+        ]))
+        Dino.assign_hand(structures.Hand([
+            structures.Card('A', 'h'),
+            structures.Card('A', 'd'),
+            structures.Card('A', 'c'),
+            structures.Card('2', 's'),
+            structures.Card('2', 'h'),
+        ]))
+
+        self.assertEqual(table.split_pot, [8, 9])
+
+        engines.showdown(table)
+
+        # After states
+        self.assertEqual(Andy.stack, 18)
+        self.assertEqual(Boa.stack, 15)
+        self.assertEqual(Coral.stack, 10)
+        self.assertEqual(Dino.stack, 14)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
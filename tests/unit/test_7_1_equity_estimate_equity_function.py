@@ -0,0 +1,147 @@
+"""
+Defines unit tests on estimate_equity function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import engines, messages, structures
+
+
+def build_table(hole_cards_by_name: dict[str, str], common_cards: str = ''):
+
+    """
+    Builds a table whose players hold the parsed cards (written as 'AsKd'), dealt from its deck.
+    """
+
+    table = structures.Table([structures.Player(name, 10) for name in hole_cards_by_name])
+
+    for player, hole_cards in zip(table.players, hole_cards_by_name.values()):
+        for i in range(0, len(hole_cards), 2):
+            card = structures.Card(hole_cards[i], hole_cards[i + 1])
+            table.remove_card_from_deck(card)
+            player.assign_card(card)
+
+    for i in range(0, len(common_cards), 2):
+        card = structures.Card(common_cards[i], common_cards[i + 1])
+        table.remove_card_from_deck(card)
+        table.assign_common_card(card)
+
+    return table
+
+
+class TestEstimateEquity(TestCase):
+
+
+    """
+    Runs unit tests on estimate_equity function.
+    """
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on estimate_equity function with an invalid input.
+        """
+
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'})
+
+        with self.assertRaises(TypeError) as cm:
+            engines.estimate_equity('Wood')
+        self.assertEqual(cm.exception.args[0], messages.msg_not_table_instance.format(str.__name__))
+
+        with self.assertRaises(ValueError) as cm:
+            engines.estimate_equity(table, trials=0)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_positive_value.format(0))
+
+        with self.assertRaises(ValueError) as cm:
+            engines.estimate_equity(table, confidence_level=1.5)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_probability.format(1.5))
+
+        with self.assertRaises(ValueError) as cm:
+            engines.estimate_equity(table, dead_cards=[structures.Card('A', 's')])
+        self.assertEqual(cm.exception.args[0], messages.msg_repeated_cards)
+
+        table.players[0].reset_cards()
+        with self.assertRaises(ValueError) as cm:
+            engines.estimate_equity(table)
+        self.assertEqual(cm.exception.args[0], messages.msg_player_without_cards.format('Andy'))
+
+
+    def test_estimations(self):
+
+
+        """
+        Runs test cases on well-known equities.
+        """
+
+
+        # Pocket aces against pocket kings win about 82% of the time
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'})
+        equity_by_player = engines.estimate_equity(table, trials=4000, workers=1, seed=7)
+        Andy, Boa = table.players
+
+        self.assertAlmostEqual(equity_by_player[Andy].equity, 0.82, delta=0.03)
+        self.assertAlmostEqual(equity_by_player[Andy].equity + equity_by_player[Boa].equity, 1)
+        self.assertEqual(equity_by_player[Andy].runouts, 4000)
+        self.assertEqual(equity_by_player[Andy].wins, equity_by_player[Boa].losses)
+
+
+        # A full board leaves nothing to sample
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, '2c3d9hTsJs')
+        equity_by_player = engines.estimate_equity(table, trials=10, workers=1, seed=7)
+        Andy, Boa = table.players
+
+        self.assertEqual(equity_by_player[Andy].win_probability, 1)
+        self.assertEqual(equity_by_player[Boa].lose_probability, 1)
+        self.assertEqual(equity_by_player[Andy].margin_of_error, 0)
+
+
+        # The board plays for everyone
+
+        table = build_table({'Andy': '2s3h', 'Boa': '2h3s'}, 'AcKcQcJcTc')
+        equity_by_player = engines.estimate_equity(table, trials=10, workers=1, seed=7)
+        self.assertTrue(all(result.tie_probability == 1 for result in equity_by_player.values()))
+        self.assertTrue(all(result.equity == 0.5 for result in equity_by_player.values()))
+
+
+        # Dead cards are never dealt (the only remaining king is dead)
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, 'Kd2c3d')
+        equity_by_player = engines.estimate_equity(table, dead_cards=[structures.Card('K', 'c')], trials=500, workers=1, seed=7)
+        self.assertTrue(all(result.runouts == 500 for result in equity_by_player.values()))
+
+
+    def test_determinism_and_early_stop(self):
+
+
+        """
+        Runs test cases on reproducibility across workers and on stopping at a margin of error.
+        """
+
+
+        table = build_table({'Andy': 'AsKs', 'Boa': 'QhQd', 'Coral': '7c6c'})
+
+        equity_by_player_in_process = engines.estimate_equity(table, trials=600, batch_size=200, workers=1, seed=3)
+        equity_by_player_in_pool = engines.estimate_equity(table, trials=600, batch_size=200, workers=2, seed=3)
+
+        for player in table.players:
+            self.assertEqual(equity_by_player_in_process[player].wins, equity_by_player_in_pool[player].wins)
+            self.assertEqual(equity_by_player_in_process[player].ties, equity_by_player_in_pool[player].ties)
+
+        equity_by_player = engines.estimate_equity(table, trials=100_000, batch_size=500, workers=1, seed=3, margin_of_error=0.05)
+        self.assertTrue(all(result.runouts < 100_000 for result in equity_by_player.values()))
+        self.assertTrue(all(result.margin_of_error <= 0.05 for result in equity_by_player.values()))
+
+
+if __name__ == '__main__':
+    main()
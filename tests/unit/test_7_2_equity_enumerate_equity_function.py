@@ -0,0 +1,153 @@
+"""
+Defines unit tests on enumerate_equity function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import engines, messages, structures
+
+
+def build_table(hole_cards_by_name: dict[str, str], common_cards: str = ''):
+
+    """
+    Builds a table whose players hold the parsed cards (written as 'AsKd'), dealt from its deck.
+    """
+
+    table = structures.Table([structures.Player(name, 10) for name in hole_cards_by_name])
+
+    for player, hole_cards in zip(table.players, hole_cards_by_name.values()):
+        for i in range(0, len(hole_cards), 2):
+            card = structures.Card(hole_cards[i], hole_cards[i + 1])
+            table.remove_card_from_deck(card)
+            player.assign_card(card)
+
+    for i in range(0, len(common_cards), 2):
+        card = structures.Card(common_cards[i], common_cards[i + 1])
+        table.remove_card_from_deck(card)
+        table.assign_common_card(card)
+
+    return table
+
+
+class TestEnumerateEquity(TestCase):
+
+
+    """
+    Runs unit tests on enumerate_equity function.
+    """
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on enumerate_equity function with an invalid input.
+        """
+
+
+        with self.assertRaises(TypeError) as cm:
+            engines.enumerate_equity('Wood')
+        self.assertEqual(cm.exception.args[0], messages.msg_not_table_instance.format(str.__name__))
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, '2c3d9h')
+        with self.assertRaises(ValueError) as cm:
+            engines.enumerate_equity(table, dead_cards=[structures.Card('9', 'h')])
+        self.assertEqual(cm.exception.args[0], messages.msg_repeated_cards)
+
+        with self.assertRaises(TypeError) as cm:
+            engines.enumerate_equity(table, max_runouts=1.5)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_int.format(float.__name__))
+
+        # Preflop there are too many runouts to enumerate
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'})
+        with self.assertRaises(ValueError) as cm:
+            engines.enumerate_equity(table)
+        self.assertEqual(cm.exception.args[0], messages.msg_too_many_runouts.format(48 * 47 * 46 * 45 * 44 // 120, 100_000))
+
+        # Dead cards may leave the deck without cards to complete the board
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, '2c3d9hTs')
+        with self.assertRaises(ValueError) as cm:
+            engines.enumerate_equity(table, dead_cards=table.deck)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_enough_cards_in_deck)
+
+        # There must be someone in hand to share the pot
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, '2c3d9h')
+        for player in table.players:
+            player.mark_is_folded()
+        with self.assertRaises(ValueError) as cm:
+            engines.enumerate_equity(table)
+        self.assertEqual(cm.exception.args[0], messages.msg_no_players_in_hand)
+
+
+    def test_exact_equities(self):
+
+
+        """
+        Runs test cases on equities that can be counted by hand.
+        """
+
+
+        # On the turn, the underdog needs one of the two remaining kings (44 runouts)
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, '2c3d9hTs')
+        equity_by_player = engines.enumerate_equity(table)
+        Andy, Boa = table.players
+
+        self.assertEqual(equity_by_player[Andy].runouts, 44)
+        self.assertEqual(equity_by_player[Boa].wins, 2)
+        self.assertEqual(equity_by_player[Andy].wins, 42)
+        self.assertEqual(equity_by_player[Andy].margin_of_error, 0)
+        self.assertAlmostEqual(equity_by_player[Boa].equity, 2 / 44)
+
+
+        # Dead cards are never dealt
+
+        equity_by_player = engines.enumerate_equity(table, dead_cards=[structures.Card('K', 'd')])
+        self.assertEqual(equity_by_player[Andy].runouts, 43)
+        self.assertEqual(equity_by_player[Boa].wins, 1)
+
+
+        # On the flop, every pair of turn and river cards is counted once
+
+        table = build_table({'Andy': 'AsAh', 'Boa': 'KsKh'}, '2c3d9h')
+        equity_by_player = engines.enumerate_equity(table)
+        Andy, Boa = table.players
+        self.assertEqual(equity_by_player[Andy].runouts, 45 * 44 // 2)
+        self.assertAlmostEqual(equity_by_player[Andy].equity + equity_by_player[Boa].equity, 1)
+
+
+        # The board plays for everyone
+
+        table = build_table({'Andy': '2s3h', 'Boa': '2h3s'}, 'AcKcQcJcTc')
+        equity_by_player = engines.enumerate_equity(table)
+        self.assertTrue(all(result.runouts == 1 for result in equity_by_player.values()))
+        self.assertTrue(all(result.tie_probability == 1 for result in equity_by_player.values()))
+
+
+    def test_agrees_with_estimation(self):
+
+
+        """
+        Runs test cases to check the estimation converges to the exact equity.
+        """
+
+
+        table = build_table({'Andy': 'AsKs', 'Boa': 'QhQd', 'Coral': '7c6c'}, '2s8cTd')
+        exact_equity_by_player = engines.enumerate_equity(table)
+        estimated_equity_by_player = engines.estimate_equity(table, trials=3000, workers=1, seed=5)
+
+        for player in table.players:
+            self.assertAlmostEqual(exact_equity_by_player[player].equity, estimated_equity_by_player[player].equity, delta=0.04)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Defines unit tests on the preflop equity table.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import math
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from unittest import main, TestCase
+
+
+from pokerpy import engines, messages, structures
+
+
+class TestPreflopEquityTable(TestCase):
+
+
+    """
+    Runs unit tests on the preflop equity table.
+    """
+
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'preflop_equities.bin')
+        cls.table = engines.build_preflop_equity_table(cls.path, trials=2, max_opponents=3, workers=1, seed=11)
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.table.close()
+        cls.directory.cleanup()
+
+
+    def test_starting_hand_classes(self):
+
+
+        """
+        Runs test cases on the classification of hole cards.
+        """
+
+
+        self.assertEqual(len(engines.starting_hand_classes), 169)
+        self.assertEqual(len(set(engines.starting_hand_classes)), 169)
+
+        self.assertEqual(engines.get_starting_hand_class([structures.Card('A', 's'), structures.Card('K', 's')]), 'AKs')
+        self.assertEqual(engines.get_starting_hand_class([structures.Card('K', 'd'), structures.Card('A', 's')]), 'AKo')
+        self.assertEqual(engines.get_starting_hand_class([structures.Card('7', 'h'), structures.Card('7', 'c')]), '77')
+
+        with self.assertRaises(ValueError) as cm:
+            engines.get_starting_hand_class([structures.Card('A', 's')] * 2)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_two_hole_cards)
+
+
+    def test_lookups(self):
+
+
+        """
+        Runs test cases on the lookups of a built table.
+        """
+
+
+        self.assertEqual(self.table.max_opponents, 3)
+        self.assertEqual(self.table.trials, 2)
+        self.assertAlmostEqual(self.table.margin_of_error, 1.959964 * 0.5 / math.sqrt(2), places=5)
+        self.assertEqual(os.path.getsize(self.path), 8 + 2 + 2 + 4 + 8 + 2 * 169 * (169 + 3))
+
+        self.assertAlmostEqual(self.table.heads_up_equity('AA', 'AA'), 0.5, places=4)
+        for hand_class, opponent_hand_class in (('AA', 'KK'), ('72o', 'AKs'), ('T9s', '22')):
+            equity = self.table.heads_up_equity(hand_class, opponent_hand_class)
+            opponent_equity = self.table.heads_up_equity(opponent_hand_class, hand_class)
+            self.assertAlmostEqual(equity + opponent_equity, 1, places=4)
+
+        for opponents_count in (1, 2, 3):
+            self.assertTrue(0 <= self.table.equity_against_random_hands('AA', opponents_count) <= 1)
+
+        with self.assertRaises(ValueError) as cm:
+            self.table.heads_up_equity('AKx', 'AA')
+        self.assertEqual(cm.exception.args[0], messages.msg_invalid_starting_hand_class.format('AKx'))
+
+        with self.assertRaises(ValueError) as cm:
+            self.table.equity_against_random_hands('AA', 4)
+        self.assertEqual(cm.exception.args[0], messages.msg_invalid_opponents_count.format(3))
+
+
+    def test_pickling_and_invalid_files(self):
+
+
+        """
+        Runs test cases on sending the table to other processes and on reading invalid files.
+        """
+
+
+        unpickled_table = pickle.loads(pickle.dumps(self.table))
+        self.assertEqual(unpickled_table.path, self.path)
+        self.assertEqual(unpickled_table.heads_up_equity('AA', 'KK'), self.table.heads_up_equity('AA', 'KK'))
+        unpickled_table.close()
+
+        for content in (b'', b'not a preflop equity table'):
+            path = os.path.join(self.directory.name, 'invalid.bin')
+            with open(path, 'wb') as file:
+                file.write(content)
+            with self.assertRaises(ValueError) as cm:
+                engines.PreflopEquityTable(path).heads_up_equity('AA', 'KK')
+            self.assertEqual(cm.exception.args[0], messages.msg_invalid_preflop_equity_file)
+
+
+if __name__ == '__main__':
+    main()
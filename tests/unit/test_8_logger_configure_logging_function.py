@@ -0,0 +1,62 @@
+"""
+Defines unit tests on configure_logging function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+import logging
+from unittest import main, TestCase
+
+
+from pokerpy import constants, logger, messages
+
+
+class TestConfigureLogging(TestCase):
+
+
+    """
+    Runs unit tests on configure_logging function.
+    """
+
+
+    def setUp(self):
+        self.handlers = logger.get_logger().handlers.copy()
+        self.level = logger.get_logger().level
+
+
+    def tearDown(self):
+        logger.get_logger().handlers = self.handlers
+        logger.get_logger().setLevel(self.level)
+
+
+    def test_configure_logging(self):
+
+        """
+        Runs test cases to check the logger only writes messages once it is configured.
+        """
+
+        with self.assertRaises(TypeError) as context:
+            logger.configure_logging('INFO')
+        self.assertEqual(context.exception.args[0], messages.msg_not_int.format(str.__name__))
+
+        # The library only adds a handler that discards messages
+
+        pokerpy_logger = logger.get_logger()
+        pokerpy_logger.handlers = [handler for handler in pokerpy_logger.handlers if isinstance(handler, logging.NullHandler)]
+        self.assertEqual(len(pokerpy_logger.handlers), 1)
+
+        # Configuring the logger twice adds a single stream handler
+
+        logger.configure_logging(logging.INFO)
+        logger.configure_logging(logging.WARNING)
+        stream_handlers = [handler for handler in pokerpy_logger.handlers if type(handler) is logging.StreamHandler]
+        self.assertEqual(len(stream_handlers), 1)
+        self.assertEqual(stream_handlers[0].formatter._fmt, constants.LOGGER_FORMAT)
+        self.assertEqual(pokerpy_logger.level, logging.WARNING)
+
+
+if __name__ == '__main__':
+    main()
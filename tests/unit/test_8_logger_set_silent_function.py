@@ -0,0 +1,84 @@
+"""
+Defines unit tests on set_silent function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import constants, engines, logger, structures
+
+
+def build_table():
+
+    """
+    Builds a table where two players go to showdown.
+    """
+
+    table = structures.Table([
+        Andy := structures.Player('Andy', 10),
+        Boa := structures.Player('Boa', 10),
+    ])
+    table.add_to_central_pot(4)
+
+    Andy.assign_hand(structures.Hand([
+        structures.Card('A', 's'),
+        structures.Card('K', 's'),
+        structures.Card('Q', 's'),
+        structures.Card('J', 's'),
+        structures.Card('T', 's'),
+    ]))
+    Boa.assign_hand(structures.Hand([
+        structures.Card('A', 'h'),
+        structures.Card('K', 'h'),
+        structures.Card('Q', 'h'),
+        structures.Card('J', 'h'),
+        structures.Card('T', 'h'),
+    ]))
+
+    return table
+
+
+class TestSetSilent(TestCase):
+
+
+    """
+    Runs unit tests on set_silent function.
+    """
+
+
+    def tearDown(self):
+        logger.set_silent(False)
+
+
+    def test_set_silent(self):
+
+        """
+        Runs test cases to check a silent logger emits nothing and can be turned back on.
+        """
+
+        logger.set_silent()
+        self.assertTrue(logger.is_silent())
+
+        with self.assertNoLogs(constants.LOGGER_NAME):
+            engines.showdown(build_table())
+
+        logger.set_silent(False)
+        self.assertFalse(logger.is_silent())
+
+        with self.assertLogs(constants.LOGGER_NAME, 'INFO') as context:
+            engines.showdown(build_table())
+        self.assertEqual(context.output, [
+            f'INFO:{constants.LOGGER_NAME}:Remaining players: Andy, Boa',
+            f'INFO:{constants.LOGGER_NAME}:it is a tie for main pot! winners: Andy, Boa.',
+            f'INFO:{constants.LOGGER_NAME}:Andy wins 2.',
+            f'INFO:{constants.LOGGER_NAME}:Boa wins 2.',
+        ])
+
+
+if __name__ == '__main__':
+    main()
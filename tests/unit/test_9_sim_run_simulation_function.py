@@ -0,0 +1,115 @@
+"""
+Defines unit tests on run_simulation function.
+"""
+
+
+import pickle
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import constants, engines, messages, sim
+from pokerpy.sim._run_simulation import load_batch_policies
+
+
+def build_policies(count: int):
+    "Builds seeded random policies for a number of players."
+    return {f'Player {index + 1}': sim.random_policy(index) for index in range(count)}
+
+
+def get_chip_deltas(result: sim.SimulationResult):
+    "Retrieves the chip deltas of every player."
+    return [player_result.chip_delta for player_result in result.player_results]
+
+
+class TestRunSimulation(TestCase):
+
+
+    """
+    Runs unit tests on run_simulation function.
+    """
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on run_simulation function with an invalid input.
+        """
+
+
+        with self.assertRaises(ValueError) as cm:
+            sim.run_simulation(build_policies(2), hands=10, stack=100, big_blind=2, batch_size=0)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_positive_value.format(0))
+
+        with self.assertRaises(TypeError) as cm:
+            sim.run_simulation(build_policies(2), hands=10, stack=100, big_blind=2, workers=1.5)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_int.format(float.__name__))
+
+        with self.assertRaises(ValueError) as cm:
+            sim.run_simulation({'Andy': sim.passive_policy}, hands=10, stack=100, big_blind=2)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_enough_players.format(2))
+
+
+    def test_determinism_across_workers(self):
+
+
+        """
+        Runs test cases on reproducibility across workers and on the exact merge of the batches.
+        """
+
+
+        result_in_process = sim.run_simulation(build_policies(3), hands=600, stack=100, big_blind=2, small_blind=1, batch_size=200, workers=1, seed=3)
+        result_in_pool = sim.run_simulation(build_policies(3), hands=600, stack=100, big_blind=2, small_blind=1, batch_size=200, workers=2, seed=3)
+
+        self.assertEqual(result_in_process.hands, 600)
+        self.assertEqual(get_chip_deltas(result_in_process), get_chip_deltas(result_in_pool))
+        self.assertEqual(sum(get_chip_deltas(result_in_pool)), 0)
+
+        for player_result_in_process, player_result_in_pool in zip(result_in_process.player_results, result_in_pool.player_results):
+            self.assertEqual(player_result_in_process.squared_chip_delta_sum, player_result_in_pool.squared_chip_delta_sum)
+
+
+        # A job smaller than a batch is played in a single batch, in this process
+
+        result = sim.run_simulation(build_policies(3), hands=150, stack=100, big_blind=2, batch_size=200, workers=1, seed=3)
+        self.assertEqual(result.hands, 150)
+        self.assertEqual(sum(get_chip_deltas(result)), 0)
+
+
+    def test_batch_policies(self):
+
+
+        """
+        Runs test cases on the fresh copies of the policies that every batch plays with.
+        """
+
+
+        valid_actions = engines.ValidActions({constants.ACTION_FOLD: (0, 0), constants.ACTION_CALL: (2, 2), constants.ACTION_RAISE: (4, 100)})
+        pickled_policies = pickle.dumps(build_policies(2))
+
+        def get_action_stream(policies: dict[str, sim.Policy], name: str):
+            return [(action.name, action.amount) for action in (policies[name](None, valid_actions, None) for _ in range(50))]
+
+        first_batch_policies = load_batch_policies(pickled_policies, '3:0')
+        second_batch_policies = load_batch_policies(pickled_policies, '3:1')
+
+        # Batches and players do not repeat the same decisions, but the same batch always does
+
+        self.assertNotEqual(get_action_stream(first_batch_policies, 'Player 1'), get_action_stream(second_batch_policies, 'Player 1'))
+        self.assertNotEqual(get_action_stream(second_batch_policies, 'Player 1'), get_action_stream(second_batch_policies, 'Player 2'))
+        self.assertEqual(
+            get_action_stream(load_batch_policies(pickled_policies, '3:1'), 'Player 2'),
+            get_action_stream(load_batch_policies(pickled_policies, '3:1'), 'Player 2'),
+        )
+
+        # Policies without a reseed method are left as they are
+
+        self.assertIs(load_batch_policies(pickle.dumps({'Andy': sim.passive_policy}), '3:0')['Andy'], sim.passive_policy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Defines unit tests on simulate function.
+"""
+
+
+import sys
+sys.path.insert(0, '.')
+
+
+from unittest import main, TestCase
+
+
+from pokerpy import logger, messages, sim
+
+
+def build_policies(count: int):
+    "Builds seeded random policies for a number of players."
+    return {f'Player {index + 1}': sim.random_policy(index) for index in range(count)}
+
+
+class TestSimulate(TestCase):
+
+
+    """
+    Runs unit tests on simulate function.
+    """
+
+
+    def test_invalid_input(self):
+
+
+        """
+        Runs test cases on simulate function with an invalid input.
+        """
+
+
+        with self.assertRaises(TypeError) as cm:
+            sim.simulate([sim.passive_policy, sim.passive_policy], hands=10, stack=100, big_blind=2)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_dict.format(list.__name__))
+
+        with self.assertRaises(ValueError) as cm:
+            sim.simulate({'Andy': sim.passive_policy}, hands=10, stack=100, big_blind=2)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_enough_players.format(2))
+
+        with self.assertRaises(TypeError) as cm:
+            sim.simulate({'Andy': sim.passive_policy, 'Boa': 'Wood'}, hands=10, stack=100, big_blind=2)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_all_callable_objects)
+
+        with self.assertRaises(ValueError) as cm:
+            sim.simulate(build_policies(2), hands=0, stack=100, big_blind=2)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_positive_value.format(0))
+
+        with self.assertRaises(ValueError) as cm:
+            sim.simulate(build_policies(2), hands=10, stack=100, big_blind=2, ante=-1)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_positive_or_zero_value.format(-1))
+
+        with self.assertRaises(ValueError) as cm:
+            sim.simulate(build_policies(2), hands=10, stack=100, big_blind=2, confidence_level=1)
+        self.assertEqual(cm.exception.args[0], messages.msg_not_probability.format(1))
+
+
+    def test_results(self):
+
+
+        """
+        Runs test cases on the aggregated results.
+        """
+
+
+        result = sim.simulate(build_policies(4), hands=400, stack=200, big_blind=2, small_blind=1, ante=1, seed=5)
+
+        self.assertEqual(result.hands, 400)
+        self.assertGreater(result.hands_per_second, 0)
+        self.assertEqual([player_result.name for player_result in result.player_results], list(build_policies(4)))
+        self.assertEqual(sum(player_result.chip_delta for player_result in result.player_results), 0)
+        self.assertTrue(all(player_result.margin_of_error > 0 for player_result in result.player_results))
+
+        Andy = result.get_player_result('Player 1')
+        self.assertAlmostEqual(Andy.bb_per_100, Andy.chip_delta / 400 / 2 * 100)
+        with self.assertRaises(KeyError):
+            result.get_player_result('Wood')
+
+
+        # Passive players never fold, so heads-up the blinds are the only chips at stake preflop
+
+        result = sim.simulate({'Andy': sim.passive_policy, 'Boa': sim.passive_policy}, hands=50, stack=100, big_blind=2, seed=5)
+        self.assertEqual(result.get_player_result('Andy').chip_delta, -result.get_player_result('Boa').chip_delta)
+        self.assertEqual(result.get_player_result('Andy').chip_delta % 2, 0)
+
+
+    def test_determinism_and_reports(self):
+
+
+        """
+        Runs test cases on reproducibility with a seed, on the reports streamed along the way, and on
+        the logger being turned back on.
+        """
+
+
+        first_result = sim.simulate(build_policies(3), hands=300, stack=100, big_blind=2, small_blind=1, seed=9)
+        second_result = sim.simulate(build_policies(3), hands=300, stack=100, big_blind=2, small_blind=1, seed=9)
+        self.assertEqual(
+            [player_result.chip_delta for player_result in first_result.player_results],
+            [player_result.chip_delta for player_result in second_result.player_results],
+        )
+
+        results = list(sim.iter_simulation(build_policies(3), hands=250, stack=100, big_blind=2, small_blind=1, seed=9, report_every=100))
+        self.assertEqual([result.hands for result in results], [100, 200, 250])
+
+        self.assertFalse(logger.is_silent())
+
+
+if __name__ == '__main__':
+    main()